@@ -0,0 +1,357 @@
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pygame
+import settings
+from asset_pack import AssetPack
+from texture_atlas import texture_atlas
+from pcm_cache import PCMCache
+
+# Asset Manager ———————————————————————————————————————————————————————————————————————————————————————
+# —————————————————————————————————————————————————————————————————————————————————————————————————————
+
+def resolve_assets_dir():
+    """
+    Trouve le dossier des ressources, quelle que soit la casse de son nom.
+    
+    Essaie d'abord settings.ASSETS_DIR, puis les variantes "assets" et "ASSETS" à côté
+    de ce dossier et à la racine du projet (le dossier parent de sources).
+    
+    Returns:
+        str: Chemin du dossier des ressources (settings.ASSETS_DIR si aucun n'est trouvé)
+    """
+    project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parent_dir = os.path.dirname(settings.ASSETS_DIR)
+    candidates = [settings.ASSETS_DIR]
+    for name in ("assets", "ASSETS"):
+        candidates.append(os.path.join(parent_dir, name))
+    for name in ("assets", "ASSETS"):
+        candidates.append(os.path.join(project_dir, name))
+    
+    for candidate in candidates:
+        if os.path.isdir(candidate):
+            return candidate
+    return settings.ASSETS_DIR
+
+
+def _decode_image(filepath, scale=None):
+    """
+    Décode une image sur un fil d'exécution secondaire (pygame relâche le GIL pendant le décodage).
+    
+    Args:
+        filepath (str): Chemin du fichier
+        scale (float, optional): Facteur d'échelle appliqué dès le décodage
+    
+    Returns:
+        Surface: Image décodée, pas encore convertie au format de l'affichage
+    """
+    image = pygame.image.load(filepath)
+    if scale is not None:
+        image = pygame.transform.scale(image, (int(image.get_width() * scale), int(image.get_height() * scale)))
+    return image
+
+
+def _decode_sound(filepath, pcm_cache, mixer_format):
+    """
+    Décode un son (ou lit son PCM en cache) sur un fil d'exécution secondaire.
+    
+    Args:
+        filepath (str): Chemin du fichier
+        pcm_cache (PCMCache): Cache des sons décodés, ou None
+        mixer_format (tuple): Format du mixer, ou None s'il n'est pas initialisé
+    
+    Returns:
+        tuple: (mmap du PCM en cache ou None, échantillons décodés ou None)
+    
+    Raises:
+        pygame.error: Si le son est illisible ou si le mixer n'est pas initialisé
+    """
+    if pcm_cache is not None and mixer_format is not None:
+        return pcm_cache.read(filepath, mixer_format)
+    return None, pygame.mixer.Sound(filepath).get_raw()
+
+
+class AssetManager:
+    """
+    Gestionnaire central des images du jeu.
+    
+    Chaque fichier n'est lu qu'une seule fois puis converti au format de l'affichage ;
+    les versions redimensionnées sont mémorisées avec la clé (fichier, échelle ou taille).
+    Les images les moins récemment utilisées sont évincées au-delà du budget mémoire
+    (les objets qui les référencent encore les conservent).
+    """
+    def __init__(self, assets_dir=None, max_bytes=None):
+        """
+        Initialise le gestionnaire.
+        
+        Args:
+            assets_dir (str, optional): Dossier des ressources (résolu automatiquement si None)
+            max_bytes (int, optional): Mémoire maximale des images en cache (ASSET_CACHE_BYTES si None)
+        """
+        self.assets_dir = assets_dir if assets_dir is not None else resolve_assets_dir()
+        self.max_bytes = max_bytes if max_bytes is not None else settings.ASSET_CACHE_BYTES
+        self.images = OrderedDict()  # (fichier, échelle, taille) -> surface, de la plus ancienne à la plus récente
+        self.sounds = {}  # fichier -> Sound partagé
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        
+        # Paquet d'images pré-redimensionnées, utilisé s'il correspond aux paramètres actuels
+        self.pack = None
+        if settings.ASSET_PACK_ENABLED:
+            self.pack = AssetPack.open(self.get_path(settings.ASSET_PACK_FILE), self.assets_dir)
+        
+        # Cache des effets sonores déjà décodés, à côté des ressources
+        self.pcm_cache = None
+        if settings.SOUND_PCM_CACHE_ENABLED:
+            self.pcm_cache = PCMCache(self.get_path(settings.SOUND_PCM_CACHE_DIR))
+    
+    def get_path(self, filename):
+        """
+        Retourne le chemin d'un fichier du dossier des ressources.
+        
+        Args:
+            filename (str): Nom du fichier
+        
+        Returns:
+            str: Chemin du fichier
+        """
+        return os.path.join(self.assets_dir, filename)
+    
+    def load_image(self, filename, scale=None, size=None, atlas=False):
+        """
+        Retourne une image, éventuellement redimensionnée, en ne la chargeant qu'une seule fois.
+        
+        Args:
+            filename (str): Nom du fichier dans le dossier des ressources
+            scale (float, optional): Facteur d'échelle appliqué à la taille d'origine
+            size (tuple, optional): Taille exacte (largeur, hauteur), prioritaire sur scale
+            atlas (bool): Range l'image dans l'atlas de textures partagé (petites images dessinées souvent)
+        
+        Returns:
+            Surface: Image partagée (ne pas la modifier)
+        
+        Raises:
+            pygame.error: Si le fichier est introuvable ou illisible
+        """
+        key = self.make_key(filename, scale, size)
+        image = self.images.get(key)
+        if image is not None:
+            self.images.move_to_end(key)
+            self.hits += 1
+            if atlas and image.get_parent() is None:
+                image = self._add_to_atlas(key, image)
+            return image
+        
+        self.misses += 1
+        packed = self.pack.get_image(key) if self.pack is not None else None
+        if packed is not None:
+            # Pixels déjà redimensionnés dans le paquet : ni décodage ni mise à l'échelle
+            image = self.convert(packed)
+        elif key[1] is None and key[2] is None:
+            image = self._load_file(filename)
+        else:
+            source = self.load_image(filename)
+            if size is None:
+                size = (int(source.get_width() * scale), int(source.get_height() * scale))
+            image = pygame.transform.scale(source, size)
+        
+        self._store(key, image)
+        if atlas:
+            image = self._add_to_atlas(key, image)
+        return image
+    
+    def _add_to_atlas(self, key, image):
+        """
+        Copie une image du cache dans l'atlas de textures et la remplace par sa sous-surface.
+        
+        Args:
+            key (tuple): Clé de l'image
+            image (Surface): Image à ranger
+        
+        Returns:
+            Surface: Sous-surface de l'atlas (ou l'image d'origine si l'atlas est désactivé)
+        """
+        if not settings.TEXTURE_ATLAS_ENABLED:
+            return image
+        atlas_image = texture_atlas.add(key, image)
+        if key in self.images:
+            # Même taille : le budget mémoire du cache ne change pas
+            self.images[key] = atlas_image
+        return atlas_image
+    
+    @staticmethod
+    def make_key(filename, scale=None, size=None):
+        """
+        Retourne la clé de cache d'une variante d'image.
+        
+        Args:
+            filename (str): Nom du fichier
+            scale (float, optional): Facteur d'échelle
+            size (tuple, optional): Taille exacte, prioritaire sur scale
+        
+        Returns:
+            tuple: Clé (fichier, échelle, taille)
+        """
+        if size is not None:
+            return (filename, None, tuple(size))
+        if scale is not None and scale != 1.0:
+            return (filename, scale, None)
+        return (filename, None, None)
+    
+    def preload(self, images=(), sounds=(), progress=None, workers=None):
+        """
+        Décode des images et des sons en parallèle avant leur première utilisation.
+        
+        Les fils d'exécution secondaires lisent et décodent les images et les sons (ou
+        lisent leur PCM en cache) ; seules la conversion au format de l'affichage et la
+        création des objets Sound à partir des échantillons déjà décodés restent sur le
+        fil principal, dans l'ordre où les décodages se terminent.
+        
+        Args:
+            images (iterable): Tuples (fichier, échelle) des images à charger, échelle valant
+                None pour la taille d'origine
+            sounds (iterable): Noms des effets sonores à charger
+            progress (callable, optional): Appelée avec (terminés, total, fichier) après chaque fichier
+            workers (int, optional): Nombre de fils d'exécution (ASSET_LOADER_THREADS si None)
+        """
+        # Les images du paquet sont lues sans décodage au moment de leur utilisation
+        images = [
+            (filename, scale) for filename, scale in images
+            if self.make_key(filename, scale) not in self.images
+            and not (self.pack is not None and self.pack.contains(self.make_key(filename, scale)))
+        ]
+        sounds = [filename for filename in sounds if filename not in self.sounds]
+        total = len(images) + len(sounds)
+        if total == 0:
+            return
+        
+        done = 0
+        mixer_format = pygame.mixer.get_init()
+        workers = workers if workers is not None else settings.ASSET_LOADER_THREADS
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            jobs = {}
+            for filename, scale in images:
+                key = self.make_key(filename, scale)
+                jobs[executor.submit(_decode_image, self.get_path(filename), key[1])] = (filename, key)
+            for filename in sounds:
+                job = executor.submit(_decode_sound, self.get_path(filename), self.pcm_cache, mixer_format)
+                jobs[job] = (filename, None)
+            
+            for job in as_completed(jobs):
+                filename, key = jobs[job]
+                try:
+                    if key is None:
+                        self.sounds[filename] = self._create_sound(*job.result())
+                    else:
+                        self.misses += 1
+                        self._store(key, self.convert(job.result()))
+                except (OSError, pygame.error) as e:
+                    # Le fichier sera chargé (ou signalé) normalement lors de sa première utilisation
+                    print(f"Avertissement: Impossible de précharger '{filename}': {e}")
+                
+                done += 1
+                if progress is not None:
+                    progress(done, total, filename)
+    
+    def get_sound(self, filename):
+        """
+        Retourne un effet sonore, en ne le décodant qu'une seule fois.
+        
+        Args:
+            filename (str): Nom du fichier dans le dossier des ressources
+        
+        Returns:
+            Sound: Son partagé (seul son volume peut être modifié)
+        
+        Raises:
+            pygame.error: Si le fichier est illisible ou si le mixer n'est pas initialisé
+        """
+        sound = self.sounds.get(filename)
+        if sound is None:
+            if self.pcm_cache is not None:
+                sound = self.pcm_cache.load_sound(self.get_path(filename))
+            else:
+                sound = pygame.mixer.Sound(self.get_path(filename))
+            self.sounds[filename] = sound
+        return sound
+    
+    def _create_sound(self, pcm, data):
+        """
+        Crée sur le fil principal l'objet Sound d'un son décodé par un fil d'exécution secondaire.
+        
+        Args:
+            pcm (mmap): PCM en cache projeté en mémoire, ou None
+            data (bytes): Échantillons décodés, utilisés si pcm vaut None
+        
+        Returns:
+            Sound: Son prêt à jouer
+        """
+        if self.pcm_cache is not None:
+            return self.pcm_cache.create_sound(pcm, data)
+        return pygame.mixer.Sound(buffer=data)
+    
+    def _load_file(self, filename):
+        """
+        Lit une image depuis le disque et la convertit au format de l'affichage.
+        
+        Args:
+            filename (str): Nom du fichier
+        
+        Returns:
+            Surface: Image convertie (si l'affichage est déjà créé)
+        """
+        filepath = self.get_path(filename)
+        if not os.path.exists(filepath):
+            raise pygame.error(f"Fichier image '{filepath}' introuvable")
+        return self.convert(pygame.image.load(filepath))
+    
+    @staticmethod
+    def convert(image):
+        """
+        Convertit une image au format de l'affichage pour des blits sans conversion de pixels.
+        
+        Args:
+            image (Surface): Image à convertir
+        
+        Returns:
+            Surface: Image convertie, ou l'image d'origine si aucun affichage n'existe encore
+        """
+        if pygame.display.get_surface() is None:
+            return image
+        return image.convert_alpha()
+    
+    def _store(self, key, image):
+        """
+        Ajoute une image au cache puis évince les plus anciennes au-delà du budget mémoire.
+        
+        Args:
+            key (tuple): Clé de l'image
+            image (Surface): Image à conserver
+        """
+        self.images[key] = image
+        self.bytes += self._byte_size(image)
+        while self.bytes > self.max_bytes and len(self.images) > 1:
+            _, evicted = self.images.popitem(last=False)
+            self.bytes -= self._byte_size(evicted)
+    
+    @staticmethod
+    def _byte_size(surface):
+        """Retourne la mémoire occupée par les pixels d'une surface."""
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+# Instance partagée, créée à la première utilisation
+_asset_manager = None
+
+def get_asset_manager():
+    """
+    Retourne le gestionnaire de ressources partagé par tout le jeu.
+    
+    Returns:
+        AssetManager: Gestionnaire de ressources
+    """
+    global _asset_manager
+    if _asset_manager is None:
+        _asset_manager = AssetManager()
+    return _asset_manager
@@ -0,0 +1,320 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import pygame
+import settings
+
+# Asset Pack ——————————————————————————————————————————————————————————————————————————————————————————
+# —————————————————————————————————————————————————————————————————————————————————————————————————————
+
+PACK_MAGIC = b"PXPK"
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct("<4sII")  # Signature, version, taille de l'index
+PACK_ALIGNMENT = 16  # Alignement des tampons de pixels dans le fichier
+
+# Images utilisées à leur taille d'origine (les menus les redimensionnent ensuite eux-mêmes)
+UNSCALED_IMAGES = (
+    "title.png", "PlayBtn.png", "PlayClick.png", "OptBtn.png", "OptClick.png",
+    "ExitBtn.png", "ExitClick.png",
+    "musique-oui.png", "musique-non.png", "effets-oui.png", "effets-non.png"
+)
+
+
+def pack_key(key):
+    """
+    Convertit une clé d'image (fichier, échelle, taille) en chaîne pour l'index du paquet.
+    
+    Args:
+        key (tuple): Clé de l'image
+    
+    Returns:
+        str: Clé sérialisée
+    """
+    return json.dumps(key)
+
+
+def fit_size(source_size, size):
+    """
+    Calcule la taille d'une image redimensionnée pour que son plus grand côté mesure size.
+    
+    Args:
+        source_size (tuple): Taille d'origine (largeur, hauteur)
+        size (int): Taille du plus grand côté
+    
+    Returns:
+        tuple: Taille redimensionnée
+    """
+    scale_factor = size / max(source_size)
+    return (int(source_size[0] * scale_factor), int(source_size[1] * scale_factor))
+
+
+def get_scaled_images():
+    """
+    Liste les images redimensionnées par un facteur de settings.py.
+    
+    Returns:
+        list: Tuples (fichier, échelle)
+    """
+    images = [
+        ("fullborder.png", settings.BORDER_SCALE),
+        ("name.png", settings.NAME_SCALE),
+        ("Crown.gif", settings.CROWN_SCALE),
+        ("musique.png", settings.MUSIC_LABEL_SCALE),
+        ("effetssonnores.png", settings.SOUND_EFFECTS_LABEL_SCALE),
+        ("ExitIcon.png", settings.GAME_EXIT_ICON_SCALE),
+        ("base.png", settings.HEART_BASE_SCALE),
+        (settings.CURSOR_NORMAL, settings.CURSOR_NORMAL_SCALE),
+        (settings.CURSOR_HOVER, settings.CURSOR_HOVER_SCALE),
+        (settings.CURSOR_CLICK, settings.CURSOR_CLICK_SCALE),
+        (settings.CURSOR_ZOOM, settings.CURSOR_ZOOM_SCALE),
+        (settings.CURSOR_PAINT, settings.CURSOR_PAINT_SCALE),
+    ]
+    for i in range(1, 6):
+        images.append((f"heart_{i}.png", settings.HEART_SCALE))
+    return images
+
+
+def get_image_files(sprite_files):
+    """
+    Liste les fichiers de toutes les images chargées par les menus et le jeu.
+    
+    Args:
+        sprite_files (iterable): Fichiers des sprites de pixels du jeu
+    
+    Returns:
+        list: Noms des fichiers, triés
+    """
+    filenames = set(UNSCALED_IMAGES) | set(sprite_files) | {name for name, _ in get_scaled_images()}
+    filenames.add("ExitIconClick.png")
+    return sorted(filenames)
+
+
+def get_preload_images(sprite_files):
+    """
+    Liste les variantes d'images à décoder pendant l'écran de chargement.
+    
+    Les images affichées uniquement redimensionnées sont préchargées à leur taille
+    d'affichage : leur version d'origine (les cœurs mesurent 1512×1512) n'entre jamais
+    dans le cache.
+    
+    Args:
+        sprite_files (iterable): Fichiers des sprites de pixels du jeu
+    
+    Returns:
+        list: Tuples (fichier, échelle), échelle valant None pour la taille d'origine
+    """
+    scaled_images = get_scaled_images()
+    scaled_files = {name for name, _ in scaled_images}
+    images = [(filename, None) for filename in get_image_files(sprite_files) if filename not in scaled_files]
+    return images + scaled_images
+
+
+def compute_pack_hash(assets_dir, sprite_files):
+    """
+    Calcule l'empreinte des paramètres et des fichiers sources dont dépend le paquet.
+    
+    Le paquet est reconstruit dès qu'un facteur d'échelle, une taille de pixel ou un
+    fichier source (taille ou date de modification) change.
+    
+    Args:
+        assets_dir (str): Dossier des ressources
+        sprite_files (iterable): Fichiers des sprites de pixels du jeu
+    
+    Returns:
+        str: Empreinte hexadécimale
+    """
+    sprite_files = sorted(sprite_files)
+    scaled_images = get_scaled_images()
+    
+    sources = []
+    for filename in get_image_files(sprite_files):
+        try:
+            stat = os.stat(os.path.join(assets_dir, filename))
+            sources.append([filename, stat.st_size, stat.st_mtime_ns])
+        except OSError:
+            sources.append([filename, None, None])
+    
+    description = {
+        "version": PACK_VERSION,
+        "unscaled": list(UNSCALED_IMAGES),
+        "scaled": scaled_images,
+        "sprites": sprite_files,
+        "sprite_sizes": [settings.GAME_PIXEL_MIN_SIZE, settings.GAME_PIXEL_MAX_SIZE],
+        "sources": sources,
+    }
+    return hashlib.sha1(json.dumps(description).encode("utf-8")).hexdigest()
+
+
+def bake_asset_pack(manager, sprite_files, path=None):
+    """
+    Écrit toutes les images du jeu, déjà redimensionnées, dans un seul fichier binaire.
+    
+    Le fichier contient un en-tête, un index JSON (empreinte des paramètres, clé, position
+    et taille de chaque image) puis les pixels RGBA bruts, lisibles sans décodage.
+    
+    Args:
+        manager (AssetManager): Gestionnaire utilisé pour charger et redimensionner les images
+        sprite_files (iterable): Fichiers des sprites de pixels du jeu
+        path (str, optional): Chemin du paquet (celui du gestionnaire si None)
+    
+    Returns:
+        int: Nombre d'images écrites
+    """
+    path = path if path is not None else manager.get_path(settings.ASSET_PACK_FILE)
+    sprite_files = sorted(sprite_files)
+    
+    # Liste toutes les variantes utilisées par les menus et le jeu
+    keys = [manager.make_key(filename) for filename in UNSCALED_IMAGES + tuple(sprite_files)]
+    keys += [manager.make_key(filename, scale=scale) for filename, scale in get_scaled_images()]
+    for filename in sprite_files:
+        source_size = manager.load_image(filename).get_size()
+        for size in range(settings.GAME_PIXEL_MIN_SIZE, settings.GAME_PIXEL_MAX_SIZE + 1):
+            keys.append(manager.make_key(filename, size=fit_size(source_size, size)))
+    exit_icon = manager.load_image("ExitIcon.png", scale=settings.GAME_EXIT_ICON_SCALE)
+    keys.append(manager.make_key("ExitIconClick.png", size=exit_icon.get_size()))
+    
+    entries = {}
+    buffers = []
+    offset = 0
+    for key in keys:
+        if pack_key(key) in entries:
+            continue
+        filename, scale, size = key
+        try:
+            image = manager.load_image(filename, scale=scale, size=size)
+        except pygame.error as e:
+            print(f"Avertissement: '{filename}' ne sera pas ajouté au paquet de ressources: {e}")
+            continue
+        
+        data = pygame.image.tobytes(image, "RGBA")
+        padding = -offset % PACK_ALIGNMENT
+        buffers.append(b"\0" * padding)
+        offset += padding
+        entries[pack_key(key)] = [offset, image.get_width(), image.get_height()]
+        buffers.append(data)
+        offset += len(data)
+    
+    index = json.dumps({
+        "hash": compute_pack_hash(manager.assets_dir, sprite_files),
+        "sprites": sprite_files,
+        "entries": entries,
+    }).encode("utf-8")
+    
+    # Écrit dans un fichier temporaire puis le renomme pour ne jamais laisser un paquet incomplet
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as pack_file:
+        pack_file.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index)))
+        pack_file.write(index)
+        data_start = PACK_HEADER.size + len(index)
+        pack_file.write(b"\0" * (-data_start % PACK_ALIGNMENT))
+        for buffer in buffers:
+            pack_file.write(buffer)
+    os.replace(temp_path, path)
+    return len(entries)
+
+
+class AssetPack:
+    """
+    Paquet d'images pré-redimensionnées, lu directement depuis un fichier projeté en mémoire.
+    
+    Les surfaces sont créées avec pygame.image.frombuffer sur les pixels du fichier, sans
+    décodage PNG ni redimensionnement.
+    """
+    def __init__(self, path, pack_file, data, entries, data_start):
+        """
+        Initialise le paquet (utiliser AssetPack.open).
+        
+        Args:
+            path (str): Chemin du paquet
+            pack_file (file): Fichier ouvert
+            data (mmap): Projection en mémoire du fichier
+            entries (dict): Clé sérialisée -> (position, largeur, hauteur)
+            data_start (int): Position du début des pixels dans le fichier
+        """
+        self.path = path
+        self.pack_file = pack_file
+        self.data = data
+        self.view = memoryview(data)
+        self.entries = entries
+        self.data_start = data_start
+    
+    @classmethod
+    def open(cls, path, assets_dir):
+        """
+        Ouvre un paquet s'il existe et correspond aux paramètres et aux fichiers actuels.
+        
+        Args:
+            path (str): Chemin du paquet
+            assets_dir (str): Dossier des ressources
+        
+        Returns:
+            AssetPack: Paquet ouvert, ou None s'il est absent, invalide ou périmé
+        """
+        if not os.path.exists(path):
+            return None
+        
+        pack_file = None
+        try:
+            pack_file = open(path, "rb")
+            data = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, index_size = PACK_HEADER.unpack_from(data, 0)
+            if magic != PACK_MAGIC or version != PACK_VERSION:
+                data.close()
+                pack_file.close()
+                return None
+            
+            index = json.loads(bytes(data[PACK_HEADER.size:PACK_HEADER.size + index_size]))
+            if index["hash"] != compute_pack_hash(assets_dir, index["sprites"]):
+                # Paramètres ou fichiers sources modifiés : le paquet doit être reconstruit
+                data.close()
+                pack_file.close()
+                return None
+            
+            data_start = PACK_HEADER.size + index_size
+            data_start += -data_start % PACK_ALIGNMENT
+            return cls(path, pack_file, data, index["entries"], data_start)
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            print(f"Avertissement: Paquet de ressources '{path}' illisible: {e}")
+            if pack_file is not None:
+                pack_file.close()
+            return None
+    
+    def contains(self, key):
+        """
+        Indique si une variante d'image se trouve dans le paquet.
+        
+        Args:
+            key (tuple): Clé de l'image (fichier, échelle, taille)
+        
+        Returns:
+            bool: True si l'image est dans le paquet
+        """
+        return pack_key(key) in self.entries
+    
+    def get_image(self, key):
+        """
+        Crée une surface à partir des pixels d'une image du paquet.
+        
+        Args:
+            key (tuple): Clé de l'image (fichier, échelle, taille)
+        
+        Returns:
+            Surface: Image qui partage la mémoire du paquet, ou None si elle n'y est pas
+        """
+        entry = self.entries.get(pack_key(key))
+        if entry is None:
+            return None
+        offset, width, height = entry
+        start = self.data_start + offset
+        return pygame.image.frombuffer(self.view[start:start + width * height * 4], (width, height), "RGBA")
+
+
+if __name__ == "__main__":
+    # Construction manuelle du paquet : python asset_pack.py
+    from asset_manager import AssetManager
+    from game import GamePixel
+    manager = AssetManager()
+    count = bake_asset_pack(manager, GamePixel.IMAGE_FILES.values())
+    print(f"Paquet de ressources écrit: {manager.get_path(settings.ASSET_PACK_FILE)} ({count} images)")
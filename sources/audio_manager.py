@@ -0,0 +1,161 @@
+import time
+import pygame
+import settings
+
+# Audio Manager ———————————————————————————————————————————————————————————————————————————————————————
+# —————————————————————————————————————————————————————————————————————————————————————————————————————
+
+class AudioManager:
+    """
+    Répartit les effets sonores sur des canaux réservés par catégorie.
+    
+    Chaque catégorie (interface, explosions, perte de vie, jingles) dispose de ses propres
+    canaux et d'un nombre maximal de voix simultanées : une rafale d'explosions ne peut plus
+    occuper tous les canaux et couper les autres sons. Un même son demandé plusieurs fois
+    dans la même image n'est joué qu'une fois, et au-delà de la limite de voix la voix la
+    plus ancienne de la catégorie est remplacée.
+    """
+    def __init__(self, categories):
+        """
+        Initialise le gestionnaire (les canaux sont attribués par setup, une fois le mixer initialisé).
+        
+        Args:
+            categories (dict): Catégorie -> (canaux réservés, voix simultanées maximales)
+        """
+        self.categories = categories
+        self.channels = {}  # catégorie -> liste de canaux réservés
+        self.started = {}  # canal -> instant de début de la lecture (ms)
+        self.last_played = {}  # (catégorie, son) -> instant de la dernière lecture (ms)
+        self.profile = None
+        self.coalesced = 0
+        self.stolen = 0
+        self.latencies = []  # Durées mesurées des appels de lecture (secondes) en mode mesure
+    
+    def pre_init(self, profile_name):
+        """
+        Prépare le mixer avec un profil de latence (à appeler avant pygame.init).
+        
+        Args:
+            profile_name (str): Nom du profil dans AUDIO_PROFILES
+        """
+        profile = settings.AUDIO_PROFILES.get(profile_name)
+        if profile is None:
+            print(f"Avertissement: Profil audio '{profile_name}' inconnu, paramètres par défaut du mixer utilisés.")
+            return
+        self.profile = profile
+        pygame.mixer.pre_init(**profile)
+    
+    def setup(self):
+        """Réserve les canaux de chaque catégorie (le mixer doit être initialisé)."""
+        if pygame.mixer.get_init() is None:
+            return
+        
+        reserved = sum(count for count, _ in self.categories.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved + 8))
+        pygame.mixer.set_reserved(reserved)
+        
+        index = 0
+        for category, (count, _) in self.categories.items():
+            self.channels[category] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            index += count
+    
+    def play(self, sound, category):
+        """
+        Joue un son sur un canal de sa catégorie.
+        
+        Args:
+            sound (Sound): Son à jouer
+            category (str): Catégorie de canaux
+        
+        Returns:
+            Channel: Canal utilisé, ou None si le son a été fusionné avec une lecture identique
+        """
+        if sound is None:
+            return None
+        requested = time.perf_counter()
+        channels = self.channels.get(category)
+        if not channels:
+            # Mixer non préparé ou catégorie inconnue : lecture sur un canal libre quelconque
+            return sound.play()
+        
+        # Le même son déjà lancé dans cette image : une seule lecture suffit
+        now = pygame.time.get_ticks()
+        key = (category, sound)
+        last = self.last_played.get(key)
+        if last is not None and now - last < settings.AUDIO_COALESCE_MS:
+            self.coalesced += 1
+            return None
+        self.last_played[key] = now
+        
+        channel = self._find_channel(category, channels)
+        channel.play(sound)
+        self.started[channel] = now
+        
+        if settings.AUDIO_MEASURE_LATENCY:
+            self._record_latency(requested)
+        return channel
+    
+    def _find_channel(self, category, channels):
+        """
+        Choisit un canal libre de la catégorie, ou la voix la plus ancienne si la limite est atteinte.
+        
+        Args:
+            category (str): Catégorie de canaux
+            channels (list): Canaux réservés de la catégorie
+        
+        Returns:
+            Channel: Canal à utiliser
+        """
+        busy = [channel for channel in channels if channel.get_busy()]
+        max_voices = self.categories[category][1]
+        if len(busy) < max_voices:
+            for channel in channels:
+                if not channel.get_busy():
+                    return channel
+        
+        # Limite de voix atteinte : remplace la voix la plus ancienne
+        self.stolen += 1
+        candidates = busy if busy else channels
+        return min(candidates, key=lambda channel: self.started.get(channel, 0))
+    
+    def _record_latency(self, requested):
+        """
+        Enregistre la durée d'un appel de lecture et affiche périodiquement une estimation de la latence.
+        
+        pygame n'expose ni l'horloge du périphérique audio ni l'instant où le son est réellement
+        mixé (le canal est marqué actif dès l'appel à play). Seule la durée de l'appel est
+        mesurée (attente du verrou audio comprise) ; le délai du tampon est déduit du profil
+        de latence, si bien que le total affiché est une estimation et non une mesure.
+        
+        Args:
+            requested (float): Instant de la demande (time.perf_counter)
+        """
+        self.latencies.append(time.perf_counter() - requested)
+        if len(self.latencies) < settings.AUDIO_LATENCY_REPORT_INTERVAL:
+            return
+        
+        buffer_ms = self.get_buffer_ms()
+        call_ms = [latency * 1000 for latency in self.latencies]
+        average = sum(call_ms) / len(call_ms)
+        print(
+            f"Latence audio estimée: appel de lecture {average:.2f} ms en moyenne (max {max(call_ms):.2f} ms, mesuré), "
+            f"tampon {buffer_ms:.1f} ms (d'après le profil), total ~{average + buffer_ms:.1f} ms "
+            f"({self.coalesced} fusionnés, {self.stolen} voix remplacées)"
+        )
+        self.latencies.clear()
+    
+    def get_buffer_ms(self):
+        """
+        Retourne la durée d'un tampon du mixer selon le profil utilisé.
+        
+        Returns:
+            float: Durée en millisecondes (0 si inconnue)
+        """
+        mixer_format = pygame.mixer.get_init()
+        if self.profile is None or mixer_format is None:
+            return 0.0
+        return self.profile["buffer"] * 1000 / mixer_format[0]
+
+
+# Gestionnaire partagé par les menus et le jeu
+audio_manager = AudioManager(settings.AUDIO_CHANNEL_CATEGORIES)
@@ -1,7 +1,6 @@
 import pygame
-import os
+from asset_manager import get_asset_manager
 from settings import (
-    ASSETS_DIR, 
     CURSOR_NORMAL, CURSOR_HOVER, CURSOR_CLICK, CURSOR_ZOOM, CURSOR_PAINT, CURSOR_VISIBLE,
     CURSOR_NORMAL_SCALE, CURSOR_HOVER_SCALE, CURSOR_CLICK_SCALE, CURSOR_ZOOM_SCALE, CURSOR_PAINT_SCALE
 )
@@ -49,17 +48,9 @@ class CursorManager:
         Returns:
             Une surface pygame contenant l'image du curseur redimensionnée
         """
-        image_path = os.path.join(ASSETS_DIR, image_name)
         try:
-            image = pygame.image.load(image_path).convert_alpha()
-            
-            # Applique la mise à l'échelle si nécessaire
-            if scale != 1.0:
-                orig_size = image.get_size()
-                new_size = (int(orig_size[0] * scale), int(orig_size[1] * scale))
-                image = pygame.transform.scale(image, new_size)
-                
-            return image
+            # Charge l'image (une seule fois) et applique la mise à l'échelle si nécessaire
+            return get_asset_manager().load_image(image_name, scale=scale, atlas=True)
         except pygame.error as e:
             print(f"Erreur lors du chargement de l'image du curseur {image_name}: {e}")
             # Crée un curseur de secours (petit carré blanc)
@@ -98,14 +89,29 @@ class CursorManager:
         else:
             self.current_cursor = self.cursor_normal
     
+    def get_rect(self):
+        """
+        Retourne la zone occupée par le curseur à la position actuelle de la souris.
+        
+        Returns:
+            Rect: Zone du curseur, ou None si le curseur n'est pas dessiné
+        """
+        if not self.mouse_in_window:
+            return None
+        return self.current_cursor.get_rect(topleft=pygame.mouse.get_pos())
+    
     def draw(self, surface):
         """
         Dessine le curseur actuel à la position de la souris.
         
         Args:
             surface: La surface pygame sur laquelle dessiner le curseur
+            
+        Returns:
+            Rect: Zone modifiée, ou None si le curseur n'est pas dessiné
         """
         # Dessine le curseur uniquement si la souris est dans la fenêtre
         if self.mouse_in_window:
             mouse_pos = pygame.mouse.get_pos()
-            surface.blit(self.current_cursor, mouse_pos) 
\ No newline at end of file
+            return surface.blit(self.current_cursor, mouse_pos)
+        return None 
\ No newline at end of file
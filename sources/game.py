@@ -7,6 +7,18 @@ import settings
 from cursor_manager import CursorManager
 from pixel_animation import PixelAnimation
 from transition import TransitionAnimation
+from pixel_engine import PixelEngine, EngineField
+from renderer import blit_batch, DirtyRectRenderer
+from spatial_hash import SpatialHash
+from impact_scheduler import ImpactScheduler
+from text_cache import CachedText
+from screen_flash import overlay_compositor
+from asset_manager import get_asset_manager
+from asset_pack import fit_size
+from texture_atlas import share_pixels
+from sound_bank import sound_bank
+from audio_manager import audio_manager
+from music_player import music_player
 
 # Logique du Jeu —————————————————————————————————————————————————————————————————————————————————————————
 # ————————————————————————————————————————————————————————————————————————————————————————————————————————
@@ -26,7 +38,7 @@ def load_highscore():
         except OSError as e:
             print(f"Erreur lors de la création du dossier highscore: {e}")
             return 0
-
+    
     highscore_path = os.path.join(settings.HIGHSCORE_DIR, settings.HIGHSCORE_FILE)
     try:
         if os.path.exists(highscore_path):
@@ -51,7 +63,7 @@ def save_highscore(score):
         except OSError as e:
             print(f"Erreur lors de la création du dossier highscore: {e}")
             return
-
+    
     highscore_path = os.path.join(settings.HIGHSCORE_DIR, settings.HIGHSCORE_FILE)
     try:
         with open(highscore_path, 'w') as f:
@@ -61,6 +73,27 @@ def save_highscore(score):
 
 class GamePixel:
     """Représente un pixel de jeu qui se déplace vers le cœur."""
+    # Fichiers d'image pour chaque type de pixel
+    IMAGE_FILES = {
+        "white": "whitepx.png",
+        "red": "redpx.png",
+        "green": "greenpx.png",
+        "orange": "orangepx.png"
+    }
+    
+    # Couleurs des carrés de secours si l'image ne peut pas être chargée
+    FALLBACK_COLORS = {
+        "white": (255, 255, 255),
+        "red": (255, 0, 0),
+        "green": (0, 255, 0),
+        "orange": (255, 165, 0)
+    }
+    
+    # Cache partagé par tout le processus : (type, taille) -> sprite redimensionné
+    _sprite_cache = {}
+    _alpha_ramps = {}  # (type, taille) -> sprites pré-calculés par niveau d'opacité
+    _mask_cache = {}  # (type, taille) -> masque de collision du sprite
+    
     def __init__(self, x, y, angle, size, pixel_type="white"):
         """
         Initialise un pixel de jeu.
@@ -95,69 +128,143 @@ class GamePixel:
         self.will_damage_heart = False
         self.will_apply_powerup = False
         
-        # Charge l'image appropriée en fonction du type
+        # Récupère l'image appropriée en fonction du type depuis le cache partagé
         self.load_image()
         
     def load_image(self):
-        """Charge l'image appropriée pour ce type de pixel."""
-        filename = ""
-        if self.type == "white":
-            filename = "whitepx.png"
-        elif self.type == "red":
-            filename = "redpx.png"
-        elif self.type == "green":
-            filename = "greenpx.png"
-        elif self.type == "orange":
-            filename = "orangepx.png"
+        """Récupère le sprite partagé correspondant au type et à la taille de ce pixel."""
+        # Le sprite est partagé entre tous les pixels de même type et de même taille :
+        # il ne doit jamais être modifié directement
+        self.original_image = GamePixel.get_sprite(self.type, self.size)
+        self.rect = self.original_image.get_rect(center=(self.x, self.y))
+    
+    @property
+    def image(self):
+        """Sprite partagé correspondant à l'opacité actuelle du pixel (aucune copie)."""
+        if self.is_blinking:
+            return GamePixel.get_faded_sprite(self.type, self.size, 255 if self.is_visible else 0)
+        return GamePixel.get_faded_sprite(self.type, self.size, self.alpha)
+    
+    @property
+    def mask(self):
+        """Masque de collision partagé du sprite de ce pixel."""
+        return GamePixel.get_sprite_mask(self.type, self.size)
+    
+    @classmethod
+    def get_sprite(cls, pixel_type, size):
+        """
+        Retourne le sprite redimensionné pour un type et une taille de pixel, en le chargeant au besoin.
+        
+        Args:
+            pixel_type (str): Type de pixel - "white", "red", "green", ou "orange"
+            size (int): Taille du pixel
+            
+        Returns:
+            Surface: Sprite partagé (ne pas modifier)
+        """
+        key = (pixel_type, size)
+        sprite = cls._sprite_cache.get(key)
+        if sprite is None:
+            sprite = cls._load_sprite(pixel_type, size)
+            cls._sprite_cache[key] = sprite
+        return sprite
+    
+    @classmethod
+    def get_faded_sprite(cls, pixel_type, size, alpha):
+        """
+        Retourne le sprite d'un pixel avec l'opacité demandée, quantifiée sur GAME_PIXEL_ALPHA_STEPS niveaux.
+        
+        Les niveaux de la rampe d'opacité sont créés à la première demande puis partagés.
+        
+        Args:
+            pixel_type (str): Type de pixel
+            size (int): Taille du pixel
+            alpha (int): Opacité souhaitée (0-255)
+            
+        Returns:
+            Surface: Sprite partagé (ne pas modifier)
+        """
+        if alpha >= 255:
+            return cls.get_sprite(pixel_type, size)
+        
+        steps = settings.GAME_PIXEL_ALPHA_STEPS
+        key = (pixel_type, size)
+        ramp = cls._alpha_ramps.get(key)
+        if ramp is None:
+            ramp = [None] * steps
+            cls._alpha_ramps[key] = ramp
+        
+        level = max(0, alpha) * steps // 255
+        sprite = ramp[level]
+        if sprite is None:
+            # Nouvelle surface sur les mêmes pixels (atlas) : seule l'opacité de surface diffère
+            sprite = share_pixels(cls.get_sprite(pixel_type, size))
+            sprite.set_alpha(level * 255 // steps)
+            ramp[level] = sprite
+        return sprite
+    
+    @classmethod
+    def get_sprite_mask(cls, pixel_type, size):
+        """
+        Retourne le masque de collision d'un sprite, calculé une seule fois par sprite en cache.
+        
+        Args:
+            pixel_type (str): Type de pixel
+            size (int): Taille du pixel
+            
+        Returns:
+            Mask: Masque partagé (ne pas modifier)
+        """
+        key = (pixel_type, size)
+        mask = cls._mask_cache.get(key)
+        if mask is None:
+            mask = pygame.mask.from_surface(cls.get_sprite(pixel_type, size))
+            cls._mask_cache[key] = mask
+        return mask
+    
+    @classmethod
+    def preload_sprites(cls):
+        """Pré-charge les sprites (et leurs masques si nécessaire) de tous les types pour toutes les tailles possibles."""
+        for pixel_type in cls.IMAGE_FILES:
+            for size in range(settings.GAME_PIXEL_MIN_SIZE, settings.GAME_PIXEL_MAX_SIZE + 1):
+                cls.get_sprite(pixel_type, size)
+                if settings.PIXEL_PERFECT_COLLISION:
+                    cls.get_sprite_mask(pixel_type, size)
+    
+    @classmethod
+    def _load_sprite(cls, pixel_type, size):
+        """
+        Charge et redimensionne le sprite d'un type de pixel depuis le disque.
+        
+        Args:
+            pixel_type (str): Type de pixel
+            size (int): Taille du pixel
+            
+        Returns:
+            Surface: Sprite redimensionné, ou carré coloré de secours
+        """
+        filename = cls.IMAGE_FILES.get(pixel_type, "")
         
         try:
-            filepath = os.path.join(settings.ASSETS_DIR, filename)
-            if not os.path.exists(filepath):
-                print(f"Erreur : Image de pixel '{filepath}' introuvable.")
-                # Crée un carré coloré de secours
-                base_size = 10  # Taille de base avant d'appliquer le facteur d'échelle
-                scaled_size = int(base_size * (self.size / 10.0))  # Échelle relative à la taille de base
-                self.image = pygame.Surface((scaled_size, scaled_size))
-                if self.type == "white":
-                    self.image.fill((255, 255, 255))
-                elif self.type == "red":
-                    self.image.fill((255, 0, 0))
-                elif self.type == "green":
-                    self.image.fill((0, 255, 0))
-                elif self.type == "orange":
-                    self.image.fill((255, 165, 0))
-            else:
-                self.image = pygame.image.load(filepath)
-                # Obtient la taille originale de l'image
-                original_size = self.image.get_size()
-                # Calcule le facteur d'échelle basé sur la taille demandée
-                scale_factor = self.size / max(original_size)
-                # Redimensionne l'image
-                scaled_size = (int(original_size[0] * scale_factor), int(original_size[1] * scale_factor))
-                self.image = pygame.transform.scale(self.image, scaled_size)
+            # L'image source n'est lue qu'une seule fois, par le gestionnaire de ressources
+            assets = get_asset_manager()
+            source = assets.load_image(filename)
+            
+            # Redimensionne l'image pour que son plus grand côté mesure la taille demandée
+            return assets.load_image(filename, size=fit_size(source.get_size(), size), atlas=True)
         except pygame.error as e:
             print(f"Erreur lors du chargement de l'image de pixel {filename}: {e}")
-            # Crée un carré coloré de secours avec une taille cohérente
-            base_size = 10  # Taille de base avant d'appliquer le facteur d'échelle
-            scaled_size = int(base_size * (self.size / 10.0))  # Échelle relative à la taille de base
-            self.image = pygame.Surface((scaled_size, scaled_size))
-            if self.type == "white":
-                self.image.fill((255, 255, 255))
-            elif self.type == "red":
-                self.image.fill((255, 0, 0))
-            elif self.type == "green":
-                self.image.fill((0, 255, 0))
-            elif self.type == "orange":
-                self.image.fill((255, 165, 0))
-        
-        self.rect = self.image.get_rect(center=(self.x, self.y))
-        
-        # Après que l'image est chargée et que le rectangle est défini, crée une copie pour la manipulation de l'alpha
-        if hasattr(self, 'image') and self.image:
-            self.original_image = self.image.copy()
-            # Crée une version transparente pour l'affichage initial
-            self.image = self.original_image.copy()
-            self.image.set_alpha(0)
+            return cls._fallback_sprite(pixel_type, size)
+    
+    @classmethod
+    def _fallback_sprite(cls, pixel_type, size):
+        """Crée un carré coloré de secours avec une taille cohérente."""
+        base_size = 10  # Taille de base avant d'appliquer le facteur d'échelle
+        scaled_size = int(base_size * (size / 10.0))  # Échelle relative à la taille de base
+        sprite = pygame.Surface((scaled_size, scaled_size))
+        if pixel_type in cls.FALLBACK_COLORS:
+            sprite.fill(cls.FALLBACK_COLORS[pixel_type])
+        return sprite
         
     def start_blinking(self):
         """Commence l'effet de clignotement lors de la collision avec la base du cœur"""
@@ -187,17 +294,9 @@ class GamePixel:
             self.blink_timer += dt
             
             if self.blink_timer >= self.blink_interval:
-                # Bascule la visibilité
+                # Bascule la visibilité (l'image affichée en découle directement)
                 self.is_visible = not self.is_visible
                 
-                # Applique l'alpha en fonction de la visibilité
-                if self.is_visible:
-                    self.image = self.original_image.copy()
-                    self.image.set_alpha(255)
-                else:
-                    self.image = self.original_image.copy()
-                    self.image.set_alpha(0)
-                
                 # Réinitialise le minuteur et augmente la vitesse de clignotement
                 self.blink_timer = 0
                 self.blink_count += 0.5  # Compte la moitié pour chaque basculement
@@ -216,11 +315,8 @@ class GamePixel:
         # Met à jour l'effet d'apparition
         if self.fade_in_timer < self.fade_in_duration:
             self.fade_in_timer += dt
-            # Calcule le nouvel alpha
+            # Calcule le nouvel alpha (le sprite correspondant est choisi dans la rampe partagée)
             self.alpha = int(255 * min(self.fade_in_timer / self.fade_in_duration, 1.0))
-            # Applique l'alpha à l'image
-            self.image = self.original_image.copy()
-            self.image.set_alpha(self.alpha)
         
         # Calcule le vecteur de direction vers le cœur
         dx = heart_x - self.x
@@ -252,6 +348,18 @@ class GamePixel:
         
         return True
         
+    def is_drawn(self):
+        """
+        Indique si le pixel doit être dessiné à l'image actuelle.
+        
+        Returns:
+            bool: True si le pixel a une certaine visibilité, False sinon
+        """
+        # Un pixel invisible pendant son clignotement ne coûte rien
+        if (not self.is_blinking) or (self.is_blinking and self.is_visible):
+            return self.alpha > 0
+        return False
+    
     def draw(self, surface):
         """
         Dessine le pixel sur la surface donnée.
@@ -260,38 +368,87 @@ class GamePixel:
             surface (Surface): Surface Pygame sur laquelle dessiner
         """
         # Ne dessine le pixel que s'il a une certaine visibilité
-        if (not self.is_blinking) or (self.is_blinking and self.is_visible):
-            if self.alpha > 0:
-                surface.blit(self.image, self.rect)
+        if self.is_drawn():
+            surface.blit(self.image, self.rect)
         
-    def check_collision(self, heart_rect):
+    def check_collision(self, heart_rect, heart_mask=None):
         """
         Vérifie si le pixel est en collision avec le cœur.
         
+        Le test des rectangles est toujours effectué en premier ; si un masque est fourni,
+        la collision n'est confirmée que si des pixels opaques se chevauchent.
+        
         Args:
             heart_rect (Rect): Rectangle Pygame pour le cœur
+            heart_mask (Mask, optional): Masque du cœur pour une collision au pixel près
             
         Returns:
             bool: True si collision, False sinon
         """
-        return self.rect.colliderect(heart_rect)
+        rect = self.rect
+        if not rect.colliderect(heart_rect):
+            return False
+        if heart_mask is None:
+            return True
+        offset = (heart_rect.x - rect.x, heart_rect.y - rect.y)
+        return self.mask.overlap(heart_mask, offset) is not None
         
     def check_click(self, pos):
         """
         Vérifie si le pixel a été cliqué.
         
+        Avec PIXEL_PERFECT_COLLISION, un clic sur un coin transparent du sprite est ignoré.
+        
         Args:
             pos (tuple): Position de la souris (x, y)
             
         Returns:
             bool: True si cliqué, False sinon
         """
-        return self.rect.collidepoint(pos)
+        rect = self.rect
+        if not rect.collidepoint(pos):
+            return False
+        if not settings.PIXEL_PERFECT_COLLISION:
+            return True
+        return bool(self.mask.get_at((int(pos[0]) - rect.x, int(pos[1]) - rect.y)))
         
     def mark_as_dead(self):
         """Marque le pixel comme mort pour qu'il soit supprimé lors de la prochaine mise à jour."""
         self.dead = True
 
+class EngineGamePixel(GamePixel):
+    """
+    Pixel de jeu dont l'état de mouvement est stocké dans les tableaux d'un PixelEngine.
+    
+    Le comportement est identique à celui de GamePixel : seuls l'emplacement des données
+    et le déplacement (effectué par PixelEngine.update) changent.
+    """
+    x = EngineField("x")
+    y = EngineField("y")
+    speed = EngineField("speed")
+    alpha = EngineField("alpha")
+    fade_in_duration = EngineField("fade_in_duration")
+    fade_in_timer = EngineField("fade_in_timer")
+    is_blinking = EngineField("is_blinking")
+    blink_timer = EngineField("blink_timer")
+    blink_interval = EngineField("blink_interval")
+    blink_count = EngineField("blink_count")
+    max_blinks = EngineField("max_blinks")
+    is_visible = EngineField("is_visible")
+    dead = EngineField("dead")
+    
+    @property
+    def rect(self):
+        """Rectangle du pixel, recentré sur la position stockée dans le moteur."""
+        rect = self.__dict__["_rect"]
+        if self.__dict__.get("_engine") is not None:
+            rect.center = (self.x, self.y)
+        return rect
+    
+    @rect.setter
+    def rect(self, value):
+        self.__dict__["_rect"] = value
+
 class Game:
     """Classe principale du jeu qui gère l'état et la logique du jeu."""
     def __init__(self, screen, skip_entry_flash=False, music_enabled=True, sound_effects_enabled=True):
@@ -324,6 +481,10 @@ class Game:
             print(f"Erreur lors du chargement de la police: {e}")
             self.font = None
         
+        # Texte du score, rendu uniquement lorsque le score change
+        if self.font:
+            self.score_text = CachedText(self.font, settings.SCORE_TEXT_COLOR, settings.SCORE_PREFIX + "{}")
+        
         # État de fondu à l'entrée
         self.fading_in = skip_entry_flash
         self.fade_timer = 0
@@ -347,17 +508,11 @@ class Game:
         # Démarre la musique de fond du jeu
         self.start_background_music()
         
-        # Charge les images du bouton de sortie
+        # Charge les images du bouton de sortie, redimensionnées en utilisant les paramètres
+        assets = get_asset_manager()
         try:
-            self.exit_normal = pygame.image.load(os.path.join(settings.ASSETS_DIR, "ExitIcon.png"))
-            self.exit_click = pygame.image.load(os.path.join(settings.ASSETS_DIR, "ExitIconClick.png"))
-            
-            # Redimensionne le bouton en utilisant les paramètres
-            scale = settings.GAME_EXIT_ICON_SCALE
-            orig_size = self.exit_normal.get_size()
-            new_size = (int(orig_size[0] * scale), int(orig_size[1] * scale))
-            self.exit_normal = pygame.transform.scale(self.exit_normal, new_size)
-            self.exit_click = pygame.transform.scale(self.exit_click, new_size)
+            self.exit_normal = assets.load_image("ExitIcon.png", scale=settings.GAME_EXIT_ICON_SCALE, atlas=True)
+            self.exit_click = assets.load_image("ExitIconClick.png", size=self.exit_normal.get_size(), atlas=True)
             
             # Crée une version survolée avec un effet d'assombrissement
             self.exit_hover = self.exit_normal.copy()
@@ -380,13 +535,7 @@ class Game:
         
         # Charge l'image de bordure du menu principal
         try:
-            self.border_img = pygame.image.load(os.path.join(settings.ASSETS_DIR, "fullborder.png"))
-            original_border_size = self.border_img.get_size()
-            scaled_border_size = (
-                int(original_border_size[0] * settings.BORDER_SCALE), 
-                int(original_border_size[1] * settings.BORDER_SCALE)
-            )
-            self.scaled_border_img = pygame.transform.scale(self.border_img, scaled_border_size)
+            self.scaled_border_img = assets.load_image("fullborder.png", scale=settings.BORDER_SCALE)
             self.border_rect = self.scaled_border_img.get_rect(
                 center=(settings.BORDER_X_POSITION, settings.BORDER_Y_POSITION)
             )
@@ -396,13 +545,7 @@ class Game:
         
         # Charge l'image de base du cœur
         try:
-            self.base_img = pygame.image.load(os.path.join(settings.ASSETS_DIR, "base.png"))
-            original_base_size = self.base_img.get_size()
-            scaled_base_size = (
-                int(original_base_size[0] * settings.HEART_BASE_SCALE), 
-                int(original_base_size[1] * settings.HEART_BASE_SCALE)
-            )
-            self.scaled_base_img = pygame.transform.scale(self.base_img, scaled_base_size)
+            self.scaled_base_img = assets.load_image("base.png", scale=settings.HEART_BASE_SCALE)
         except pygame.error as e:
             print(f"Erreur lors du chargement de l'image de base: {e}")
             self.scaled_base_img = None
@@ -412,14 +555,8 @@ class Game:
         for i in range(1, 6):  # heart_1.png à heart_5.png - maintenant avec une nomenclature cohérente
             filename = f"heart_{i}.png"
             try:
-                image = pygame.image.load(os.path.join(settings.ASSETS_DIR, filename))
                 # Redimensionne l'image en utilisant le paramètre HEART_SCALE
-                original_size = image.get_size()
-                scaled_size = (
-                    int(original_size[0] * settings.HEART_SCALE),
-                    int(original_size[1] * settings.HEART_SCALE)
-                )
-                self.heart_images.append(pygame.transform.scale(image, scaled_size))
+                self.heart_images.append(assets.load_image(filename, scale=settings.HEART_SCALE, atlas=True))
             except pygame.error as e:
                 print(f"Erreur lors du chargement de l'image de cœur {filename}: {e}")
                 # Repli sur le cœur précédent si disponible
@@ -443,8 +580,43 @@ class Game:
             center=(settings.HEART_X_POSITION, settings.HEART_Y_POSITION)
         )
         
+        # Définit le rectangle de collision : la base sous le cœur, ou le cœur lui-même à défaut
+        if self.scaled_base_img is not None:
+            self.collision_rect = self.scaled_base_img.get_rect(
+                center=(settings.HEART_X_POSITION, settings.HEART_Y_POSITION)
+            )
+        else:
+            self.collision_rect = self.heart_rect
+        
+        # Masque de la cible pour les collisions au pixel près (calculé une seule fois)
+        self.collision_mask = None
+        if settings.PIXEL_PERFECT_COLLISION:
+            collision_image = self.scaled_base_img if self.scaled_base_img is not None else self.heart_image
+            self.collision_mask = pygame.mask.from_surface(collision_image)
+        
+        # Planifie les collisions avec le cœur à partir du temps d'impact de chaque pixel
+        self.impact_scheduler = ImpactScheduler(
+            self.collision_rect, settings.HEART_X_POSITION, settings.HEART_Y_POSITION
+        )
+        
+        # Pré-charge les sprites de pixels pour que chaque apparition ne coûte qu'une recherche dans le cache
+        GamePixel.preload_sprites()
+        
+        # Moteur de déplacement vectorisé optionnel (nécessite NumPy)
+        self.pixel_engine = None
+        if settings.GAME_PIXEL_VECTORIZED:
+            if PixelEngine.is_available():
+                self.pixel_engine = PixelEngine(settings.GAME_PIXEL_GRID_CELL_SIZE)
+            else:
+                print("Avertissement: NumPy n'est pas installé, le moteur de pixels vectorisé est désactivé.")
+        
         # Configure les pixels de jeu
         self.pixels = []
+        self.pixel_grid = SpatialHash(settings.GAME_PIXEL_GRID_CELL_SIZE)  # Index spatial pour les clics
+        self.next_draw_order = 0  # Ordre de dessin du prochain pixel (les plus récents sont dessinés au-dessus)
+        
+        # Rendu par rectangles modifiés (sinon l'écran entier est redessiné à chaque image)
+        self.dirty_renderer = DirtyRectRenderer(screen) if settings.GAME_DIRTY_RECT_RENDERING else None
         self.last_spawn_time = 0
         self.spawn_interval = settings.GAME_PIXEL_SPAWN_INTERVAL
         self.pixel_base_speed = settings.GAME_PIXEL_BASE_SPEED
@@ -454,67 +626,76 @@ class Game:
         self.mouse_in_window = True
         
     def load_sounds(self):
-        """Charge tous les effets sonores du jeu."""
-        # Initialise les objets sonores à None
-        self.explode_sound = None
-        self.death_sound = None
-        self.collect_sound = None
-        self.game_over_sound = None
-        
-        try:
-            # Charge le son d'explosion
-            explode_path = os.path.join(settings.ASSETS_DIR, "explode.mp3")
-            if os.path.exists(explode_path):
-                self.explode_sound = pygame.mixer.Sound(explode_path)
-                self.explode_sound.set_volume(settings.EXPLOSION_VOLUME)
-            else:
-                print(f"Avertissement: Fichier son '{explode_path}' non trouvé.")
-            
-            # Charge le son de mort
-            death_path = os.path.join(settings.ASSETS_DIR, "death.mp3")
-            if os.path.exists(death_path):
-                self.death_sound = pygame.mixer.Sound(death_path)
-                self.death_sound.set_volume(settings.DEATH_VOLUME)
-            else:
-                print(f"Avertissement: Fichier son '{death_path}' non trouvé.")
-                
-            # Charge le son de collecte
-            collect_path = os.path.join(settings.ASSETS_DIR, "collect.mp3")
-            if os.path.exists(collect_path):
-                self.collect_sound = pygame.mixer.Sound(collect_path)
-                self.collect_sound.set_volume(settings.COLLECT_VOLUME)
-            else:
-                print(f"Avertissement: Fichier son '{collect_path}' non trouvé.")
-            
-            # Charge le son de game-over
-            game_over_path = os.path.join(settings.ASSETS_DIR, "game-over.mp3")
-            if os.path.exists(game_over_path):
-                self.game_over_sound = pygame.mixer.Sound(game_over_path)
-                self.game_over_sound.set_volume(settings.GAME_OVER_VOLUME)  # Utilise le volume dédié au game over
-            else:
-                print(f"Avertissement: Fichier son '{game_over_path}' non trouvé.")
-                
-        except pygame.error as e:
-            print(f"Erreur lors du chargement des effets sonores: {e}")
+        """Récupère les effets sonores du jeu, décodés une seule fois par la banque de sons partagée."""
+        self.explode_sound = sound_bank.get("explode")
+        self.death_sound = sound_bank.get("death")
+        self.collect_sound = sound_bank.get("collect")
+        self.game_over_sound = sound_bank.get("game_over")
     
     def start_background_music(self):
         """Démarre la musique de fond pour le jeu."""
-        # Ne joue la musique que si elle est activée
-        if self.music_enabled:
-            try:
-                # Arrête toute musique existante
-                pygame.mixer.music.stop()
-                
-                # Charge et joue la musique de fond du jeu
-                bg_music_path = os.path.join(settings.ASSETS_DIR, "game-song.mp3")
-                if os.path.exists(bg_music_path):
-                    pygame.mixer.music.load(bg_music_path)
-                    pygame.mixer.music.set_volume(settings.MUSIC_VOLUME)  # Utilise la valeur du paramètre
-                    pygame.mixer.music.play(-1)  # -1 signifie boucler indéfiniment
-                else:
-                    print(f"Avertissement: Fichier de musique de fond du jeu '{bg_music_path}' non trouvé.")
-            except pygame.error as e:
-                print(f"Erreur lors du chargement de la musique de fond du jeu: {e}")
+        # Fondu enchaîné depuis la musique du menu (morceau déjà décodé en mémoire)
+        music_player.set_enabled(self.music_enabled)
+        music_player.play("game")
+    
+    def add_pixel(self, x, y, angle, size, pixel_type, speed):
+        """
+        Crée un pixel de jeu et l'ajoute à la partie.
+        
+        Args:
+            x (float): Position x initiale
+            y (float): Position y initiale
+            angle (float): Angle de mouvement en radians
+            size (int): Taille du pixel
+            pixel_type (str): Type de pixel
+            speed (float): Vitesse de base du pixel
+            
+        Returns:
+            GamePixel: Le pixel créé
+        """
+        if self.pixel_engine is not None:
+            pixel = EngineGamePixel(x, y, angle, size, pixel_type)
+        else:
+            pixel = GamePixel(x, y, angle, size, pixel_type)
+        pixel.speed = speed
+        pixel.draw_order = self.next_draw_order
+        self.next_draw_order += 1
+        if self.pixel_engine is not None:
+            self.pixel_engine.add(pixel)
+        self.pixels.append(pixel)
+        self.pixel_grid.insert(pixel, pixel.rect)
+        self.impact_scheduler.schedule(pixel)
+        return pixel
+    
+    def remove_pixel_at(self, index):
+        """
+        Retire de la partie le pixel à l'index donné.
+        
+        Args:
+            index (int): Index du pixel dans la liste des pixels
+        """
+        pixel = self.pixels[index]
+        if self.pixel_engine is not None:
+            self.pixel_engine.remove(pixel)
+        self.pixel_grid.remove(pixel)
+        self.impact_scheduler.remove(pixel)
+        del self.pixels[index]
+    
+    def find_clicked_pixel(self, pos):
+        """
+        Trouve le pixel cliqué le plus haut dans l'ordre de dessin.
+        
+        Args:
+            pos (tuple): Position de la souris (x, y)
+            
+        Returns:
+            GamePixel: Le pixel cliqué, ou None si aucun pixel n'est sous la souris
+        """
+        clicked_pixel = None
+        for pixel in self.pixel_grid.query_point(pos):
+            if pixel.check_click(pos) and (clicked_pixel is None or pixel.draw_order > clicked_pixel.draw_order):
+                clicked_pixel = pixel
+        return clicked_pixel
     
     def spawn_pixel(self):
         """Fait apparaître un nouveau pixel au bord de l'écran mais à l'intérieur de la bordure."""
@@ -566,10 +747,8 @@ class Game:
         # Détermine aléatoirement la taille du pixel
         size = random.randint(settings.GAME_PIXEL_MIN_SIZE, settings.GAME_PIXEL_MAX_SIZE)
         
-        # Crée et ajoute le pixel
-        pixel = GamePixel(x, y, angle, size, pixel_type)
-        pixel.speed = self.pixel_base_speed  # Définit la vitesse de base actuelle
-        self.pixels.append(pixel)
+        # Crée et ajoute le pixel avec la vitesse de base actuelle
+        self.add_pixel(x, y, angle, size, pixel_type, self.pixel_base_speed)
         
     def spawn_orange_splash(self, x, y):
         """
@@ -631,18 +810,15 @@ class Game:
                 size = random.randint(settings.GAME_PIXEL_MIN_SIZE, settings.GAME_PIXEL_MAX_SIZE)
                 
                 # Crée et ajoute un pixel blanc (pas orange)
-                pixel = GamePixel(spawn_x, spawn_y, angle, size, "white")
-                
                 # Rend ces pixels blancs légèrement plus lents que la normale pour donner au joueur le temps de réagir
-                pixel.speed = self.pixel_base_speed * 0.6
-                self.pixels.append(pixel)
+                self.add_pixel(spawn_x, spawn_y, angle, size, "white", self.pixel_base_speed * 0.6)
     
     def lose_life(self):
         """Réduit les vies du joueur de 1 et met à jour l'image du cœur."""
         self.lives -= 1
         
         # Joue le son de mort lors de la perte d'une vie
-        self.play_sound(self.death_sound)
+        self.play_sound(self.death_sound, "life_loss")
         
         # Crée une animation de pixels rouges sur le cœur lors de la perte d'une vie
         for _ in range(15):  # Crée 15 particules
@@ -685,6 +861,9 @@ class Game:
             # Ralentit tous les pixels temporairement
             for pixel in self.pixels:
                 pixel.speed *= 0.5
+                # Le temps d'impact dépend de la vitesse : il doit être recalculé
+                if not pixel.is_blinking:
+                    self.impact_scheduler.schedule(pixel)
                 
         elif powerup_type == "extra_life":
             # Ajoute une vie supplémentaire si pas au maximum
@@ -701,7 +880,7 @@ class Game:
             from_red_pixel (bool): Si la fin de jeu a été déclenchée en cliquant sur un pixel rouge
         """
         # Joue le son de game over
-        self.play_sound(self.game_over_sound)
+        self.play_sound(self.game_over_sound, "stinger")
             
         # Crée des effets de particules à la position du cœur
         # Utilise plus de particules si déclenché par un pixel rouge pour un effet plus dramatique
@@ -792,17 +971,15 @@ class Game:
                         self.exit_image = self.exit_click
                         # Ne retourne pas immédiatement, laisse le clic du bouton être visible
                     else:
-                        # Vérifie les clics sur les pixels
-                        for pixel in self.pixels:
-                            if pixel.check_click(event.pos):
-                                clicked_pixel = pixel
-                                clicked_on_interactive = True
-                                break
-                                
+                        # Vérifie les clics sur les pixels (le pixel dessiné au-dessus est prioritaire)
+                        clicked_pixel = self.find_clicked_pixel(event.pos)
+                        
                         if clicked_pixel:
+                            clicked_on_interactive = True
+                            
                             # Joue le son d'explosion pour les clics de pixel
                             if hasattr(self, 'explode_sound') and self.explode_sound:
-                                self.play_sound(self.explode_sound)
+                                self.play_sound(self.explode_sound, "explosion")
                                 
                             if clicked_pixel.type == "white":
                                 # Pixel blanc : détruit et crée une animation
@@ -832,7 +1009,7 @@ class Game:
                                 
                                 # Joue le son de collecte pour le pixel vert
                                 if hasattr(self, 'collect_sound') and self.collect_sound:
-                                    self.play_sound(self.collect_sound)
+                                    self.play_sound(self.collect_sound, "explosion")
                                 
                                 self.apply_powerup()
                                 
@@ -857,7 +1034,7 @@ class Game:
                     
                     # Si cliqué sur un élément interactif comme un bouton ou un pixel, joue le son d'explosion
                     if clicked_on_interactive and not clicked_pixel and hasattr(self, 'explode_sound') and self.explode_sound:
-                        self.play_sound(self.explode_sound)
+                        self.play_sound(self.explode_sound, "ui")
             
             elif event.type == pygame.MOUSEBUTTONUP:
                 if event.button == 1:  # Relâchement du bouton gauche de la souris
@@ -886,14 +1063,8 @@ class Game:
         self.exit_timer = 0
         self.exit_fade_timer = 0
         
-        # Arrêter complètement la musique du jeu au lieu de simplement la faire disparaître
-        try:
-            # Utiliser fadeout pour une transition douce, mais s'assurer que la musique est arrêtée
-            pygame.mixer.music.fadeout(500)  # Fondu sortant sur 500ms
-            # Ajout d'un arrêt complet après le fadeout pour être sûr
-            pygame.mixer.music.stop()
-        except pygame.error as e:
-            print(f"Erreur lors du fondu sortant de la musique du jeu: {e}")
+        # Fondu enchaîné vers la musique du menu pendant l'animation de sortie
+        music_player.play("menu")
         
         # Collecte tous les éléments visibles pour la transition
         self.exit_elements = []
@@ -961,11 +1132,6 @@ class Game:
                 
                 # Retourne au menu immédiatement lorsque le flash commence
                 if self.exit_fade_timer < 0.05:  # Vient de commencer le flash
-                    # S'assure que toute la musique est arrêtée avant de retourner au menu
-                    try:
-                        pygame.mixer.music.stop()
-                    except pygame.error:
-                        pass
                     self.return_to_menu = True
                     self.running = False
                 
@@ -1016,27 +1182,38 @@ class Game:
         heart_y = settings.HEART_Y_POSITION
         
         pixels_to_remove = []
-        for i, pixel in enumerate(self.pixels):
-            if not pixel.update(dt, heart_x, heart_y):
-                pixels_to_remove.append(i)
-                continue
+        if self.pixel_engine is not None:
+            # Avec le moteur vectorisé, tous les pixels avancent en une seule étape et seuls
+            # les pixels morts ou ayant changé de cellules sont parcourus en Python
+            self.pixel_engine.update(dt, heart_x, heart_y)
+            for pixel in self.pixel_engine.get_dead_pixels():
+                pixels_to_remove.append(self.pixels.index(pixel))
+            for pixel, cell_range in self.pixel_engine.get_cell_changes():
+                self.pixel_grid.move(pixel, cell_range)
+        else:
+            for i, pixel in enumerate(self.pixels):
+                if not pixel.update(dt, heart_x, heart_y):
+                    pixels_to_remove.append(i)
+                    continue
                 
-            # Définit le rectangle de base pour la détection de collision
-            if hasattr(self, 'scaled_base_img') and self.scaled_base_img is not None:
-                base_rect = self.scaled_base_img.get_rect(
-                    center=(settings.HEART_X_POSITION, settings.HEART_Y_POSITION)
-                )
-                collision_rect = base_rect
-            else:
-                collision_rect = self.heart_rect
+                # Met à jour l'index spatial (seulement si le pixel a changé de cellules)
+                self.pixel_grid.update(pixel, pixel.rect)
+        
+        # Seuls les pixels dont l'impact planifié est imminent sont testés contre le cœur/la base
+        self.impact_scheduler.advance(dt)
+        for pixel in self.impact_scheduler.due_pixels():
+            if pixel.dead:
+                continue
             
             # Vérifie la collision avec le cœur/la base
-            if pixel.check_collision(collision_rect) and not pixel.is_blinking:
+            if pixel.check_collision(self.collision_rect, self.collision_mask) and not pixel.is_blinking:
+                self.impact_scheduler.remove(pixel)
+                
                 # Commence l'effet de clignotement au lieu de supprimer immédiatement
                 if pixel.type == "green":
                     # Les pixels verts doivent éclater immédiatement sans son ni clignotement
                     self.apply_powerup()
-                    pixels_to_remove.append(i)
+                    pixels_to_remove.append(self.pixels.index(pixel))
                     # Crée un effet de particules sans son
                     self.pixel_animation.spawn_particles(pixel.x, pixel.y, color="green")
                 else:
@@ -1063,7 +1240,7 @@ class Game:
                     
                     # Joue le son d'explosion pour l'éclatement du pixel
                     if hasattr(self, 'explode_sound') and self.explode_sound:
-                        self.play_sound(self.explode_sound)
+                        self.play_sound(self.explode_sound, "explosion")
                     
                     # Applique les effets en fonction du type de pixel
                     if pixel.will_damage_heart:
@@ -1074,13 +1251,95 @@ class Game:
                         self.apply_powerup()
                         # Joue le son de collecte
                         if hasattr(self, 'collect_sound') and self.collect_sound:
-                            self.play_sound(self.collect_sound)
+                            self.play_sound(self.collect_sound, "explosion")
                 
                 # Maintenant supprime le pixel
-                del self.pixels[i]
+                self.remove_pixel_at(i)
+    
+    def get_static_layers(self):
+        """
+        Retourne les couches fixes dessinées au-dessus des pixels : la base puis le cœur.
+        
+        Returns:
+            list: Liste de tuples (image, rect) dans l'ordre de dessin
+        """
+        layers = []
+        if hasattr(self, 'scaled_base_img') and self.scaled_base_img is not None:
+            base_rect = self.scaled_base_img.get_rect(
+                center=(settings.HEART_X_POSITION, settings.HEART_Y_POSITION)
+            )
+            layers.append((self.scaled_base_img, base_rect))
+        layers.append((self.heart_image, self.heart_rect))
+        return layers
+    
+    def get_pixel_blits(self):
+        """
+        Retourne la couche des pixels visibles à dessiner, dans l'ordre de dessin.
+        
+        Returns:
+            list: Liste de tuples (image, position)
+        """
+        if self.pixel_engine is None:
+            return [(pixel.image, pixel.rect) for pixel in self.pixels if pixel.is_drawn()]
+        
+        # Visibilité, opacité et positions lues dans les tableaux du moteur
+        get_faded_sprite = GamePixel.get_faded_sprite
+        return [
+            (get_faded_sprite(pixel.type, pixel.size, alpha), position)
+            for pixel, alpha, position in self.pixel_engine.get_drawn()
+        ]
+    
+    def draw_dirty_rects(self):
+        """
+        Dessine l'état du jeu en ne mettant à jour que les zones modifiées de l'écran.
+        
+        La bordure, la base et le cœur forment un fond en cache, recomposé seulement quand
+        l'image du cœur change. Seuls les pixels, le bouton de sortie, le score, les
+        particules et le curseur sont redessinés à chaque image.
+        """
+        renderer = self.dirty_renderer
+        layers = self.get_static_layers()
+        background_layers = list(layers)
+        if hasattr(self, 'scaled_border_img') and self.scaled_border_img is not None:
+            background_layers.insert(0, (self.scaled_border_img, self.border_rect))
+        renderer.update_background(tuple(image for image, _ in layers), settings.BLACK, background_layers)
+        renderer.begin_frame()
+        
+        # Dessine les pixels visibles, puis redessine la base et le cœur là où ils passent dessous
+        dirty_rects = []
+        blit_batch(self.screen, self.get_pixel_blits(), dirty_rects)
+        renderer.redraw_overlays(layers, dirty_rects)
+        
+        # Dessine le bouton de sortie
+        if hasattr(self, 'exit_image') and self.exit_image is not None:
+            dirty_rects.append(self.screen.blit(self.exit_image, self.exit_rect))
+        
+        # Dessine le score
+        if self.font:
+            score_text = self.score_text.render(self.score)
+            score_rect = score_text.get_rect(midtop=(settings.SCORE_X_POSITION, settings.SCORE_Y_POSITION))
+            dirty_rects.append(self.screen.blit(score_text, score_rect))
+        
+        # Dessine les effets d'animation de pixels
+        self.pixel_animation.draw(self.screen, dirty_rects)
+        
+        # Dessine le curseur
+        cursor_rect = self.cursor_manager.draw(self.screen)
+        if cursor_rect is not None:
+            dirty_rects.append(cursor_rect)
+        
+        # Met à jour uniquement les zones modifiées de l'affichage
+        renderer.present(dirty_rects)
     
     def draw(self):
         """Dessine l'état du jeu."""
+        # Le fondu d'entrée et la transition de sortie couvrent tout l'écran : redessin complet
+        if self.dirty_renderer is not None:
+            if not self.exiting and not self.fading_in:
+                self.draw_dirty_rects()
+                return
+            self.dirty_renderer.invalidate()
+        
         # Efface l'écran
         self.screen.fill(settings.BLACK)
         
@@ -1104,9 +1363,7 @@ class Game:
                 alpha = int(255 * (1.0 - flash_progress))  # Commence à 255, diminue jusqu'à 0
                 
                 # Dessine le calque de flash blanc
-                flash_surface = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), pygame.SRCALPHA)
-                flash_surface.fill((255, 255, 255, alpha))
-                self.screen.blit(flash_surface, (0, 0))
+                overlay_compositor.draw(self.screen, settings.WHITE, alpha)
                 
             # Met à jour l'affichage
             pygame.display.flip()
@@ -1114,9 +1371,8 @@ class Game:
         
         # Rendu normal du jeu
         # Dessine tous les éléments du jeu - ils seront visibles à travers le flash blanc
-        # Dessine tous les pixels
-        for pixel in self.pixels:
-            pixel.draw(self.screen)
+        # Dessine tous les pixels visibles en un seul appel
+        blit_batch(self.screen, self.get_pixel_blits())
         
         # Dessine d'abord l'image de base sous le cœur
         if hasattr(self, 'scaled_base_img') and self.scaled_base_img is not None:
@@ -1134,7 +1390,7 @@ class Game:
         
         # Dessine le score
         if self.font:
-            score_text = self.font.render(f"{settings.SCORE_PREFIX}{self.score}", True, settings.SCORE_TEXT_COLOR)
+            score_text = self.score_text.render(self.score)
             score_rect = score_text.get_rect(midtop=(settings.SCORE_X_POSITION, settings.SCORE_Y_POSITION))
             self.screen.blit(score_text, score_rect)
         
@@ -1148,9 +1404,7 @@ class Game:
         if self.fading_in:
             fade_progress = 1.0 - min(self.fade_timer / self.fade_duration, 1.0)
             alpha = int(255 * fade_progress)
-            fade_surface = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), pygame.SRCALPHA)
-            fade_surface.fill((255, 255, 255, alpha))
-            self.screen.blit(fade_surface, (0, 0))
+            overlay_compositor.draw(self.screen, settings.WHITE, alpha)
         
         # Met à jour l'affichage
         pygame.display.flip()
@@ -1180,16 +1434,17 @@ class Game:
             clock.tick(settings.FPS)
             
         return self.running
-
-    def play_sound(self, sound):
+    
+    def play_sound(self, sound, category):
         """
         Joue un effet sonore si les effets sonores sont activés.
         
         Args:
             sound: L'objet Son pygame à jouer
+            category (str): Catégorie de canaux du gestionnaire audio (limite les voix simultanées)
         """
         if self.sound_effects_enabled:
-            sound.play()
+            audio_manager.play(sound, category)
 
 def start(screen, skip_entry_flash=False, music_enabled=True, sound_effects_enabled=True):
     """
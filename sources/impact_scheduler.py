@@ -0,0 +1,191 @@
+import heapq
+import math
+import settings
+
+# Impact Scheduler ————————————————————————————————————————————————————————————————————————————————————
+# —————————————————————————————————————————————————————————————————————————————————————————————————————
+
+def travel_time(distance_from, distance_to, speed):
+    """
+    Calcule le temps nécessaire à un pixel pour passer d'une distance au cœur à une autre.
+
+    Reprend le profil de vitesse de GamePixel.update : vitesse constante au-delà de
+    GAME_PIXEL_PROXIMITY_THRESHOLD, puis accélération v * (1 + A * p²) avec
+    p = 1 - d / seuil. Cette seconde phase s'intègre analytiquement (arc tangente).
+
+    Args:
+        distance_from (float): Distance actuelle au cœur
+        distance_to (float): Distance au cœur à atteindre (inférieure ou égale)
+        speed (float): Vitesse de base du pixel
+
+    Returns:
+        float: Temps en secondes (math.inf si le pixel n'avance pas)
+    """
+    if distance_to >= distance_from:
+        return 0.0
+    if speed <= 0:
+        return math.inf
+
+    threshold = settings.GAME_PIXEL_PROXIMITY_THRESHOLD
+    acceleration = settings.GAME_PIXEL_ACCELERATION
+    time = 0.0
+
+    # Phase à vitesse constante, loin du cœur
+    if distance_from > threshold:
+        far_end = max(distance_to, threshold)
+        time += (distance_from - far_end) / speed
+        distance_from = far_end
+
+    # Phase accélérée, à l'intérieur du seuil de proximité
+    if distance_to < distance_from:
+        start = 1.0 - distance_from / threshold
+        end = 1.0 - distance_to / threshold
+        if acceleration > 0:
+            root = math.sqrt(acceleration)
+            time += threshold / (speed * root) * (math.atan(root * end) - math.atan(root * start))
+        else:
+            time += (distance_from - distance_to) / speed
+
+    return time
+
+
+def time_to_impact(x, y, width, height, speed, target_rect, heart_x, heart_y, slack=0):
+    """
+    Calcule le temps avant que le rectangle d'un pixel en route vers le cœur touche la cible.
+
+    Le pixel se déplace en ligne droite vers (heart_x, heart_y) : son centre entre en
+    collision lorsqu'il pénètre dans le rectangle cible agrandi de la moitié de la
+    taille du pixel (somme de Minkowski).
+
+    Args:
+        x (float): Position x du centre du pixel
+        y (float): Position y du centre du pixel
+        width (int): Largeur du pixel
+        height (int): Hauteur du pixel
+        speed (float): Vitesse de base du pixel
+        target_rect (Rect): Rectangle de collision du cœur ou de sa base
+        heart_x (float): Position x du cœur
+        heart_y (float): Position y du cœur
+        slack (float): Marge en pixels ajoutée autour de la cible (arrondis des rectangles)
+
+    Returns:
+        float: Temps en secondes avant l'impact (0 si déjà en contact, math.inf si jamais)
+    """
+    left = target_rect.left - width / 2 - slack
+    right = target_rect.right + width / 2 + slack
+    top = target_rect.top - height / 2 - slack
+    bottom = target_rect.bottom + height / 2 + slack
+
+    dx = heart_x - x
+    dy = heart_y - y
+    distance = math.sqrt(dx*dx + dy*dy)
+    if distance == 0:
+        return 0.0
+    dx /= distance
+    dy /= distance
+
+    # Distance parcourue avant d'entrer dans la cible agrandie (méthode des dalles)
+    entry = 0.0
+    for position, direction, low, high in ((x, dx, left, right), (y, dy, top, bottom)):
+        if direction > 0:
+            entry = max(entry, (low - position) / direction)
+        elif direction < 0:
+            entry = max(entry, (high - position) / direction)
+        elif not low <= position <= high:
+            return math.inf
+
+    if entry >= distance:
+        # La trajectoire s'arrête au cœur sans entrer dans la cible
+        return math.inf
+
+    return travel_time(distance, distance - entry, speed)
+
+
+class ImpactScheduler:
+    """
+    Planifie les collisions entre les pixels et le cœur à partir de leur temps d'impact.
+
+    Le temps d'impact de chaque pixel est calculé à son apparition (ou quand sa vitesse
+    change) et rangé dans une file de priorité. Un pixel n'est vérifié précisément image
+    par image qu'à partir du moment où son impact est imminent, ce qui évite de tester
+    tous les pixels à chaque image.
+
+    La simulation image par image évalue la vitesse au début de chaque pas et avance donc
+    légèrement moins vite que la trajectoire continue : le temps analytique est une borne
+    inférieure, complétée par une petite marge de sécurité.
+    """
+    def __init__(self, target_rect, heart_x, heart_y):
+        """
+        Initialise le planificateur.
+
+        Args:
+            target_rect (Rect): Rectangle de collision du cœur ou de sa base
+            heart_x (float): Position x du cœur
+            heart_y (float): Position y du cœur
+        """
+        self.target_rect = target_rect
+        self.heart_x = heart_x
+        self.heart_y = heart_y
+        self.clock = 0.0  # Temps de déplacement écoulé
+        self.queue = []  # File de priorité de tuples (échéance, numéro, pixel)
+        self.entries = {}  # pixel -> numéro de son entrée valide dans la file
+        self.due = set()  # Pixels dont l'impact est imminent
+        self.next_entry = 0
+
+    def schedule(self, pixel):
+        """
+        Calcule le temps d'impact d'un pixel et l'ajoute à la file (remplace toute planification précédente).
+
+        Args:
+            pixel (GamePixel): Pixel à planifier
+        """
+        rect = pixel.rect
+        impact = time_to_impact(
+            pixel.x, pixel.y, rect.width, rect.height, pixel.speed,
+            self.target_rect, self.heart_x, self.heart_y,
+            slack=settings.GAME_PIXEL_IMPACT_SLACK
+        )
+        self.due.discard(pixel)
+        if impact == math.inf:
+            self.entries.pop(pixel, None)
+            return
+
+        due_time = self.clock + max(0.0, impact - settings.GAME_PIXEL_IMPACT_MARGIN)
+        entry = self.next_entry
+        self.next_entry += 1
+        self.entries[pixel] = entry
+        heapq.heappush(self.queue, (due_time, entry, pixel))
+
+    def remove(self, pixel):
+        """
+        Retire un pixel de la planification (son entrée dans la file devient obsolète).
+
+        Args:
+            pixel (GamePixel): Pixel à retirer
+        """
+        self.entries.pop(pixel, None)
+        self.due.discard(pixel)
+
+    def advance(self, dt):
+        """
+        Fait avancer l'horloge et déplace les pixels arrivés à échéance vers l'ensemble des impacts imminents.
+
+        Args:
+            dt (float): Delta temps en secondes
+        """
+        self.clock += dt
+        queue = self.queue
+        while queue and queue[0][0] <= self.clock:
+            _, entry, pixel = heapq.heappop(queue)
+            if self.entries.get(pixel) == entry:
+                del self.entries[pixel]
+                self.due.add(pixel)
+
+    def due_pixels(self):
+        """
+        Retourne les pixels dont l'impact est imminent, dans l'ordre de dessin.
+
+        Returns:
+            list: Pixels à vérifier précisément à cette image
+        """
+        return sorted(self.due, key=lambda pixel: pixel.draw_order)
@@ -7,11 +7,105 @@ from cursor_manager import CursorManager
 from pixel_animation import PixelAnimation  # Importe notre système d'animation
 from transition import TransitionAnimation  # Importe notre nouveau système d'animation de transition
 from screen_flash import ScreenFlash  # Importe notre système d'animation de flash d'écran
+from renderer import RedrawTracker  # Importe le suivi des zones à redessiner
+from text_cache import CachedText  # Importe le cache de textes rendus
+from asset_manager import get_asset_manager  # Importe le gestionnaire central des ressources
+from asset_pack import bake_asset_pack, get_preload_images  # Importe la construction du paquet d'images pré-redimensionnées
+from sound_bank import sound_bank  # Importe la banque d'effets sonores partagée
+from audio_manager import audio_manager  # Importe la répartition des sons par canaux
+from music_player import music_player  # Importe le lecteur de musique avec fondu enchaîné
 import game  # Importe notre module de jeu
 
 # Main ———————————————————————————————————————————————————————————————————————————————————————————————
 # ————————————————————————————————————————————————————————————————————————————————————————————————————
 
+# Classe de cache des apparences de widgets
+class WidgetSkinCache:
+    """
+    Cache des variantes d'images des widgets, partagé par toutes les instances de boutons.
+    
+    Les versions redimensionnées, survolées (assombries) et avec ombre portée sont calculées
+    une seule fois par (image, échelle, paramètres d'ombre), puis réutilisées chaque fois
+    qu'un menu recrée ses boutons.
+    """
+    def __init__(self):
+        """Initialise un cache vide."""
+        self.skins = {}  # clé de variante -> surface pré-calculée
+        
+    def get_scaled(self, image, scale):
+        """
+        Retourne l'image redimensionnée à l'échelle donnée.
+        
+        Args:
+            image (Surface): Image d'origine
+            scale (float): Facteur d'échelle
+            
+        Returns:
+            Surface: Image redimensionnée (partagée, ne pas modifier)
+        """
+        if scale == 1.0:
+            return image
+        key = ("scaled", image, scale)
+        skin = self.skins.get(key)
+        if skin is None:
+            orig_size = image.get_size()
+            new_size = (int(orig_size[0] * scale), int(orig_size[1] * scale))
+            skin = pygame.transform.scale(image, new_size)
+            self.skins[key] = skin
+        return skin
+    
+    def get_hover(self, image):
+        """
+        Retourne la version assombrie d'une image pour l'état de survol.
+        
+        Args:
+            image (Surface): Image de l'état normal
+            
+        Returns:
+            Surface: Image assombrie (partagée, ne pas modifier)
+        """
+        key = ("hover", image)
+        skin = self.skins.get(key)
+        if skin is None:
+            skin = image.copy()
+            dark_surface = pygame.Surface(skin.get_size(), pygame.SRCALPHA)
+            dark_surface.fill((0, 0, 0, settings.HOVER_DARKNESS))  # Noir semi-transparent
+            skin.blit(dark_surface, (0, 0))
+            self.skins[key] = skin
+        return skin
+    
+    def get_shadowed(self, image, shadow_offset, shadow_alpha):
+        """
+        Retourne une image composée de son ombre portée et de l'image elle-même.
+        
+        Args:
+            image (Surface): Image du widget
+            shadow_offset (int): Décalage de l'ombre en pixels
+            shadow_alpha (int): Transparence de l'ombre (0-255)
+            
+        Returns:
+            tuple: (Surface composée, décalage (x, y) de son coin par rapport à celui de l'image)
+        """
+        key = ("shadowed", image, shadow_offset, shadow_alpha)
+        skin = self.skins.get(key)
+        if skin is None:
+            width, height = image.get_size()
+            shift = abs(shadow_offset)
+            composite = pygame.Surface((width + shift, height + shift), pygame.SRCALPHA)
+            
+            # Dessine l'ombre d'abord, puis l'image par-dessus
+            shadow_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            shadow_surface.fill((0, 0, 0, shadow_alpha))
+            composite.blit(shadow_surface, (max(0, shadow_offset), max(0, shadow_offset)))
+            composite.blit(image, (max(0, -shadow_offset), max(0, -shadow_offset)))
+            
+            skin = (composite, (min(0, shadow_offset), min(0, shadow_offset)))
+            self.skins[key] = skin
+        return skin
+
+# Cache partagé des apparences de widgets
+widget_skins = WidgetSkinCache()
+
 # Classe de bouton à bascule
 class ToggleButton:
     """Classe de bouton à bascule pour les options marche/arrêt."""
@@ -29,26 +123,17 @@ class ToggleButton:
             shadow_offset (int): Décalage de l'ombre en pixels
             shadow_alpha (int): Transparence de l'ombre (0-255)
         """
-        # Redimensionne les images si nécessaire
-        if scale != 1.0:
-            orig_size = on_img.get_size()
-            new_size = (int(orig_size[0] * scale), int(orig_size[1] * scale))
-            self.on_img = pygame.transform.scale(on_img, new_size)
-            self.off_img = pygame.transform.scale(off_img, new_size)
-        else:
-            self.on_img = on_img
-            self.off_img = off_img
-            
-        # Crée une version assombrie des images pour l'état de survol
-        self.hover_on_img = self.on_img.copy()
-        dark_surface = pygame.Surface(self.hover_on_img.get_size(), pygame.SRCALPHA)
-        dark_surface.fill((0, 0, 0, settings.HOVER_DARKNESS))  # Noir semi-transparent
-        self.hover_on_img.blit(dark_surface, (0, 0))
+        # Récupère les images redimensionnées et leurs versions assombries pour l'état de survol
+        self.on_img = widget_skins.get_scaled(on_img, scale)
+        self.off_img = widget_skins.get_scaled(off_img, scale)
+        self.hover_on_img = widget_skins.get_hover(self.on_img)
+        self.hover_off_img = widget_skins.get_hover(self.off_img)
         
-        self.hover_off_img = self.off_img.copy()
-        dark_surface = pygame.Surface(self.hover_off_img.get_size(), pygame.SRCALPHA)
-        dark_surface.fill((0, 0, 0, settings.HOVER_DARKNESS))  # Noir semi-transparent
-        self.hover_off_img.blit(dark_surface, (0, 0))
+        # Récupère chaque état déjà composé avec son ombre portée
+        self.shadowed_images = {
+            image: widget_skins.get_shadowed(image, shadow_offset, shadow_alpha)
+            for image in (self.on_img, self.off_img, self.hover_on_img, self.hover_off_img)
+        }
         
         self.state = initial_state
         self.x = x
@@ -67,28 +152,15 @@ class ToggleButton:
         Args:
             surface (Surface): Surface sur laquelle dessiner le bouton
         """
-        # Crée une ombre pour le bouton
-        shadow_surface = pygame.Surface(self.image.get_size(), pygame.SRCALPHA)
-        shadow_surface.fill((0, 0, 0, self.shadow_alpha))
-        shadow_rect = shadow_surface.get_rect(
-            center=(self.rect.centerx + self.shadow_offset, 
-                    self.rect.centery + self.shadow_offset)
-        )
-        
-        # Dessine l'ombre d'abord
-        surface.blit(shadow_surface, shadow_rect)
-        
-        # Puis dessine le bouton
+        # Choisit l'image de l'état actuel
         if self.hovered:
-            if self.state:
-                surface.blit(self.hover_on_img, self.rect)
-            else:
-                surface.blit(self.hover_off_img, self.rect)
+            image = self.hover_on_img if self.state else self.hover_off_img
         else:
-            if self.state:
-                surface.blit(self.on_img, self.rect)
-            else:
-                surface.blit(self.off_img, self.rect)
+            image = self.on_img if self.state else self.off_img
+        
+        # Dessine le bouton et son ombre, déjà composés, en un seul blit
+        shadowed_image, (offset_x, offset_y) = self.shadowed_images[image]
+        surface.blit(shadowed_image, (self.rect.x + offset_x, self.rect.y + offset_y))
     
     def check_click(self, pos):
         """
@@ -146,7 +218,7 @@ def load_highscore():
     # Vérifie si le dossier highscore existe
     if not os.path.exists(settings.HIGHSCORE_DIR):
         return 0
-
+    
     highscore_path = os.path.join(settings.HIGHSCORE_DIR, settings.HIGHSCORE_FILE)
     try:
         if os.path.exists(highscore_path):
@@ -158,8 +230,10 @@ def load_highscore():
     return 0
 
 # Initialise pygame
+audio_manager.pre_init(settings.AUDIO_LATENCY_PROFILE)  # Taille du tampon audio selon le profil de latence
 pygame.init()
 pygame.mixer.init()  # Initialise le mixer pour la lecture audio
+audio_manager.setup()  # Réserve les canaux de chaque catégorie d'effets sonores
 
 # Crée l'écran en fonction des paramètres
 if settings.BORDERLESS_WINDOW:
@@ -174,19 +248,50 @@ else:
     
 pygame.display.set_caption("Pixel Perfect")  # Définit la légende pour la barre des tâches
 
-# Charge les ressources
-def load_image(filename):
-    filepath = os.path.join(settings.ASSETS_DIR, filename)
+# Gestionnaire de ressources partagé : chaque image n'est chargée et convertie qu'une seule fois
+assets = get_asset_manager()
+
+def draw_loading_progress(done, total, filename):
+    """
+    Affiche la progression du chargement des ressources au démarrage.
+    
+    Args:
+        done (int): Nombre de fichiers chargés
+        total (int): Nombre total de fichiers
+        filename (str): Dernier fichier chargé
+    """
+    pygame.event.pump()  # Garde la fenêtre réactive pendant le chargement
+    bar_rect = pygame.Rect(0, 0, settings.LOADING_BAR_WIDTH, settings.LOADING_BAR_HEIGHT)
+    bar_rect.center = (settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2)
+    screen.fill(settings.BLACK)
+    pygame.draw.rect(screen, settings.WHITE, bar_rect, 1)
+    filled_rect = bar_rect.copy()
+    filled_rect.width = int(bar_rect.width * done / total)
+    pygame.draw.rect(screen, settings.WHITE, filled_rect)
+    pygame.display.flip()
+
+# Décode les images utilisées, les effets sonores et les musiques en parallèle avant de construire les menus
+assets.preload(
+    get_preload_images(game.GamePixel.IMAGE_FILES.values()),
+    sound_bank.get_files() + music_player.get_files(),
+    progress=draw_loading_progress
+)
+
+# Construit le paquet d'images pré-redimensionnées s'il est absent ou périmé (démarrages suivants sans décodage)
+if settings.ASSET_PACK_ENABLED and assets.pack is None:
     try:
-        if not os.path.exists(filepath):
-            print(f"Erreur : Fichier image '{filepath}' introuvable.")
-            print(f"Veuillez vous assurer que '{filename}' est dans le dossier '{settings.ASSETS_DIR}'.")
-            sys.exit()
-        
-        image = pygame.image.load(filepath)
-        return image
+        bake_asset_pack(assets, game.GamePixel.IMAGE_FILES.values())
+    except OSError as e:
+        print(f"Avertissement: Impossible d'écrire le paquet de ressources: {e}")
+
+# Charge les ressources (images partagées entre les menus, ne pas les modifier)
+def load_image(filename, scale=None):
+    filepath = assets.get_path(filename)
+    try:
+        return assets.load_image(filename, scale=scale)
     except pygame.error as e:
         print(f"Erreur lors du chargement de l'image {filepath}: {e}")
+        print(f"Veuillez vous assurer que '{filename}' est dans le dossier '{assets.assets_dir}'.")
         sys.exit()
 
 # Charge toutes les images requises
@@ -197,9 +302,9 @@ opt_btn = load_image("OptBtn.png")
 opt_click = load_image("OptClick.png")
 exit_btn = load_image("ExitBtn.png")
 exit_click = load_image("ExitClick.png")
-border_img = load_image("fullborder.png")
-name_img = load_image("name.png")  # Charge l'image du nom
-crown_img = load_image("Crown.gif")  # Charge l'image de la couronne
+scaled_border_img = load_image("fullborder.png", scale=settings.BORDER_SCALE)
+scaled_name_img = load_image("name.png", scale=settings.NAME_SCALE)  # Charge l'image du nom
+scaled_crown_img = load_image("Crown.gif", scale=settings.CROWN_SCALE)  # Charge l'image de la couronne
 
 # Classe de bouton
 class Button:
@@ -215,21 +320,10 @@ class Button:
             clicked_img (Surface): Image pour l'état cliqué
             scale (float): Facteur d'échelle pour la taille du bouton (par défaut: 1.0)
         """
-        # Redimensionne les images si nécessaire
-        if scale != 1.0:
-            orig_size = normal_img.get_size()
-            new_size = (int(orig_size[0] * scale), int(orig_size[1] * scale))
-            self.normal_img = pygame.transform.scale(normal_img, new_size)
-            self.clicked_img = pygame.transform.scale(clicked_img, new_size)
-        else:
-            self.normal_img = normal_img
-            self.clicked_img = clicked_img
-            
-        # Crée une version assombrie de l'image normale pour l'état de survol
-        self.hover_img = self.normal_img.copy()
-        dark_surface = pygame.Surface(self.hover_img.get_size(), pygame.SRCALPHA)
-        dark_surface.fill((0, 0, 0, settings.HOVER_DARKNESS))  # Noir semi-transparent
-        self.hover_img.blit(dark_surface, (0, 0))
+        # Récupère les images redimensionnées et la version assombrie pour l'état de survol
+        self.normal_img = widget_skins.get_scaled(normal_img, scale)
+        self.clicked_img = widget_skins.get_scaled(clicked_img, scale)
+        self.hover_img = widget_skins.get_hover(self.normal_img)
         
         self.image = self.normal_img
         self.rect = self.image.get_rect(center=(x, y))
@@ -313,35 +407,53 @@ exit_button = Button(
     scale=settings.EXIT_BUTTON_SCALE
 )
 
-# Mise à l'échelle et positionnement de la bordure en utilisant les paramètres
-original_border_size = border_img.get_size()
-scaled_border_size = (
-    int(original_border_size[0] * settings.BORDER_SCALE), 
-    int(original_border_size[1] * settings.BORDER_SCALE)
-)
-scaled_border_img = pygame.transform.scale(border_img, scaled_border_size)
+# Positionnement de la bordure en utilisant les paramètres
 border_rect = scaled_border_img.get_rect(
     center=(settings.BORDER_X_POSITION, settings.BORDER_Y_POSITION)
 )
 
-# Mise à l'échelle et positionnement de l'image du nom en utilisant les paramètres
-original_name_size = name_img.get_size()
-scaled_name_size = (
-    int(original_name_size[0] * settings.NAME_SCALE), 
-    int(original_name_size[1] * settings.NAME_SCALE)
-)
-scaled_name_img = pygame.transform.scale(name_img, scaled_name_size)
+# Positionnement de l'image du nom en utilisant les paramètres
 name_rect = scaled_name_img.get_rect(
     midbottom=(settings.NAME_X_POSITION, settings.NAME_Y_POSITION)
 )
 
-# Mise à l'échelle de l'image de la couronne
-original_crown_size = crown_img.get_size()
-scaled_crown_size = (
-    int(original_crown_size[0] * settings.CROWN_SCALE),
-    int(original_crown_size[1] * settings.CROWN_SCALE)
-)
-scaled_crown_img = pygame.transform.scale(crown_img, scaled_crown_size)
+# Classe de cache d'images redimensionnées
+class ScaledImageCache:
+    """
+    Mémorise les versions redimensionnées d'une image, indexées par taille entière.
+    
+    L'échelle du titre évolue par petits pas entre TITLE_SCALE et TITLE_MAX_SCALE : chaque
+    taille n'est calculée qu'une seule fois, les images suivantes ne coûtent qu'un blit.
+    """
+    def __init__(self, image):
+        """
+        Initialise le cache.
+        
+        Args:
+            image (Surface): Image d'origine
+        """
+        self.image = image
+        self.frames = {}  # (largeur, hauteur) -> image redimensionnée
+        
+    def get(self, scale):
+        """
+        Retourne l'image redimensionnée à l'échelle donnée.
+        
+        Args:
+            scale (float): Facteur d'échelle
+            
+        Returns:
+            Surface: Image redimensionnée (partagée, ne pas modifier)
+        """
+        size = (int(self.image.get_width() * scale), int(self.image.get_height() * scale))
+        frame = self.frames.get(size)
+        if frame is None:
+            frame = pygame.transform.scale(self.image, size)
+            self.frames[size] = frame
+        return frame
+
+# Images redimensionnées du titre, partagées par le menu principal et le menu des options
+title_frames = ScaledImageCache(title_img)
 
 # Variables globales pour les paramètres audio
 music_enabled = True
@@ -351,78 +463,105 @@ def load_menu_music():
     """Charge et joue la musique de fond du menu."""
     global music_enabled
     
-    # Ne charge pas la musique si elle est désactivée
-    if not music_enabled:
-        pygame.mixer.music.stop()
-        return
+    # Morceau déjà décodé : fondu enchaîné sans rechargement (rien n'est joué si la musique est désactivée)
+    music_player.set_enabled(music_enabled)
+    music_player.play("menu")
+
+def wait_for_events(timeout):
+    """
+    Retourne les événements en attente, en attendant d'abord le prochain événement si un délai est donné.
+    
+    Args:
+        timeout (int): Délai maximal d'attente en millisecondes (0 = sans limite), ou None pour ne pas attendre
         
-    try:
-        # Charge et joue la musique de fond
-        bg_music_path = os.path.join(settings.ASSETS_DIR, "pixel-song.mp3")
-        if os.path.exists(bg_music_path):
-            pygame.mixer.music.load(bg_music_path)
-            pygame.mixer.music.set_volume(settings.MUSIC_VOLUME)  # Utilise la valeur du paramètre
-            pygame.mixer.music.play(-1)  # -1 signifie boucler indéfiniment
-        else:
-            print(f"Avertissement: Fichier de musique de fond '{bg_music_path}' introuvable.")
-    except pygame.error as e:
-        print(f"Erreur lors du chargement de la musique de fond: {e}")
+    Returns:
+        list: Événements à traiter
+    """
+    if timeout is None:
+        return pygame.event.get()
+    first_event = pygame.event.wait(timeout)
+    events = pygame.event.get()
+    if first_event.type != pygame.NOEVENT:
+        events.insert(0, first_event)
+    return events
 
-def options_menu():
-    """Affiche et gère le menu des options."""
-    global music_enabled, sound_effects_enabled
+def get_title_hover_wait(time):
+    """
+    Calcule le temps restant avant que le survol du titre le déplace d'un pixel entier.
     
-    # Sauvegarde l'état actuel de la musique pour restauration à la sortie
-    original_music_volume = settings.MUSIC_VOLUME
-    original_sfx_volume = settings.SFX_VOLUME
+    Le titre oscille selon TITLE_HOVER_AMPLITUDE * sin(TITLE_HOVER_SPEED * t) et sa position
+    est arrondie au pixel : il ne change à l'écran que lorsque l'oscillation franchit un
+    demi-pixel, ce qui laisse le menu attendre entre deux déplacements.
     
-    # Charge les effets sonores pour le contrôle du volume
-    try:
-        explode_sound_path = os.path.join(settings.ASSETS_DIR, "explode.mp3")
-        if os.path.exists(explode_sound_path):
-            explode_sound = pygame.mixer.Sound(explode_sound_path)
-            explode_sound.set_volume(settings.EXPLOSION_VOLUME)
-        else:
-            explode_sound = None
-            
-        # Charge le son de mort
-        death_path = os.path.join(settings.ASSETS_DIR, "death.mp3")
-        if os.path.exists(death_path):
-            death_sound = pygame.mixer.Sound(death_path)
-            death_sound.set_volume(settings.DEATH_VOLUME)
-        else:
-            death_sound = None
-            
-        # Charge le son de collecte
-        collect_path = os.path.join(settings.ASSETS_DIR, "collect.mp3")
-        if os.path.exists(collect_path):
-            collect_sound = pygame.mixer.Sound(collect_path)
-            collect_sound.set_volume(settings.COLLECT_VOLUME)
-        else:
-            collect_sound = None
+    Args:
+        time (float): Instant (en secondes) utilisé pour la position actuelle du titre
         
-        # Charge le son de game-over
-        game_over_path = os.path.join(settings.ASSETS_DIR, "game-over.mp3")
-        if os.path.exists(game_over_path):
-            game_over_sound = pygame.mixer.Sound(game_over_path)
-            game_over_sound.set_volume(settings.GAME_OVER_VOLUME)
-        else:
-            game_over_sound = None
-    except pygame.error as e:
-        print(f"Erreur lors du chargement des effets sonores: {e}")
-        explode_sound = None
-        death_sound = None
-        collect_sound = None
-        game_over_sound = None
+    Returns:
+        float: Temps en secondes avant le prochain déplacement, ou None si le titre ne bouge plus
+    """
+    amplitude = settings.TITLE_HOVER_AMPLITUDE
+    speed = settings.TITLE_HOVER_SPEED
+    if amplitude == 0 or speed == 0:
+        return None
+    
+    # Position arrondie actuelle, et seuils (en décalage) où elle passe au pixel voisin
+    phase = (time * speed) % (2 * math.pi)
+    position = math.floor(settings.TITLE_Y_POSITION + math.sin(phase) * amplitude + 0.5)  # Arrondi comme pygame.Rect
+    thresholds = [position + step - settings.TITLE_Y_POSITION for step in (-0.5, 0.5)]
     
-    # Fonction pour jouer les effets sonores lorsqu'ils sont activés
-    def play_sound(sound):
-        if sound_effects_enabled and sound:
-            sound.play()
+    # Prochaine phase où sin atteint l'un des seuils
+    smallest = None
+    for threshold in thresholds:
+        if abs(threshold) > abs(amplitude):
+            continue
+        angle = math.asin(threshold / amplitude)
+        for target in (angle, math.pi - angle):
+            delta = (target - phase) % (2 * math.pi)
+            if delta < 1e-9:
+                delta = 2 * math.pi
+            if smallest is None or delta < smallest:
+                smallest = delta
+    if smallest is None:
+        return None
+    return smallest / abs(speed)
+
+def get_menu_idle_timeout(busy, title_scale, title_time, pixel_animation):
+    """
+    Détermine si un menu est immobile et combien de temps il peut alors attendre le prochain événement.
+    
+    Args:
+        busy (bool): True si un flash ou une transition est en cours
+        title_scale (float): Échelle actuelle du titre
+        title_time (float): Instant (en secondes) utilisé pour la position actuelle du titre
+        pixel_animation (PixelAnimation): Animation de particules du menu
+        
+    Returns:
+        int: Délai d'attente en millisecondes (0 = sans limite), ou None si le menu s'anime encore
+    """
+    # Sans rendu par zones, le menu est redessiné à chaque image
+    if not settings.MENU_DIRTY_RECT_RENDERING:
+        return None
+    
+    # Tout changement provoqué par un événement est déjà dessiné : seules les animations empêchent d'attendre
+    title_scaling = settings.TITLE_SCALE < title_scale < settings.TITLE_MAX_SCALE
+    if busy or title_scaling or len(pixel_animation) > 0:
+        return None
+    
+    # Se réveille au plus tard pour le prochain déplacement du titre ou la prochaine génération de particules
+    waits = [pixel_animation.time_until_next_spawn(), get_title_hover_wait(title_time)]
+    waits = [wait for wait in waits if wait is not None]
+    if not waits:
+        return 0
+    elapsed = pygame.time.get_ticks() / 1000 - title_time
+    return max(1, math.ceil((min(waits) - elapsed) * 1000))
+
+def options_menu():
+    """Affiche et gère le menu des options."""
+    global music_enabled, sound_effects_enabled
     
     # Charge les images nécessaires
-    music_label = load_image("musique.png")
-    sound_effects_label = load_image("effetssonnores.png")
+    music_label = load_image("musique.png", scale=settings.MUSIC_LABEL_SCALE)
+    sound_effects_label = load_image("effetssonnores.png", scale=settings.SOUND_EFFECTS_LABEL_SCALE)
     music_on = load_image("musique-oui.png")
     music_off = load_image("musique-non.png")
     sound_on = load_image("effets-oui.png")
@@ -430,18 +569,6 @@ def options_menu():
     exit_btn = load_image("ExitBtn.png")
     exit_click = load_image("ExitClick.png")
     
-    # Redimensionne les labels
-    music_label = pygame.transform.scale(
-        music_label, 
-        (int(music_label.get_width() * settings.MUSIC_LABEL_SCALE), 
-         int(music_label.get_height() * settings.MUSIC_LABEL_SCALE))
-    )
-    sound_effects_label = pygame.transform.scale(
-        sound_effects_label, 
-        (int(sound_effects_label.get_width() * settings.SOUND_EFFECTS_LABEL_SCALE), 
-         int(sound_effects_label.get_height() * settings.SOUND_EFFECTS_LABEL_SCALE))
-    )
-    
     # Crée les rectangles pour les labels
     music_label_rect = music_label.get_rect(
         center=(settings.MUSIC_LABEL_X_POSITION, settings.MUSIC_LABEL_Y_POSITION)
@@ -478,29 +605,18 @@ def options_menu():
         exit_btn, exit_click, scale=settings.OPTIONS_EXIT_BUTTON_SCALE
     )
     
-    # Charge le titre
-    title_img = load_image("title.png")
-    
     # Variables d'animation du titre
     title_scale = settings.TITLE_SCALE
     title_hover = False
     
-    # Charge et redimensionne la bordure
-    border_img = load_image("fullborder.png")
-    original_border_size = border_img.get_size()
-    scaled_border_size = (
-        int(original_border_size[0] * settings.BORDER_SCALE), 
-        int(original_border_size[1] * settings.BORDER_SCALE)
-    )
-    scaled_border_img = pygame.transform.scale(border_img, scaled_border_size)
+    # Charge la bordure redimensionnée (partagée avec le menu principal)
+    scaled_border_img = load_image("fullborder.png", scale=settings.BORDER_SCALE)
     border_rect = scaled_border_img.get_rect(
         center=(settings.BORDER_X_POSITION, settings.BORDER_Y_POSITION)
     )
     
     # Initialise le titre avec l'échelle actuelle
-    scaled_title_width = int(title_img.get_width() * title_scale)
-    scaled_title_height = int(title_img.get_height() * title_scale)
-    scaled_title = pygame.transform.scale(title_img, (scaled_title_width, scaled_title_height))
+    scaled_title = title_frames.get(title_scale)
     title_rect = scaled_title.get_rect(center=(settings.TITLE_X_POSITION, settings.TITLE_Y_POSITION))
     
     # Initialise le gestionnaire de curseur
@@ -536,18 +652,67 @@ def options_menu():
         print(f"Erreur lors du chargement de la police pour le meilleur score: {e}")
         highscore_font = None
     
+    # Suivi des zones à redessiner
+    redraw_tracker = RedrawTracker(screen, settings.MENU_DIRTY_RECT_RENDERING)
+    idle_timeout = None
+    
+    def draw_options(surface):
+        """
+        Dessine toutes les couches du menu des options.
+        
+        Args:
+            surface (Surface): Surface sur laquelle dessiner (éventuellement limitée par une découpe)
+        """
+        surface.fill(settings.BLACK)
+        
+        # Dessine la bordure comme arrière-plan (première couche) - dessine toujours la bordure
+        surface.blit(scaled_border_img, border_rect)
+        
+        # Dessine le titre
+        surface.blit(scaled_title, title_rect)
+        
+        # Dessine les éléments de l'interface ou l'animation de transition
+        if in_transition:
+            # Si en transition, dessine la bordure et les éléments de transition
+            transition_animation.draw(surface)
+        else:
+            # Dessine les labels et les boutons
+            surface.blit(music_label, music_label_rect)
+            surface.blit(sound_effects_label, sound_effects_label_rect)
+            music_toggle.draw(surface)
+            sound_toggle.draw(surface)
+            exit_button.draw(surface)
+        
+        # Dessine l'animation de pixels (doit être après les éléments de l'interface mais avant le curseur)
+        pixel_animation.draw(surface)
+        
+        # Dessine le curseur personnalisé (doit être en dernier)
+        cursor_manager.draw(surface)
+        
+        # Dessine le flash d'écran (doit être la toute dernière chose à dessiner)
+        screen_flash.draw(surface)
+    
     # Boucle principale du menu des options
     while running:
+        # Attend le prochain événement si le menu est immobile
+        events = wait_for_events(idle_timeout)
+        
         # Calcule le delta time
         current_time = pygame.time.get_ticks() / 1000.0
         dt = current_time - last_time
         last_time = current_time
         
+        # Après une attente, le temps d'inactivité ne sert qu'au minuteur de génération aléatoire :
+        # les particules créées par les événements de cette image avancent ensuite d'une seule image
+        if idle_timeout is not None:
+            pixel_animation.update(dt, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+            dt = min(dt, 1 / settings.FPS)
+        
         # Obtient la position de la souris
         mouse_pos = pygame.mouse.get_pos()
         
         # Traitement des événements
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -555,7 +720,7 @@ def options_menu():
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1 and not in_transition:  # Clic gauche et pas en transition
                     # Play click sound
-                    play_sound(explode_sound)
+                    sound_bank.play("explode")
                     
                     # Génère des particules à la position du clic
                     pixel_animation.spawn_particles(event.pos[0], event.pos[1])
@@ -564,70 +729,17 @@ def options_menu():
                     if music_toggle.check_click(event.pos):
                         # Met à jour l'état de la musique
                         music_enabled = music_toggle.get_state()
-                        if music_enabled:
-                            # Restart music immediately when toggled on
-                            try:
-                                # Reset the volume in settings first
-                                settings.MUSIC_VOLUME = original_music_volume
-                                # Stop any currently playing music
-                                pygame.mixer.music.stop()
-                                # Reload music and play
-                                bg_music_path = os.path.join(settings.ASSETS_DIR, "pixel-song.mp3")
-                                if os.path.exists(bg_music_path):
-                                    pygame.mixer.music.load(bg_music_path)
-                                    pygame.mixer.music.set_volume(original_music_volume)
-                                    pygame.mixer.music.play(-1)
-                            except pygame.error as e:
-                                print(f"Error restarting music: {e}")
-                        else:
-                            # Just stop the music entirely when disabled
-                            pygame.mixer.music.stop()
-                            # Also set volume to 0
-                            settings.MUSIC_VOLUME = 0
+                        # Coupe la musique, ou reprend immédiatement celle du menu (déjà en mémoire)
+                        music_player.set_enabled(music_enabled)
                             
                     elif sound_toggle.check_click(event.pos):
                         # Met à jour l'état des effets sonores
                         sound_effects_enabled = sound_toggle.get_state()
+                        # Applique le nouvel état à tous les effets partagés (arrête ceux en cours si désactivés)
+                        sound_bank.set_enabled("effects", sound_effects_enabled)
                         if sound_effects_enabled:
-                            # Reset all volume settings to original values
-                            settings.SFX_VOLUME = original_sfx_volume
-                            settings.EXPLOSION_VOLUME = original_sfx_volume * 0.8
-                            settings.COLLECT_VOLUME = original_sfx_volume
-                            settings.DEATH_VOLUME = original_sfx_volume * 1.2
-                            settings.GAME_OVER_VOLUME = original_sfx_volume * 1.4
-                            
-                            # Re-enable sounds immediately
-                            if explode_sound:
-                                explode_sound.set_volume(settings.EXPLOSION_VOLUME)
-                                # Play sound immediately to demonstrate sound is working
-                                explode_sound.play()
-                            if death_sound:
-                                death_sound.set_volume(settings.DEATH_VOLUME)
-                            if collect_sound:
-                                collect_sound.set_volume(settings.COLLECT_VOLUME)
-                            if game_over_sound:
-                                game_over_sound.set_volume(settings.GAME_OVER_VOLUME)
-                        else:
-                            # Zero out all volume settings
-                            settings.SFX_VOLUME = 0
-                            settings.EXPLOSION_VOLUME = 0
-                            settings.COLLECT_VOLUME = 0
-                            settings.DEATH_VOLUME = 0
-                            settings.GAME_OVER_VOLUME = 0
-                            
-                            # Disable sounds immediately
-                            if explode_sound:
-                                explode_sound.set_volume(0)
-                                explode_sound.stop()  # Stop any currently playing sounds
-                            if death_sound:
-                                death_sound.set_volume(0)
-                                death_sound.stop()
-                            if collect_sound:
-                                collect_sound.set_volume(0)
-                                collect_sound.stop()
-                            if game_over_sound:
-                                game_over_sound.set_volume(0)
-                                game_over_sound.stop()
+                            # Play sound immediately to demonstrate sound is working
+                            sound_bank.play("explode")
                         
                     elif exit_button.check_click(event.pos):
                         # Démarre l'animation de transition pour revenir au menu principal
@@ -674,10 +786,8 @@ def options_menu():
                 # Diminue progressivement l'échelle pour revenir à la normale
                 title_scale = max(title_scale - settings.TITLE_SCALE_SPEED, settings.TITLE_SCALE)
         
-        # Met à l'échelle l'image du titre en fonction de l'état de survol
-        scaled_title_width = int(title_img.get_width() * title_scale)
-        scaled_title_height = int(title_img.get_height() * title_scale)
-        scaled_title = pygame.transform.scale(title_img, (scaled_title_width, scaled_title_height))
+        # Récupère l'image du titre à l'échelle de l'état de survol (calculée une seule fois par taille)
+        scaled_title = title_frames.get(title_scale)
         title_rect = scaled_title.get_rect(
             center=(settings.TITLE_X_POSITION, settings.TITLE_Y_POSITION + title_y_offset)
         )
@@ -715,38 +825,24 @@ def options_menu():
                     screen_flash.start()
                     running = False
         
-        # Dessine
-        screen.fill(settings.BLACK)
-        
-        # Dessine la bordure comme arrière-plan (première couche) - dessine toujours la bordure
-        screen.blit(scaled_border_img, border_rect)
-        
-        # Dessine le titre
-        screen.blit(scaled_title, title_rect)
-        
-        # Dessine les éléments de l'interface ou l'animation de transition
+        # Invalide les zones des éléments qui ont changé depuis l'image précédente
+        redraw_tracker.track("flash", screen_flash.alpha, screen.get_rect())
         if in_transition:
-            # Si en transition, dessine la bordure et les éléments de transition
-            transition_animation.draw(screen)
+            redraw_tracker.invalidate()
         else:
-            # Dessine les labels et les boutons
-            screen.blit(music_label, music_label_rect)
-            screen.blit(sound_effects_label, sound_effects_label_rect)
-            music_toggle.draw(screen)
-            sound_toggle.draw(screen)
-            exit_button.draw(screen)
-        
-        # Dessine l'animation de pixels (doit être après les éléments de l'interface mais avant le curseur)
-        pixel_animation.draw(screen)
-        
-        # Dessine le curseur personnalisé (doit être en dernier)
-        cursor_manager.draw(screen)
-        
-        # Dessine le flash d'écran (doit être la toute dernière chose à dessiner)
-        screen_flash.draw(screen)
+            redraw_tracker.track("title", title_scale, title_rect)
+            for toggle in (music_toggle, sound_toggle):
+                shadow_rect = toggle.rect.move(toggle.shadow_offset, toggle.shadow_offset)
+                redraw_tracker.track(toggle, (toggle.state, toggle.hovered), toggle.rect.union(shadow_rect))
+            redraw_tracker.track(exit_button, exit_button.image, exit_button.rect)
+        redraw_tracker.track_rects("particles", pixel_animation.get_rects())
+        redraw_tracker.track("cursor", cursor_manager.current_cursor, cursor_manager.get_rect())
         
-        # Met à jour l'affichage
-        pygame.display.flip()
+        # Dessine les zones invalidées et met à jour l'affichage
+        redraw_tracker.present(draw_options)
+        idle_timeout = get_menu_idle_timeout(
+            in_transition or screen_flash.active, title_scale, time, pixel_animation
+        )
         clock.tick(settings.FPS)
     
     return
@@ -759,75 +855,15 @@ def main():
     clock = pygame.time.Clock()
     running = True
     
-    # Stocke les paramètres de volume originaux au démarrage
-    ORIGINAL_MUSIC_VOLUME = settings.MUSIC_VOLUME
-    ORIGINAL_SFX_VOLUME = settings.SFX_VOLUME
-    ORIGINAL_EXPLOSION_VOLUME = settings.EXPLOSION_VOLUME
-    ORIGINAL_COLLECT_VOLUME = settings.COLLECT_VOLUME
-    ORIGINAL_DEATH_VOLUME = settings.DEATH_VOLUME
-    ORIGINAL_GAME_OVER_VOLUME = settings.GAME_OVER_VOLUME
-    
     # Fonction pour initialiser ou mettre à jour correctement les paramètres sonores
     def update_sound_settings():
-        nonlocal explode_sound
-        
-        # Initialise ou met à jour la musique de fond
-        if music_enabled:
-            # Restaure le volume de musique original
-            settings.MUSIC_VOLUME = ORIGINAL_MUSIC_VOLUME
-            # Force explicitement le rechargement et la lecture de la musique
-            try:
-                pygame.mixer.music.stop()  # Arrête d'abord toute musique existante
-                bg_music_path = os.path.join(settings.ASSETS_DIR, "pixel-song.mp3")
-                if os.path.exists(bg_music_path):
-                    pygame.mixer.music.load(bg_music_path)
-                    pygame.mixer.music.set_volume(ORIGINAL_MUSIC_VOLUME)
-                    pygame.mixer.music.play(-1)
-                else:
-                    print(f"Avertissement: Fichier de musique de fond '{bg_music_path}' introuvable.")
-            except pygame.error as e:
-                print(f"Erreur lors du rechargement de la musique: {e}")
-        else:
-            # S'assure que le volume de la musique est à 0 dans les paramètres
-            settings.MUSIC_VOLUME = 0
-            pygame.mixer.music.stop()
-        
-        # Initialise ou met à jour les paramètres des effets sonores
-        if sound_effects_enabled:
-            # Restaure tous les volumes d'effets sonores originaux
-            settings.SFX_VOLUME = ORIGINAL_SFX_VOLUME
-            settings.EXPLOSION_VOLUME = ORIGINAL_EXPLOSION_VOLUME
-            settings.COLLECT_VOLUME = ORIGINAL_COLLECT_VOLUME
-            settings.DEATH_VOLUME = ORIGINAL_DEATH_VOLUME
-            settings.GAME_OVER_VOLUME = ORIGINAL_GAME_OVER_VOLUME
-        else:
-            # Met tous les volumes d'effets sonores à 0
-            settings.SFX_VOLUME = 0
-            settings.EXPLOSION_VOLUME = 0
-            settings.COLLECT_VOLUME = 0
-            settings.DEATH_VOLUME = 0
-            settings.GAME_OVER_VOLUME = 0
-        
-        # Recharge toujours le son d'explosion
-        try:
-            explode_sound_path = os.path.join(settings.ASSETS_DIR, "explode.mp3")
-            if os.path.exists(explode_sound_path):
-                # Recharge toujours le son pour assurer une nouvelle instance
-                explode_sound = pygame.mixer.Sound(explode_sound_path)
-                # Règle le volume en fonction du paramètre des effets sonores
-                if sound_effects_enabled:
-                    explode_sound.set_volume(ORIGINAL_EXPLOSION_VOLUME)
-                else:
-                    explode_sound.set_volume(0)
-            else:
-                print(f"Avertissement: Fichier son '{explode_sound_path}' introuvable.")
-                explode_sound = None
-        except pygame.error as e:
-            print(f"Erreur lors du chargement du son d'explosion: {e}")
-            explode_sound = None
-    
-    # Initialise les effets sonores pour le menu principal
-    explode_sound = None
+        # Musique du menu : continue si elle joue déjà, sinon fondu entrant depuis la mémoire
+        load_menu_music()
+        
+        # Active ou coupe les effets sonores partagés (volumes appliqués sans rechargement)
+        sound_bank.set_enabled("effects", sound_effects_enabled)
+    
+    # Initialise les paramètres sonores pour le menu principal
     update_sound_settings()
     
     # Variables d'expansion du titre
@@ -858,9 +894,7 @@ def main():
     last_time = pygame.time.get_ticks() / 1000.0
     
     # Initialise scaled_title et title_rect pour s'assurer qu'ils sont définis avant le traitement des événements
-    scaled_title_width = int(title_img.get_width() * title_scale)
-    scaled_title_height = int(title_img.get_height() * title_scale)
-    scaled_title = pygame.transform.scale(title_img, (scaled_title_width, scaled_title_height))
+    scaled_title = title_frames.get(title_scale)
     title_rect = scaled_title.get_rect(center=(settings.TITLE_X_POSITION, settings.TITLE_Y_POSITION))
     
     # Commence avec un flash d'écran initial lorsque le jeu se charge
@@ -872,26 +906,95 @@ def main():
     except pygame.error as e:
         print(f"Erreur lors du chargement de la police pour le meilleur score: {e}")
         highscore_font = None
-
+    
     # Charger le meilleur score
     highscore = load_highscore()
-
+    
     try:
         highscore_font = pygame.font.SysFont("Arial", settings.HIGHSCORE_FONT_SIZE, bold=False)
     except:
         print("Error loading fonts. Using fallback.")
         highscore_font = pygame.font.Font(None, settings.HIGHSCORE_FONT_SIZE)
-
+    
+    # Texte du meilleur score, rendu uniquement lorsque le meilleur score change
+    highscore_label = CachedText(highscore_font, settings.WHITE, "HIGHSCORE LOCAL: {}") if highscore_font else None
+    
+    # Suivi des zones à redessiner
+    redraw_tracker = RedrawTracker(screen, settings.MENU_DIRTY_RECT_RENDERING)
+    idle_timeout = None
+    highscore_text = None
+    
+    def draw_menu(surface):
+        """
+        Dessine toutes les couches du menu principal.
+        
+        Args:
+            surface (Surface): Surface sur laquelle dessiner (éventuellement limitée par une découpe)
+        """
+        surface.fill(settings.BLACK)
+        
+        # Dessine la bordure comme arrière-plan (première couche) - dessine toujours la bordure
+        surface.blit(scaled_border_img, border_rect)
+        
+        # Dessine toujours le titre si on va vers le menu des options
+        if in_transition and next_scene == "options":
+            # Dessine le titre avec l'effet de survol
+            surface.blit(scaled_title, title_rect)
+        
+        # Dessine les éléments de l'interface ou l'animation de transition
+        if in_transition:
+            # Si en transition, dessine la bordure et les éléments de transition
+            transition_animation.draw(surface)
+        else:
+            # Dessine l'interface normale si pas en transition et pas en attente de sortie des éléments
+            if not waiting_for_elements_exit:
+                # Dessine le titre avec l'effet de survol
+                surface.blit(scaled_title, title_rect)
+                
+                # Dessine les boutons
+                play_button.draw(surface)
+                options_button.draw(surface)
+                exit_button.draw(surface)
+                
+                # Dessine l'image du nom au premier plan (dernière couche)
+                surface.blit(scaled_name_img, name_rect)
+                
+                # Affiche le meilleur score
+                if highscore_text is not None:
+                    # Affiche la couronne à gauche du texte du meilleur score
+                    surface.blit(scaled_crown_img, crown_rect)
+                    
+                    # Affiche le texte du highscore après la couronne
+                    surface.blit(highscore_text, highscore_rect)
+        
+        # Dessine l'animation de pixels (doit être après les éléments de l'interface mais avant le curseur)
+        pixel_animation.draw(surface)
+        
+        # Dessine le curseur personnalisé (doit être en dernier)
+        cursor_manager.draw(surface)
+        
+        # Dessine le flash d'écran (doit être la toute dernière chose à dessiner)
+        screen_flash.draw(surface)
+    
     while running:
+        # Attend le prochain événement si le menu est immobile
+        events = wait_for_events(idle_timeout)
+        
         # Calcule le delta time
         current_time = pygame.time.get_ticks() / 1000.0
         dt = current_time - last_time
         last_time = current_time
         
+        # Après une attente, le temps d'inactivité ne sert qu'au minuteur de génération aléatoire :
+        # les particules créées par les événements de cette image avancent ensuite d'une seule image
+        if idle_timeout is not None:
+            pixel_animation.update(dt, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+            dt = min(dt, 1 / settings.FPS)
+        
         mouse_pos = pygame.mouse.get_pos()
         
         # Traite les événements
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.MOUSEMOTION:
@@ -913,8 +1016,7 @@ def main():
                     # Vérifie les clics de bouton uniquement si pas en transition
                     if not in_transition and not waiting_for_elements_exit:
                         # Joue le son de clic pour tout clic sur le menu
-                        if explode_sound and sound_effects_enabled:
-                            explode_sound.play()
+                        sound_bank.play("explode")
                         
                         # Génère des particules à la position du clic - permet les particules partout sur l'écran du menu
                         pixel_animation.spawn_particles(event.pos[0], event.pos[1])
@@ -932,8 +1034,7 @@ def main():
                             in_transition = True
                             next_scene = "play"
                             
-                            # Fait disparaître la musique avant de passer au jeu
-                            pygame.mixer.music.fadeout(500)  # Fondu sortant sur 500ms
+                            # La musique du menu continue : fondu enchaîné vers celle du jeu au démarrage de la partie
                         
                         elif options_button.check_click(event.pos):
                             # Démarre l'animation de transition - inclut seulement name_img pour la transition
@@ -1023,6 +1124,9 @@ def main():
                         
                     next_scene = None
                     in_transition = False
+                    
+                    # L'écran a pu être dessiné par une autre scène : tout redessiner
+                    redraw_tracker.invalidate()
         
         # Vérifie uniquement les états de survol des boutons si pas en transition
         if not in_transition and not waiting_for_elements_exit:
@@ -1057,10 +1161,8 @@ def main():
                 # Diminue progressivement l'échelle pour revenir à la normale
                 title_scale = max(title_scale - settings.TITLE_SCALE_SPEED, settings.TITLE_SCALE)
         
-        # Met à l'échelle l'image du titre en fonction de l'état de survol
-        scaled_title_width = int(title_img.get_width() * title_scale)
-        scaled_title_height = int(title_img.get_height() * title_scale)
-        scaled_title = pygame.transform.scale(title_img, (scaled_title_width, scaled_title_height))
+        # Récupère l'image du titre à l'échelle de l'état de survol (calculée une seule fois par taille)
+        scaled_title = title_frames.get(title_scale)
         title_rect = scaled_title.get_rect(
             center=(settings.TITLE_X_POSITION, settings.TITLE_Y_POSITION + title_y_offset)
         )
@@ -1087,65 +1189,37 @@ def main():
         # Met à jour l'animation de flash d'écran
         screen_flash.update(dt)
         
-        # Dessine
-        screen.fill(settings.BLACK)
+        # Prépare le texte du meilleur score et la couronne à sa gauche
+        if highscore_label:
+            highscore_text = highscore_label.render(highscore)
+            highscore_rect = highscore_text.get_rect(midtop=(settings.HIGHSCORE_X_POSITION, settings.HIGHSCORE_Y_POSITION))
+            crown_rect = scaled_crown_img.get_rect(
+                midright=(highscore_rect.left - settings.CROWN_SPACING,
+                         highscore_rect.centery + settings.CROWN_Y_OFFSET)
+            )
         
-        # Dessine la bordure comme arrière-plan (première couche) - dessine toujours la bordure
-        screen.blit(scaled_border_img, border_rect)
-        
-        # Dessine toujours le titre si on va vers le menu des options
-        if in_transition and next_scene == "options":
-            # Dessine le titre avec l'effet de survol
-            screen.blit(scaled_title, title_rect)
-        
-        # Dessine les éléments de l'interface ou l'animation de transition
+        # Invalide les zones des éléments qui ont changé depuis l'image précédente
+        redraw_tracker.track("flash", screen_flash.alpha, screen.get_rect())
         if in_transition:
-            # Si en transition, dessine la bordure et les éléments de transition
-            transition_animation.draw(screen)
-        else:
-            # Dessine l'interface normale si pas en transition et pas en attente de sortie des éléments
-            if not waiting_for_elements_exit:
-                # Dessine le titre avec l'effet de survol
-                screen.blit(scaled_title, title_rect)
-                
-                # Dessine les boutons
-                play_button.draw(screen)
-                options_button.draw(screen)
-                exit_button.draw(screen)
-                
-                # Dessine l'image du nom au premier plan (dernière couche)
-                screen.blit(scaled_name_img, name_rect)
-                
-                # Affiche le meilleur score
-                if highscore_font:
-                    highscore_text = highscore_font.render(f"HIGHSCORE LOCAL: {highscore}", True, settings.WHITE)
-                    highscore_rect = highscore_text.get_rect(midtop=(settings.HIGHSCORE_X_POSITION, settings.HIGHSCORE_Y_POSITION))
-                    
-                    # Affiche la couronne à gauche du texte du meilleur score
-                    crown_rect = scaled_crown_img.get_rect(
-                        midright=(highscore_rect.left - settings.CROWN_SPACING,
-                                 highscore_rect.centery + settings.CROWN_Y_OFFSET)
-                    )
-                    screen.blit(scaled_crown_img, crown_rect)
-                    
-                    # Affiche le texte du highscore après la couronne
-                    screen.blit(highscore_text, highscore_rect)
+            redraw_tracker.invalidate()
+        elif not waiting_for_elements_exit:
+            redraw_tracker.track("title", title_scale, title_rect)
+            for button in (play_button, options_button, exit_button):
+                redraw_tracker.track(button, button.image, button.rect)
+            if highscore_text is not None:
+                redraw_tracker.track("highscore", highscore, highscore_rect.union(crown_rect))
+        redraw_tracker.track_rects("particles", pixel_animation.get_rects())
+        redraw_tracker.track("cursor", cursor_manager.current_cursor, cursor_manager.get_rect())
         
-        # Dessine l'animation de pixels (doit être après les éléments de l'interface mais avant le curseur)
-        pixel_animation.draw(screen)
-        
-        # Dessine le curseur personnalisé (doit être en dernier)
-        cursor_manager.draw(screen)
-        
-        # Dessine le flash d'écran (doit être la toute dernière chose à dessiner)
-        screen_flash.draw(screen)
-        
-        # Met à jour l'affichage
-        pygame.display.flip()
+        # Dessine les zones invalidées et met à jour l'affichage
+        redraw_tracker.present(draw_menu)
+        idle_timeout = get_menu_idle_timeout(
+            in_transition or screen_flash.active, title_scale, time, pixel_animation
+        )
         clock.tick(settings.FPS)
     
     # Nettoie avant de quitter
-    pygame.mixer.music.stop()
+    music_player.stop()
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,167 @@
+import pygame
+import settings
+from asset_manager import get_asset_manager
+from audio_manager import audio_manager
+
+# Music Player ————————————————————————————————————————————————————————————————————————————————————————
+# —————————————————————————————————————————————————————————————————————————————————————————————————————
+
+# Morceaux de musique : nom -> fichier
+MUSIC_TRACKS = {
+    "menu": "pixel-song.mp3",
+    "game": "game-song.mp3",
+}
+
+
+class MusicPlayer:
+    """
+    Joue les musiques du menu et du jeu depuis la mémoire, avec un fondu enchaîné.
+    
+    Les deux morceaux sont décodés une seule fois (au démarrage, avec les autres ressources)
+    et chacun dispose de son propre canal réservé : changer de scène lance un fondu entrant
+    sur un canal et un fondu sortant sur l'autre, sans recharger de fichier ni bloquer l'image.
+    """
+    def __init__(self, tracks):
+        """
+        Initialise le lecteur (les morceaux sont récupérés à leur première lecture s'ils ne sont pas préchargés).
+        
+        Args:
+            tracks (dict): Nom -> fichier
+        """
+        self.tracks = tracks
+        self.sounds = {}  # nom -> Sound, ou None si le fichier est introuvable
+        self.current = None  # Morceau demandé par la scène actuelle
+        self.enabled = True
+        self.volume = settings.MUSIC_VOLUME
+    
+    def get_files(self):
+        """
+        Retourne les fichiers de tous les morceaux (pour le préchargement).
+        
+        Returns:
+            list: Noms des fichiers
+        """
+        return list(self.tracks.values())
+    
+    def get_channel(self, name):
+        """
+        Retourne le canal réservé d'un morceau.
+        
+        Args:
+            name (str): Nom du morceau
+        
+        Returns:
+            Channel: Canal du morceau, ou None si le mixer n'est pas prêt
+        """
+        channels = audio_manager.channels.get("music")
+        if not channels:
+            return None
+        return channels[list(self.tracks).index(name) % len(channels)]
+    
+    def get_sound(self, name):
+        """
+        Retourne le morceau décodé, en le chargeant au premier appel.
+        
+        Args:
+            name (str): Nom du morceau
+        
+        Returns:
+            Sound: Morceau, ou None s'il est introuvable ou illisible
+        """
+        if name in self.sounds:
+            return self.sounds[name]
+        
+        sound = None
+        try:
+            sound = get_asset_manager().get_sound(self.tracks[name])
+            sound.set_volume(self.volume)
+        except (FileNotFoundError, pygame.error) as e:
+            print(f"Erreur lors du chargement de la musique {self.tracks[name]}: {e}")
+        self.sounds[name] = sound
+        return sound
+    
+    def play(self, name, fade_ms=None):
+        """
+        Passe au morceau demandé avec un fondu enchaîné (sans effet s'il joue déjà).
+        
+        Args:
+            name (str): Nom du morceau
+            fade_ms (int, optional): Durée du fondu (MUSIC_CROSSFADE_MS si None)
+        """
+        fade_ms = settings.MUSIC_CROSSFADE_MS if fade_ms is None else fade_ms
+        previous = self.current
+        self.current = name
+        if not self.enabled:
+            return
+        
+        channel = self.get_channel(name)
+        sound = self.get_sound(name)
+        if channel is None or sound is None:
+            return
+        if previous == name and channel.get_busy() and channel.get_sound() is sound:
+            return
+        
+        # Fondu sortant des autres morceaux, fondu entrant du nouveau
+        self._fade_out_others(name, fade_ms)
+        channel.set_volume(1.0)
+        channel.play(sound, loops=-1, fade_ms=fade_ms)
+    
+    def stop(self, fade_ms=0):
+        """
+        Arrête la musique, avec un fondu sortant éventuel.
+        
+        Args:
+            fade_ms (int): Durée du fondu sortant (0 pour un arrêt immédiat)
+        """
+        self.current = None
+        self._fade_out_others(None, fade_ms)
+    
+    def set_enabled(self, enabled):
+        """
+        Active ou coupe la musique ; le morceau de la scène actuelle reprend à la réactivation.
+        
+        Args:
+            enabled (bool): Nouvel état
+        """
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if not enabled:
+            self._fade_out_others(None, 0)
+        elif self.current is not None:
+            current = self.current
+            self.current = None
+            self.play(current)
+    
+    def set_volume(self, volume):
+        """
+        Règle le volume de tous les morceaux.
+        
+        Args:
+            volume (float): Volume (0.0 à 1.0)
+        """
+        self.volume = volume
+        for sound in self.sounds.values():
+            if sound is not None:
+                sound.set_volume(volume)
+    
+    def _fade_out_others(self, name, fade_ms):
+        """
+        Arrête les canaux des morceaux autres que name.
+        
+        Args:
+            name (str): Morceau à garder (None pour tous les arrêter)
+            fade_ms (int): Durée du fondu sortant (0 pour un arrêt immédiat)
+        """
+        keep = self.get_channel(name) if name is not None else None
+        for channel in audio_manager.channels.get("music", []):
+            if channel is keep or not channel.get_busy():
+                continue
+            if fade_ms > 0:
+                channel.fadeout(fade_ms)
+            else:
+                channel.stop()
+
+
+# Lecteur partagé par les menus et le jeu
+music_player = MusicPlayer(MUSIC_TRACKS)
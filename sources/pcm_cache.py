@@ -0,0 +1,179 @@
+import hashlib
+import io
+import mmap
+import os
+import struct
+import pygame
+
+# PCM Cache ———————————————————————————————————————————————————————————————————————————————————————————
+# —————————————————————————————————————————————————————————————————————————————————————————————————————
+
+PCM_MAGIC = b"PXPC"
+PCM_HEADER = struct.Struct("<4siiiQ")  # Signature, fréquence, taille d'échantillon, canaux, taille des données
+
+
+class PCMCache:
+    """
+    Cache sur disque des effets sonores déjà décodés (PCM brut au format du mixer).
+    
+    Chaque fichier du cache est nommé d'après l'empreinte du fichier source et le format
+    du mixer (fréquence, taille d'échantillon, canaux) : un son modifié ou un mixer réglé
+    autrement ne trouve pas de fichier correspondant et le MP3 est simplement redécodé.
+    """
+    def __init__(self, cache_dir):
+        """
+        Initialise le cache.
+        
+        Args:
+            cache_dir (str): Dossier des fichiers PCM (créé au premier enregistrement)
+        """
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+    
+    def get_cache_path(self, source_path, source_data, mixer_format):
+        """
+        Retourne le chemin du fichier PCM correspondant à un son et à un format de mixer.
+        
+        Args:
+            source_path (str): Chemin du fichier son d'origine
+            source_data (bytes): Contenu du fichier son d'origine
+            mixer_format (tuple): (fréquence, taille d'échantillon, canaux) du mixer
+        
+        Returns:
+            str: Chemin du fichier PCM
+        """
+        digest = hashlib.sha1(source_data).hexdigest()[:16]
+        stem = os.path.splitext(os.path.basename(source_path))[0]
+        frequency, size, channels = mixer_format
+        return os.path.join(self.cache_dir, f"{stem}.{digest}.{frequency}.{size}.{channels}.pcm")
+    
+    def read(self, source_path, mixer_format):
+        """
+        Lit le PCM en cache d'un son, ou décode le son d'origine et l'enregistre.
+        
+        Peut être appelé depuis un fil d'exécution secondaire : pygame relâche le GIL
+        pendant le décodage et seul l'objet Sound final est créé par create_sound.
+        
+        Args:
+            source_path (str): Chemin du fichier son d'origine
+            mixer_format (tuple): (fréquence, taille d'échantillon, canaux) du mixer
+        
+        Returns:
+            tuple: (mmap du PCM en cache ou None, échantillons tout juste décodés ou None)
+        
+        Raises:
+            pygame.error: Si le son est illisible
+        """
+        with open(source_path, "rb") as source_file:
+            source_data = source_file.read()
+        cache_path = self.get_cache_path(source_path, source_data, mixer_format)
+        pcm = self._map(cache_path, mixer_format)
+        if pcm is not None:
+            return pcm, None
+        
+        data = pygame.mixer.Sound(file=io.BytesIO(source_data)).get_raw()
+        self._write(cache_path, mixer_format, data)
+        return None, data
+    
+    def create_sound(self, pcm, data):
+        """
+        Crée l'objet Sound à partir des échantillons retournés par read.
+        
+        Doit être appelé sur le fil d'exécution principal.
+        
+        Args:
+            pcm (mmap): PCM en cache projeté en mémoire, ou None
+            data (bytes): Échantillons décodés, utilisés si pcm vaut None
+        
+        Returns:
+            Sound: Son prêt à jouer
+        """
+        if pcm is not None:
+            self.hits += 1
+            try:
+                with memoryview(pcm) as view:
+                    # Le mixer copie les échantillons : la projection peut être fermée ensuite
+                    return pygame.mixer.Sound(buffer=view[PCM_HEADER.size:])
+            finally:
+                pcm.close()
+        
+        self.misses += 1
+        return pygame.mixer.Sound(buffer=data)
+    
+    def load_sound(self, source_path):
+        """
+        Charge un son en passant par le cache PCM.
+        
+        Args:
+            source_path (str): Chemin du fichier son d'origine
+        
+        Returns:
+            Sound: Son prêt à jouer
+        
+        Raises:
+            pygame.error: Si le mixer n'est pas initialisé ou si le son est illisible
+        """
+        mixer_format = pygame.mixer.get_init()
+        if mixer_format is None:
+            raise pygame.error("mixer not initialized")
+        return self.create_sound(*self.read(source_path, mixer_format))
+    
+    def _map(self, cache_path, mixer_format):
+        """
+        Projette un fichier PCM en mémoire après avoir vérifié son en-tête.
+        
+        Args:
+            cache_path (str): Chemin du fichier PCM
+            mixer_format (tuple): Format attendu
+        
+        Returns:
+            mmap: Projection du fichier, ou None s'il est absent ou invalide
+        """
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, "rb") as cache_file:
+                pcm = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        
+        try:
+            magic, frequency, size, channels, data_size = PCM_HEADER.unpack_from(pcm, 0)
+            valid = (
+                magic == PCM_MAGIC
+                and (frequency, size, channels) == tuple(mixer_format)
+                and PCM_HEADER.size + data_size == len(pcm)
+            )
+        except struct.error:
+            valid = False
+        if not valid:
+            pcm.close()
+            return None
+        return pcm
+    
+    def _write(self, cache_path, mixer_format, data):
+        """
+        Enregistre le PCM décodé d'un son et supprime les versions périmées du même son.
+        
+        Args:
+            cache_path (str): Chemin du fichier PCM
+            mixer_format (tuple): Format du mixer
+            data (bytes): Échantillons décodés
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = cache_path + ".tmp"
+            with open(temp_path, "wb") as cache_file:
+                cache_file.write(PCM_HEADER.pack(PCM_MAGIC, *mixer_format, len(data)))
+                cache_file.write(data)
+            os.replace(temp_path, cache_path)
+            
+            # Supprime les anciennes versions (son modifié ou autre format de mixer)
+            prefix = os.path.basename(cache_path).rsplit(".", 5)[0] + "."
+            for filename in os.listdir(self.cache_dir):
+                path = os.path.join(self.cache_dir, filename)
+                if filename.startswith(prefix) and filename.endswith(".pcm") and path != cache_path:
+                    os.remove(path)
+        except OSError as e:
+            print(f"Avertissement: Impossible d'écrire le cache audio '{cache_path}': {e}")
@@ -2,101 +2,134 @@ import pygame
 import random
 import math
 import settings
+from renderer import blit_batch
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : sans lui, les particules sont stockées dans des listes Python
+    np = None
 
 # Pixel Animation —————————————————————————————————————————————————————————————————————————————————————
 # —————————————————————————————————————————————————————————————————————————————————————————————————————
 
-class PixelParticle:
-    """Représente une particule de pixel unique dans l'animation."""
-    def __init__(self, x, y, angle, speed, size=3, color=(255, 255, 255)):
+class ParticleSpriteCache:
+    """
+    Cache de surfaces de particules pré-remplies, indexé par (couleur, taille, palier d'opacité).
+    
+    Chaque surface n'est créée qu'une seule fois puis réutilisée. Les compteurs de
+    succès et d'échecs permettent de vérifier qu'aucune surface n'est plus allouée
+    une fois toutes les combinaisons rencontrées.
+    """
+    def __init__(self, alpha_buckets=None):
         """
-        Initialise une particule de pixel.
+        Initialise le cache.
         
         Args:
-            x (float): Position x initiale
-            y (float): Position y initiale
-            angle (float): Angle de mouvement initial
-            speed (float): Vitesse initiale
-            size (int): Taille du pixel en pixels
-            color (tuple): Tuple de couleur RGB
-        """
-        self.x = x
-        self.y = y
-        self.angle = angle
-        self.speed = speed
-        self.velocity_x = math.cos(angle) * speed
-        self.velocity_y = math.sin(angle) * speed
-        self.size = size
-        self.color = color
-        self.gravity = random.uniform(0.5, 1.5) * settings.PIXEL_GRAVITY
-        self.life = 1.0  # Vie complète
-        self.fade_speed = random.uniform(0.5, 1.5)  # Vitesse de fondu aléatoire
-        
-    def update(self, dt, screen_height):
-        """
-        Met à jour la position et les propriétés de la particule.
+            alpha_buckets (int, optional): Nombre de paliers d'opacité. Si None, utilise PIXEL_ALPHA_BUCKETS.
+        """
+        if alpha_buckets is None:
+            alpha_buckets = settings.PIXEL_ALPHA_BUCKETS
+        self.alpha_buckets = alpha_buckets
+        self.surfaces = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, color, size, alpha):
+        """
+        Retourne la surface d'une particule, en la créant si elle n'existe pas encore.
         
         Args:
-            dt (float): Delta temps en secondes
-            screen_height (int): Hauteur de l'écran pour la vérification des limites
-        
+            color (tuple): Couleur RGB
+            size (int): Taille de la particule en pixels
+            alpha (int): Opacité (1-255), ramenée au palier supérieur
+            
         Returns:
-            bool: True si la particule est toujours à l'écran, False si elle doit être supprimée
+            Surface: Surface partagée remplie avec la couleur (ne pas modifier)
         """
-        # Met à jour la position en fonction de la vitesse
-        self.x += self.velocity_x * dt
-        self.y += self.velocity_y * dt
-        
-        # Applique la gravité
-        self.velocity_y += self.gravity * dt * 60  # Mise à l'échelle par dt et cible 60fps
-        
-        # Ajoute une légère traînée/résistance à l'air
-        self.velocity_x *= 0.99
-        
-        # Met à jour la vie (fondu)
-        self.life -= self.fade_speed * dt
-        
-        # Vérifie si la particule est tombée en bas de l'écran ou s'est estompée
-        if self.y > screen_height or self.life <= 0:
-            return False
-            
-        return True
-        
-    def draw(self, surface):
+        bucket = alpha * self.alpha_buckets // 256
+        key = (color, size, bucket)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            # L'opacité du palier est sa borne supérieure : une particule neuve reste complètement opaque
+            bucket_alpha = (bucket + 1) * 256 // self.alpha_buckets - 1
+            surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            surface.fill((*color, bucket_alpha))
+            self.surfaces[key] = surface
+        else:
+            self.hits += 1
+        return surface
+    
+    def reset_stats(self):
+        """Remet à zéro les compteurs de succès et d'échecs."""
+        self.hits = 0
+        self.misses = 0
+    
+    def stats(self):
         """
-        Dessine la particule sur la surface donnée.
+        Retourne les statistiques d'utilisation du cache.
         
-        Args:
-            surface (Surface): Surface Pygame sur laquelle dessiner
+        Returns:
+            dict: Nombre de succès, d'échecs et de surfaces en cache
         """
-        # Calcule l'alpha en fonction de la vie
-        alpha = int(255 * self.life)
-        
-        # Dessine uniquement si encore visible
-        if alpha > 0:
-            # Crée une surface pour la particule avec canal alpha
-            particle_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            
-            # Obtient la couleur avec alpha
-            color_with_alpha = (*self.color, alpha)
-            
-            # Remplit avec la couleur
-            particle_surface.fill(color_with_alpha)
-            
-            # Dessine la particule
-            surface.blit(particle_surface, (self.x - self.size // 2, self.y - self.size // 2))
+        return {"hits": self.hits, "misses": self.misses, "surfaces": len(self.surfaces)}
+
+
+# Cache partagé par toutes les animations de particules (menus et jeu)
+particle_sprite_cache = ParticleSpriteCache()
 
 
 class PixelAnimation:
-    """Gère plusieurs particules de pixels pour les animations."""
-    def __init__(self, auto_spawn=True):
+    """
+    Gère plusieurs particules de pixels pour les animations.
+    
+    Les particules sont stockées dans des tableaux NumPy contigus (une case par particule) :
+    l'apparition, l'intégration de la physique et la suppression des particules mortes
+    se font en une seule opération vectorisée par groupe de particules. Sans NumPy, les
+    mêmes champs sont gardés dans des listes Python et traités particule par particule.
+    """
+    # Comportements spécifiques à chaque couleur :
+    # (couleur RGB, multiplicateur de vitesse, de taille, de vitesse de fondu, de gravité)
+    PARTICLE_PROFILES = {
+        "white": ((255, 255, 255), 1.0, 1.0, 1.0, 1.0),
+        # Particules rouges : plus rapides, plus grandes, fondu rapide
+        "red": ((255, 0, 0), 1.5, 1.5, 2.0, 1.0),
+        # Particules vertes : flottent vers le haut (gravité négative), fondu plus lent
+        "green": ((0, 255, 0), 1.0, 1.0, 0.7, -0.5),
+        # Particules orange : explosion vers l'extérieur (le nombre est géré par les paramètres ORANGE_SPLASH)
+        "orange": ((255, 165, 0), 1.3, 1.0, 1.0, 1.0)
+    }
+    
+    # Tableaux de l'état des particules : (nom, type, nombre de composantes)
+    FIELDS = (
+        ("x", "float64", 1),
+        ("y", "float64", 1),
+        ("velocity_x", "float64", 1),
+        ("velocity_y", "float64", 1),
+        ("gravity", "float64", 1),
+        ("life", "float64", 1),
+        ("fade_speed", "float64", 1),
+        ("size", "float64", 1),
+        ("color", "uint8", 3)
+    )
+    
+    def __init__(self, auto_spawn=True, capacity=256):
         """
         Initialise le système d'animation de pixels.
         
         Args:
             auto_spawn (bool): Indique s'il faut générer automatiquement des particules à intervalles aléatoires
+            capacity (int): Nombre initial de particules pouvant être stockées (s'agrandit au besoin)
         """
-        self.particles = []
+        self.count = 0  # Nombre de particules vivantes (cases 0 à count-1 des tableaux)
+        self.arrays = {}
+        for name, dtype, components in self.FIELDS:
+            if np is None:
+                self.arrays[name] = []
+                continue
+            shape = (capacity, components) if components > 1 else capacity
+            self.arrays[name] = np.zeros(shape, dtype=dtype)
+        self.rng = np.random.default_rng() if np is not None else None
         self.last_random_spawn = 0
         self.random_spawn_interval = random.uniform(
             settings.PIXEL_MIN_INTERVAL, 
@@ -105,14 +138,117 @@ class PixelAnimation:
         self.button_hover_states = {}  # Suit les états de survol des boutons
         self.auto_spawn = auto_spawn  # Indique s'il faut générer des particules automatiquement
         
-        # Crée un dictionnaire de couleurs de particules
-        self.particle_colors = {
-            "white": (255, 255, 255),
-            "red": (255, 0, 0),
-            "green": (0, 255, 0),
-            "orange": (255, 165, 0)
-        }
+    def __len__(self):
+        """Retourne le nombre de particules vivantes."""
+        return self.count
+    
+    def _uniform(self, low, high, count, factor=1.0):
+        """
+        Tire des valeurs aléatoires uniformes pour un groupe de particules.
+        
+        Args:
+            low (float): Borne inférieure
+            high (float): Borne supérieure
+            count (int): Nombre de valeurs
+            factor (float): Multiplicateur appliqué à chaque valeur
+        
+        Returns:
+            ndarray: Valeurs tirées (liste sans NumPy)
+        """
+        if np is None:
+            return [random.uniform(low, high) * factor for _ in range(count)]
+        return self.rng.uniform(low, high, count) * factor
+    
+    def _sizes(self, count, factor=1.0):
+        """
+        Tire les tailles d'un groupe de particules entre PIXEL_MIN_SIZE et PIXEL_MAX_SIZE inclus.
+        
+        Args:
+            count (int): Nombre de tailles
+            factor (float): Multiplicateur appliqué à chaque taille
+        
+        Returns:
+            ndarray: Tailles tirées (liste sans NumPy)
+        """
+        if np is None:
+            return [random.randint(settings.PIXEL_MIN_SIZE, settings.PIXEL_MAX_SIZE) * factor for _ in range(count)]
+        return self.rng.integers(settings.PIXEL_MIN_SIZE, settings.PIXEL_MAX_SIZE + 1, count) * factor
+    
+    def _emit(self, x, y, angle, speed, size, color, gravity, fade_speed):
+        """
+        Ajoute un groupe de particules aux tableaux.
+        
+        Tous les paramètres sont des tableaux de même longueur (ou des scalaires pour x, y et color).
+        
+        Args:
+            x: Position(s) x initiale(s)
+            y: Position(s) y initiale(s)
+            angle (ndarray): Angles de mouvement initiaux
+            speed (ndarray): Vitesses initiales
+            size (ndarray): Tailles des particules en pixels
+            color (tuple): Couleur RGB commune au groupe
+            gravity (ndarray): Gravité de chaque particule
+            fade_speed (ndarray): Vitesse de fondu de chaque particule
+        """
+        count = len(angle)
+        if count == 0:
+            return
+        if np is None:
+            self._emit_lists(x, y, angle, speed, size, color, gravity, fade_speed)
+            return
+        while self.count + count > len(self.arrays["x"]):
+            self._grow()
+        
+        start = self.count
+        end = start + count
+        a = self.arrays
+        a["x"][start:end] = x
+        a["y"][start:end] = y
+        a["velocity_x"][start:end] = np.cos(angle) * speed
+        a["velocity_y"][start:end] = np.sin(angle) * speed
+        a["gravity"][start:end] = gravity
+        a["life"][start:end] = 1.0  # Vie complète
+        a["fade_speed"][start:end] = fade_speed
+        a["size"][start:end] = size
+        a["color"][start:end] = color
+        self.count = end
+    
+    def _emit_lists(self, x, y, angle, speed, size, color, gravity, fade_speed):
+        """
+        Ajoute un groupe de particules aux listes (sans NumPy).
         
+        Args:
+            x: Position x commune ou liste des positions
+            y: Position y commune ou liste des positions
+            angle (list): Angles de mouvement initiaux
+            speed (list): Vitesses initiales
+            size (list): Tailles des particules en pixels
+            color (tuple): Couleur RGB commune au groupe
+            gravity (list): Gravité de chaque particule
+            fade_speed (list): Vitesse de fondu de chaque particule
+        """
+        count = len(angle)
+        a = self.arrays
+        a["x"].extend(x if isinstance(x, list) else [x] * count)
+        a["y"].extend(y if isinstance(y, list) else [y] * count)
+        a["velocity_x"].extend(math.cos(value) * rate for value, rate in zip(angle, speed))
+        a["velocity_y"].extend(math.sin(value) * rate for value, rate in zip(angle, speed))
+        a["gravity"].extend(gravity)
+        a["life"].extend([1.0] * count)  # Vie complète
+        a["fade_speed"].extend(fade_speed)
+        a["size"].extend(size)
+        a["color"].extend([color] * count)
+        self.count += count
+    
+    def _grow(self):
+        """Double la capacité des tableaux de particules."""
+        for name, dtype, components in self.FIELDS:
+            old = self.arrays[name]
+            shape = (len(old) * 2, components) if components > 1 else len(old) * 2
+            grown = np.zeros(shape, dtype=dtype)
+            grown[:self.count] = old[:self.count]
+            self.arrays[name] = grown
+    
     def spawn_particles(self, x, y, count=None, color="white"):
         """
         Génère un groupe de particules à la position donnée avec des comportements spécifiques à la couleur.
@@ -126,39 +262,19 @@ class PixelAnimation:
         if count is None:
             count = settings.PIXEL_CLICK_COUNT
             
-        # Obtient la couleur du dictionnaire ou utilise le blanc par défaut
-        particle_color = self.particle_colors.get(color, (255, 255, 255))
+        # Obtient le profil de la couleur ; une couleur inconnue donne des particules blanches sans comportement spécifique
+        particle_color, speed_factor, size_factor, fade_factor, gravity_factor = self.PARTICLE_PROFILES.get(
+            color, self.PARTICLE_PROFILES["white"]
+        )
         
-        for _ in range(count):
-            # Paramètres de base qui seront modifiés en fonction de la couleur
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 150)
-            size = random.randint(settings.PIXEL_MIN_SIZE, settings.PIXEL_MAX_SIZE)
-            gravity = random.uniform(0.5, 1.5) * settings.PIXEL_GRAVITY
-            fade_speed = random.uniform(0.5, 1.5)
-            
-            # Personnalise le comportement en fonction de la couleur
-            if color == "red":
-                # Particules rouges : plus rapides, plus grandes, fondu rapide
-                speed *= 1.5
-                size *= 1.5
-                fade_speed *= 2.0
-                
-            elif color == "green":
-                # Particules vertes : flottent vers le haut (gravité négative), fondu plus lent
-                gravity *= -0.5  # Flotte vers le haut
-                fade_speed *= 0.7  # Fondu plus lent
-                
-            elif color == "orange":
-                # Particules orange : explosion vers l'extérieur, nombre de particules plus élevé
-                speed *= 1.3
-                # Pas besoin d'ajuster le nombre ici car il est géré par les paramètres ORANGE_SPLASH
-                
-            # Crée une particule avec des comportements spécifiques à la couleur
-            particle = PixelParticle(x, y, angle, speed, size, particle_color)
-            particle.gravity = gravity
-            particle.fade_speed = fade_speed
-            self.particles.append(particle)
+        # Tire les paramètres de base de tout le groupe puis applique le profil de la couleur
+        angle = self._uniform(0, 2 * math.pi, count)
+        speed = self._uniform(50, 150, count, speed_factor)
+        size = self._sizes(count, size_factor)
+        gravity = self._uniform(0.5, 1.5, count, settings.PIXEL_GRAVITY * gravity_factor)
+        fade_speed = self._uniform(0.5, 1.5, count, fade_factor)
+        
+        self._emit(x, y, angle, speed, size, particle_color, gravity, fade_speed)
     
     def spawn_button_hover_particles(self, button):
         """
@@ -169,9 +285,12 @@ class PixelAnimation:
         """
         # Obtient le rectangle du bouton
         rect = button.rect
+        count = settings.PIXEL_BUTTON_HOVER_COUNT
+        xs = []
+        ys = []
         
-        # Génère le nombre spécifié de particules
-        for _ in range(settings.PIXEL_BUTTON_HOVER_COUNT):
+        # Choisit la position de départ de chaque particule
+        for _ in range(count):
             # Choisit un bord aléatoire du bouton (0=haut, 1=droite, 2=bas, 3=gauche)
             edge = random.randint(0, 3)
             
@@ -187,15 +306,19 @@ class PixelAnimation:
             else:  # Bord gauche
                 x = rect.left
                 y = random.randint(rect.top, rect.bottom)
-            
-            # Crée des particules avec des paramètres légèrement différents pour le survol du bouton
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 150)  # Légèrement plus lent que les particules de clic
-            size = random.randint(settings.PIXEL_MIN_SIZE, settings.PIXEL_MAX_SIZE)
-            color = (255, 255, 255)  # Blanc pour le survol du bouton
-            
-            particle = PixelParticle(x, y, angle, speed, size, color)
-            self.particles.append(particle)
+            xs.append(x)
+            ys.append(y)
+        
+        # Crée des particules blanches avec des paramètres légèrement différents pour le survol du bouton
+        angle = self._uniform(0, 2 * math.pi, count)
+        speed = self._uniform(50, 150, count)  # Légèrement plus lent que les particules de clic
+        size = self._sizes(count)
+        gravity = self._uniform(0.5, 1.5, count, settings.PIXEL_GRAVITY)
+        fade_speed = self._uniform(0.5, 1.5, count)  # Vitesse de fondu aléatoire
+        
+        if np is not None:
+            xs, ys = np.array(xs), np.array(ys)
+        self._emit(xs, ys, angle, speed, size, (255, 255, 255), gravity, fade_speed)
     
     def check_button_hover(self, buttons):
         """
@@ -249,7 +372,7 @@ class PixelAnimation:
             screen_height (int): Hauteur de l'écran
         """
         # Met à jour les particules existantes et supprime celles qui sortent de l'écran
-        self.particles = [p for p in self.particles if p.update(dt, screen_height)]
+        self._integrate(dt, screen_height)
         
         # Vérifie s'il est temps de générer des particules aléatoires
         if self.auto_spawn:
@@ -262,12 +385,143 @@ class PixelAnimation:
                     settings.PIXEL_MAX_INTERVAL
                 )
     
-    def draw(self, surface):
+    def _integrate(self, dt, screen_height):
+        """
+        Intègre la physique de toutes les particules puis retire celles qui ont disparu.
+        
+        Args:
+            dt (float): Delta temps en secondes
+            screen_height (int): Hauteur de l'écran pour la vérification des limites
+        """
+        n = self.count
+        if n == 0:
+            return
+        if np is None:
+            self._integrate_lists(dt, screen_height)
+            return
+        
+        a = self.arrays
+        x = a["x"][:n]
+        y = a["y"][:n]
+        velocity_x = a["velocity_x"][:n]
+        velocity_y = a["velocity_y"][:n]
+        life = a["life"][:n]
+        
+        # Met à jour la position en fonction de la vitesse
+        x += velocity_x * dt
+        y += velocity_y * dt
+        
+        # Applique la gravité (mise à l'échelle par dt et cible 60fps)
+        velocity_y += a["gravity"][:n] * dt * 60
+        
+        # Ajoute une légère traînée/résistance à l'air
+        velocity_x *= 0.99
+        
+        # Met à jour la vie (fondu)
+        life -= a["fade_speed"][:n] * dt
+        
+        # Conserve les particules encore à l'écran et visibles, en les compactant au début des tableaux
+        alive = (y <= screen_height) & (life > 0)
+        remaining = int(np.count_nonzero(alive))
+        if remaining < n:
+            for name, _, _ in self.FIELDS:
+                array = a[name]
+                array[:remaining] = array[:n][alive]
+            self.count = remaining
+    
+    def _integrate_lists(self, dt, screen_height):
+        """
+        Intègre la physique particule par particule (sans NumPy) puis retire celles qui ont disparu.
+        
+        Args:
+            dt (float): Delta temps en secondes
+            screen_height (int): Hauteur de l'écran pour la vérification des limites
+        """
+        a = self.arrays
+        alive = []
+        for i in range(self.count):
+            # Même intégration que la version vectorisée
+            a["x"][i] += a["velocity_x"][i] * dt
+            a["y"][i] += a["velocity_y"][i] * dt
+            a["velocity_y"][i] += a["gravity"][i] * dt * 60
+            a["velocity_x"][i] *= 0.99
+            a["life"][i] -= a["fade_speed"][i] * dt
+            if a["y"][i] <= screen_height and a["life"][i] > 0:
+                alive.append(i)
+        
+        if len(alive) < self.count:
+            for name, _, _ in self.FIELDS:
+                values = a[name]
+                values[:] = [values[i] for i in alive]
+            self.count = len(alive)
+    
+    def time_until_next_spawn(self):
+        """
+        Retourne le temps restant avant la prochaine génération aléatoire de particules.
+        
+        Returns:
+            float: Temps en secondes, ou None si la génération automatique est désactivée
+        """
+        if not self.auto_spawn:
+            return None
+        return max(0.0, self.random_spawn_interval - self.last_random_spawn)
+    
+    def _visible_particles(self):
+        """
+        Retourne les particules encore visibles.
+        
+        Returns:
+            list: Tuples (gauche, haut, taille, alpha, couleur) dans l'ordre de dessin
+        """
+        n = self.count
+        if n == 0:
+            return []
+        
+        a = self.arrays
+        if np is None:
+            return [
+                (x - size // 2, y - size // 2, int(size), int(255 * life), color)
+                for x, y, size, life, color in zip(a["x"], a["y"], a["size"], a["life"], a["color"])
+                if int(255 * life) > 0
+            ]
+        
+        sizes = a["size"][:n]
+        # Calcule l'alpha en fonction de la vie et la position du coin supérieur gauche
+        alphas = (255 * a["life"][:n]).astype(np.int64)
+        lefts = a["x"][:n] - sizes // 2
+        tops = a["y"][:n] - sizes // 2
+        return [
+            particle
+            for particle in zip(
+                lefts.tolist(), tops.tolist(), sizes.astype(np.int64).tolist(), alphas.tolist(), a["color"][:n].tolist()
+            )
+            if particle[3] > 0
+        ]
+    
+    def get_rects(self):
+        """
+        Retourne les zones occupées par les particules visibles (avec un pixel de marge pour les arrondis).
+        
+        Returns:
+            list: Rectangles des particules
+        """
+        return [
+            pygame.Rect(int(left) - 1, int(top) - 1, size + 2, size + 2)
+            for left, top, size, _, _ in self._visible_particles()
+        ]
+    
+    def draw(self, surface, dirty_rects=None):
         """
         Dessine toutes les particules sur la surface donnée.
         
         Args:
             surface (Surface): Surface Pygame sur laquelle dessiner
+            dirty_rects (list, optional): Liste complétée avec les zones modifiées
         """
-        for particle in self.particles:
-            particle.draw(surface)
\ No newline at end of file
+        # Construit la couche de particules encore visibles, avec des surfaces pré-remplies du cache,
+        # puis la dessine en un seul appel
+        get_sprite = particle_sprite_cache.get
+        blit_batch(surface, [
+            (get_sprite(tuple(color), size, alpha), (left, top))
+            for left, top, size, alpha, color in self._visible_particles()
+        ], dirty_rects)
\ No newline at end of file
@@ -0,0 +1,389 @@
+import settings
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : sans lui, le moteur vectorisé est indisponible
+    np = None
+
+# Pixel Engine ————————————————————————————————————————————————————————————————————————————————————————
+# —————————————————————————————————————————————————————————————————————————————————————————————————————
+
+class EngineField:
+    """
+    Descripteur d'attribut de pixel stocké dans les tableaux d'un PixelEngine.
+
+    Tant que le pixel n'est pas enregistré dans un moteur, la valeur est conservée
+    normalement dans l'instance. Une fois enregistré, la lecture et l'écriture passent
+    par la case du pixel dans le tableau correspondant.
+    """
+    def __init__(self, name):
+        """
+        Initialise le descripteur.
+
+        Args:
+            name (str): Nom de l'attribut (et du tableau correspondant dans le moteur)
+        """
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        engine = obj.__dict__.get("_engine")
+        if engine is None:
+            return obj.__dict__[self.name]
+        return engine.arrays[self.name].item(obj._slot)
+
+    def __set__(self, obj, value):
+        engine = obj.__dict__.get("_engine")
+        if engine is None:
+            obj.__dict__[self.name] = value
+        else:
+            engine.arrays[self.name][obj._slot] = value
+
+
+class PixelEngine:
+    """
+    Moteur de déplacement vectorisé pour les pixels du jeu.
+
+    Les positions, vitesses, minuteurs d'apparition et états de clignotement de tous les
+    pixels sont stockés dans des tableaux NumPy contigus (structure de tableaux), ce qui
+    permet de faire avancer tous les pixels vers le cœur en une seule étape vectorisée.
+    Les calculs reproduisent exactement ceux de GamePixel.update.
+
+    Le moteur tient aussi à jour la position entière du rectangle de chaque pixel et la
+    plage de cellules qu'il couvre dans l'index spatial : le jeu n'a plus à parcourir les
+    pixels en Python, il ne reçoit que ceux qui sont morts ou qui ont changé de cellules.
+    """
+    # Attributs de pixel stockés dans le moteur, avec leur type de tableau
+    FIELDS = (
+        ("x", "float64"),
+        ("y", "float64"),
+        ("speed", "float64"),
+        ("alpha", "int64"),
+        ("fade_in_duration", "float64"),
+        ("fade_in_timer", "float64"),
+        ("is_blinking", "bool"),
+        ("blink_timer", "float64"),
+        ("blink_interval", "float64"),
+        ("blink_count", "float64"),
+        ("max_blinks", "float64"),
+        ("is_visible", "bool"),
+        ("dead", "bool"),
+    )
+
+    # Tableaux internes (sans attribut correspondant sur le pixel), avec leur type de tableau
+    INTERNAL_FIELDS = (
+        ("draw_order", "int64"),
+        ("left", "int64"),
+        ("top", "int64"),
+        ("width", "int64"),
+        ("height", "int64"),
+        ("cell_left", "int64"),
+        ("cell_top", "int64"),
+        ("cell_right", "int64"),
+        ("cell_bottom", "int64"),
+    )
+
+    def __init__(self, cell_size, capacity=64):
+        """
+        Initialise le moteur avec des tableaux vides.
+
+        Args:
+            cell_size (int): Taille des cellules de l'index spatial du jeu
+            capacity (int): Nombre initial de cases (les tableaux s'agrandissent au besoin)
+        """
+        self.cell_size = cell_size
+        self.count = 0
+        self.pixels = []  # Pixel enregistré dans chaque case, dans l'ordre des tableaux
+        self.arrays = {
+            name: np.zeros(capacity, dtype=dtype) for name, dtype in self.FIELDS + self.INTERNAL_FIELDS
+        }
+
+    @staticmethod
+    def is_available():
+        """
+        Indique si le moteur vectorisé peut être utilisé.
+
+        Returns:
+            bool: True si NumPy est installé, False sinon
+        """
+        return np is not None
+
+    def add(self, pixel):
+        """
+        Enregistre un pixel dans le moteur en copiant son état dans les tableaux.
+
+        Le rectangle du pixel (déjà centré sur sa position) et son ordre de dessin doivent
+        être définis : ils servent de point de départ au suivi des cellules.
+
+        Args:
+            pixel: Pixel dont la classe utilise des EngineField pour les attributs du moteur
+        """
+        if self.count == len(self.arrays["x"]):
+            self._grow()
+
+        slot = self.count
+        for name, _ in self.FIELDS:
+            self.arrays[name][slot] = pixel.__dict__.pop(name)
+        rect = pixel.rect
+        size = self.cell_size
+        internal = {
+            "draw_order": pixel.draw_order,
+            "left": rect.left,
+            "top": rect.top,
+            "width": rect.width,
+            "height": rect.height,
+            # Même calcul que SpatialHash : la plage correspond à celle de l'insertion dans l'index
+            "cell_left": rect.left // size,
+            "cell_top": rect.top // size,
+            "cell_right": (rect.right - 1) // size,
+            "cell_bottom": (rect.bottom - 1) // size,
+        }
+        for name, value in internal.items():
+            self.arrays[name][slot] = value
+        pixel._slot = slot
+        pixel._engine = self
+
+        self.pixels.append(pixel)
+        self.count += 1
+
+    def remove(self, pixel):
+        """
+        Retire un pixel du moteur et lui rend son état sous forme d'attributs normaux.
+
+        Args:
+            pixel: Pixel précédemment enregistré avec add
+        """
+        slot = pixel._slot
+        for name, _ in self.FIELDS:
+            pixel.__dict__[name] = self.arrays[name].item(slot)
+        pixel._engine = None
+
+        # Déplace le dernier pixel dans la case libérée pour garder les tableaux contigus
+        last = self.count - 1
+        if slot != last:
+            for name, _ in self.FIELDS + self.INTERNAL_FIELDS:
+                self.arrays[name][slot] = self.arrays[name][last]
+            moved = self.pixels[last]
+            moved._slot = slot
+            self.pixels[slot] = moved
+
+        self.pixels.pop()
+        self.count -= 1
+
+    def _grow(self):
+        """Double la capacité des tableaux."""
+        for name, dtype in self.FIELDS + self.INTERNAL_FIELDS:
+            grown = np.zeros(len(self.arrays[name]) * 2, dtype=dtype)
+            grown[:self.count] = self.arrays[name][:self.count]
+            self.arrays[name] = grown
+
+    def update(self, dt, heart_x, heart_y):
+        """
+        Fait avancer tous les pixels enregistrés d'un pas de temps.
+
+        Équivalent à appeler GamePixel.update sur chaque pixel : gère le clignotement,
+        l'apparition progressive et le déplacement accéléré vers le cœur. Les pixels qui
+        terminent leur clignotement sont marqués comme morts. Les rectangles sont ensuite
+        recentrés sur les nouvelles positions.
+
+        Args:
+            dt (float): Delta temps en secondes
+            heart_x (float): Position x du cœur
+            heart_y (float): Position y du cœur
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        a = self.arrays
+        x = a["x"][:n]
+        y = a["y"][:n]
+        speed = a["speed"][:n]
+        alpha = a["alpha"][:n]
+        fade_in_duration = a["fade_in_duration"][:n]
+        fade_in_timer = a["fade_in_timer"][:n]
+        is_blinking = a["is_blinking"][:n]
+        blink_timer = a["blink_timer"][:n]
+        blink_interval = a["blink_interval"][:n]
+        blink_count = a["blink_count"][:n]
+        max_blinks = a["max_blinks"][:n]
+        is_visible = a["is_visible"][:n]
+        dead = a["dead"][:n]
+
+        active = ~dead
+
+        # Gère l'état de clignotement
+        blinking = active & is_blinking
+        blink_timer[blinking] += dt
+        toggled = blinking & (blink_timer >= blink_interval)
+        is_visible[toggled] = ~is_visible[toggled]
+        blink_timer[toggled] = 0.0
+        blink_count[toggled] += 0.5
+        blink_interval[toggled] = np.maximum(0.05, 0.5 - (0.1 * blink_count[toggled]))
+        dead |= toggled & (blink_count >= max_blinks)
+
+        # Les pixels qui clignotent ne bougent pas
+        moving = active & ~is_blinking
+
+        # Met à jour l'effet d'apparition
+        fading = moving & (fade_in_timer < fade_in_duration)
+        fade_in_timer[fading] += dt
+        alpha[fading] = (255 * np.minimum(fade_in_timer[fading] / fade_in_duration[fading], 1.0)).astype(np.int64)
+
+        # Calcule le vecteur de direction vers le cœur et le normalise
+        dx = heart_x - x[moving]
+        dy = heart_y - y[moving]
+        distance = np.sqrt(dx*dx + dy*dy)
+        nonzero = distance > 0
+        dx[nonzero] /= distance[nonzero]
+        dy[nonzero] /= distance[nonzero]
+
+        # Augmentation exponentielle de la vitesse à proximité du cœur
+        moving_speed = speed[moving]
+        progress = 1.0 - distance / settings.GAME_PIXEL_PROXIMITY_THRESHOLD
+        acceleration_factor = 1.0 + (progress * progress * settings.GAME_PIXEL_ACCELERATION)
+        current_speed = np.where(
+            distance < settings.GAME_PIXEL_PROXIMITY_THRESHOLD,
+            moving_speed * acceleration_factor,
+            moving_speed
+        )
+
+        # Déplace les pixels vers le cœur
+        x[moving] += dx * current_speed * dt
+        y[moving] += dy * current_speed * dt
+
+        # Recentre les rectangles (arrondi à l'entier le plus proche, comme Rect.center)
+        center_x = np.trunc(x + np.copysign(0.5, x)).astype(np.int64)
+        center_y = np.trunc(y + np.copysign(0.5, y)).astype(np.int64)
+        a["left"][:n] = center_x - a["width"][:n] // 2
+        a["top"][:n] = center_y - a["height"][:n] // 2
+
+    def get_dead_pixels(self):
+        """
+        Retourne les pixels marqués comme morts (clignotement terminé ou éclatés).
+
+        Returns:
+            list: Pixels à retirer du jeu
+        """
+        n = self.count
+        return [self.pixels[slot] for slot in np.flatnonzero(self.arrays["dead"][:n]).tolist()]
+
+    def get_cell_changes(self):
+        """
+        Retourne les pixels dont la plage de cellules a changé depuis l'appel précédent.
+
+        Les plages sont calculées pour tous les pixels en une seule opération ; seuls
+        les pixels qui changent de cellules sont renvoyés pour la mise à jour de l'index.
+
+        Returns:
+            list: Tuples (pixel, (colonne min, ligne min, colonne max, ligne max))
+        """
+        n = self.count
+        if n == 0:
+            return []
+
+        a = self.arrays
+        size = self.cell_size
+        left = a["left"][:n]
+        top = a["top"][:n]
+        cells = (
+            left // size,
+            top // size,
+            (left + a["width"][:n] - 1) // size,
+            (top + a["height"][:n] - 1) // size,
+        )
+        names = ("cell_left", "cell_top", "cell_right", "cell_bottom")
+        changed = np.zeros(n, dtype=bool)
+        for name, values in zip(names, cells):
+            changed |= a[name][:n] != values
+        slots = np.flatnonzero(changed)
+        if slots.size == 0:
+            return []
+
+        ranges = []
+        for name, values in zip(names, cells):
+            a[name][slots] = values[slots]
+            ranges.append(values[slots].tolist())
+        return [(self.pixels[slot], cell_range) for slot, cell_range in zip(slots.tolist(), zip(*ranges))]
+
+    def get_drawn(self):
+        """
+        Retourne les pixels visibles dans l'ordre de dessin, avec leur opacité et leur position.
+
+        Reproduit GamePixel.is_drawn et le choix d'opacité de GamePixel.image sans lire
+        les attributs pixel par pixel.
+
+        Returns:
+            list: Tuples (pixel, opacité, (gauche, haut))
+        """
+        n = self.count
+        if n == 0:
+            return []
+
+        a = self.arrays
+        is_blinking = a["is_blinking"][:n]
+        alpha = a["alpha"][:n]
+        drawn = np.flatnonzero((~is_blinking | a["is_visible"][:n]) & (alpha > 0))
+        drawn = drawn[np.argsort(a["draw_order"][drawn], kind="stable")]
+        alphas = np.where(is_blinking[drawn], 255, alpha[drawn]).tolist()
+        lefts = a["left"][drawn].tolist()
+        tops = a["top"][drawn].tolist()
+        pixels = self.pixels
+        return [(pixels[slot], alpha, (left, top)) for slot, alpha, left, top in zip(drawn.tolist(), alphas, lefts, tops)]
+
+
+def benchmark(counts=(500, 2000, 5000), frames=120):
+    """
+    Compare le coût par image du moteur vectorisé et des pixels objets (sans affichage).
+
+    Pour chaque nombre de pixels, une partie est remplie de pixels puis mise à jour et
+    dessinée pendant le nombre d'images donné, avec puis sans le moteur.
+
+    Args:
+        counts (tuple): Nombres de pixels à tester
+        frames (int): Nombre d'images mesurées par essai
+    """
+    import os
+    import random
+    import time
+    import pygame
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    import game
+
+    for count in counts:
+        for vectorized in (False, True):
+            settings.GAME_PIXEL_VECTORIZED = vectorized
+            random.seed(count)
+            session = game.Game(screen, skip_entry_flash=True, music_enabled=False, sound_effects_enabled=False)
+            for _ in range(count):
+                session.add_pixel(
+                    random.uniform(40, settings.SCREEN_WIDTH - 40), random.uniform(40, settings.SCREEN_HEIGHT - 40),
+                    0, random.randint(settings.GAME_PIXEL_MIN_SIZE, settings.GAME_PIXEL_MAX_SIZE), "white",
+                    settings.GAME_PIXEL_BASE_SPEED
+                )
+
+            update_time = draw_time = 0.0
+            for _ in range(frames):
+                start = time.perf_counter()
+                session.update(1 / settings.FPS)
+                update_time += time.perf_counter() - start
+                start = time.perf_counter()
+                session.draw()
+                draw_time += time.perf_counter() - start
+            label = "moteur vectorisé" if vectorized else "pixels objets"
+            print(
+                f"{count} pixels, {label}: mise à jour {update_time / frames * 1000:.2f} ms/image, "
+                f"dessin {draw_time / frames * 1000:.2f} ms/image"
+            )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    # Mesure manuelle : python pixel_engine.py
+    if np is None:
+        print("NumPy n'est pas installé : le moteur vectorisé est indisponible.")
+    else:
+        benchmark()
@@ -0,0 +1,237 @@
+import pygame
+
+# Renderer ————————————————————————————————————————————————————————————————————————————————————————————
+# —————————————————————————————————————————————————————————————————————————————————————————————————————
+
+def blit_batch(surface, sequence, dirty_rects=None):
+    """
+    Dessine une couche entière de sprites en un seul appel à SDL.
+    
+    Utilise Surface.fblits lorsqu'il est disponible (pygame-ce), sinon Surface.blits
+    sans construire la liste des rectangles modifiés.
+    
+    Args:
+        surface (Surface): Surface sur laquelle dessiner
+        sequence (list): Liste de tuples (image, position) dans l'ordre de dessin, sans zone source
+            (Surface.fblits n'accepte pas de troisième élément)
+        dirty_rects (list, optional): Liste complétée avec les rectangles modifiés
+    """
+    if not sequence:
+        return
+    if dirty_rects is not None:
+        dirty_rects.extend(surface.blits(sequence))
+    elif hasattr(surface, "fblits"):
+        surface.fblits(sequence)
+    else:
+        surface.blits(sequence, doreturn=False)
+
+
+class DirtyRectRenderer:
+    """
+    Rendu par rectangles modifiés pour une scène au fond majoritairement fixe.
+    
+    Le fond statique est composé une seule fois dans une surface en cache. À chaque image,
+    seules les zones occupées par les sprites de l'image précédente sont effacées à partir
+    de ce fond, puis seules ces zones et celles des nouveaux sprites sont envoyées à
+    l'écran avec pygame.display.update au lieu d'un pygame.display.flip complet.
+    """
+    def __init__(self, screen):
+        """
+        Initialise le moteur de rendu.
+        
+        Args:
+            screen (Surface): Surface d'affichage
+        """
+        self.screen = screen
+        self.background = None
+        self.background_key = None  # Identifie les couches qui composent le fond en cache
+        self.previous_rects = []  # Zones dessinées à l'image précédente
+        self.full_redraw = True
+    
+    def invalidate(self):
+        """Force le redessin et l'envoi de tout l'écran à la prochaine image."""
+        self.full_redraw = True
+    
+    def update_background(self, key, fill_color, layers):
+        """
+        Recompose le fond en cache si les couches qui le composent ont changé.
+        
+        Args:
+            key (tuple): Identifiant des couches (le fond n'est recomposé que s'il change)
+            fill_color (tuple): Couleur de remplissage sous les couches
+            layers (list): Liste de tuples (image, rect) dans l'ordre de dessin
+        """
+        if self.background is not None and key == self.background_key:
+            return
+        background = pygame.Surface(self.screen.get_size()).convert()
+        background.fill(fill_color)
+        blit_batch(background, layers)
+        self.background = background
+        self.background_key = key
+        self.full_redraw = True
+    
+    def begin_frame(self):
+        """Efface les sprites de l'image précédente en recopiant le fond (ou redessine tout le fond)."""
+        if self.full_redraw:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            # Blits avec zone source : Surface.fblits (pygame-ce) n'accepte que des paires (image, position)
+            self.screen.blits([(self.background, rect, rect) for rect in self.previous_rects], doreturn=False)
+    
+    def redraw_overlays(self, layers, rects):
+        """
+        Redessine les parties des couches fixes qui recouvrent les zones données.
+        
+        Permet de garder les couches du fond (base, cœur...) au-dessus des sprites qui
+        passent dessous, comme avec un redessin complet.
+        
+        Args:
+            layers (list): Liste de tuples (image, rect) à garder au premier plan
+            rects (list): Zones où des sprites viennent d'être dessinés
+        """
+        sequence = []
+        for image, layer_rect in layers:
+            for index in layer_rect.collidelistall(rects):
+                clip = layer_rect.clip(rects[index])
+                sequence.append((image, clip, clip.move(-layer_rect.x, -layer_rect.y)))
+        if sequence:
+            self.screen.blits(sequence, doreturn=False)  # Zones sources : pas de fblits
+    
+    def present(self, rects):
+        """
+        Envoie à l'écran les zones modifiées (celles de l'image précédente et de l'image actuelle).
+        
+        Args:
+            rects (list): Zones dessinées à cette image
+        """
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            pygame.display.update(self.previous_rects + rects)
+        self.previous_rects = rects
+
+
+class RedrawTracker:
+    """
+    Suit les zones invalidées d'une scène de menu pour ne redessiner que ce qui change.
+    
+    Chaque élément animé est signalé avec track : lorsque son état ou sa position change,
+    son ancienne et sa nouvelle zone sont invalidées. La scène est ensuite redessinée une
+    fois par zone invalidée, avec un rectangle de découpe, et seules ces zones sont envoyées
+    à l'écran. Si rien n'a changé, aucune image n'est présentée.
+    """
+    MAX_PASSES = 8  # Au-delà, les zones sont fusionnées en un seul rectangle englobant
+    
+    def __init__(self, screen, enabled=True):
+        """
+        Initialise le suivi des zones invalidées.
+        
+        Args:
+            screen (Surface): Surface d'affichage
+            enabled (bool): Si False, toute la scène est redessinée à chaque image
+        """
+        self.screen = screen
+        self.enabled = enabled
+        self.tracked = {}  # clé -> (état, rect) de l'élément à la dernière image
+        self.dirty_rects = []
+        self.full_redraw = True
+    
+    def invalidate(self, rect=None):
+        """
+        Invalide une zone de l'écran.
+        
+        Args:
+            rect (Rect, optional): Zone à redessiner (tout l'écran si None)
+        """
+        if rect is None:
+            self.full_redraw = True
+        else:
+            self.dirty_rects.append(pygame.Rect(rect))
+    
+    def track(self, key, state, rect):
+        """
+        Signale l'état actuel d'un élément et invalide ses zones s'il a changé.
+        
+        Args:
+            key: Identifiant de l'élément
+            state: Valeur décrivant son apparence (image, valeur affichée...)
+            rect (Rect): Zone occupée par l'élément, ou None s'il n'est pas dessiné
+        """
+        previous = self.tracked.get(key)
+        if previous is not None:
+            previous_state, previous_rect = previous
+            if previous_state == state and previous_rect == rect:
+                return
+            if previous_rect is not None:
+                self.dirty_rects.append(previous_rect)
+        if rect is not None:
+            rect = pygame.Rect(rect)
+            self.dirty_rects.append(rect)
+        self.tracked[key] = (state, rect)
+    
+    def track_rects(self, key, rects):
+        """
+        Invalide les zones d'un groupe d'éléments en mouvement (à l'image précédente et actuelle).
+        
+        Args:
+            key: Identifiant du groupe
+            rects (list): Zones occupées par les éléments à cette image
+        """
+        previous = self.tracked.get(key)
+        if previous is not None:
+            self.dirty_rects.extend(previous[1])
+        self.dirty_rects.extend(rects)
+        self.tracked[key] = (None, rects)
+    
+    def _merge_rects(self):
+        """
+        Fusionne les zones invalidées qui se chevauchent.
+        
+        Returns:
+            list: Zones disjointes à redessiner (au plus MAX_PASSES)
+        """
+        screen_rect = self.screen.get_rect()
+        pending = [rect.clip(screen_rect) for rect in self.dirty_rects]
+        merged = []
+        for rect in pending:
+            if not rect.width or not rect.height:
+                continue
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        if len(merged) > self.MAX_PASSES:
+            merged = [merged[0].unionall(merged[1:])]
+        return merged
+    
+    def present(self, draw_scene):
+        """
+        Redessine les zones invalidées et les envoie à l'écran.
+        
+        Args:
+            draw_scene (function): Fonction dessinant toute la scène sur la surface donnée
+            
+        Returns:
+            bool: True si une image a été présentée, False si rien n'a changé
+        """
+        if self.full_redraw or not self.enabled:
+            draw_scene(self.screen)
+            pygame.display.flip()
+            self.full_redraw = False
+            self.dirty_rects = []
+            return True
+        
+        rects = self._merge_rects()
+        self.dirty_rects = []
+        if not rects:
+            return False
+        
+        # Redessine la scène une fois par zone, limitée par un rectangle de découpe
+        for rect in rects:
+            self.screen.set_clip(rect)
+            draw_scene(self.screen)
+        self.screen.set_clip(None)
+        pygame.display.update(rects)
+        return True
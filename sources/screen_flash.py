@@ -4,6 +4,57 @@ import settings
 # Screen Flash ———————————————————————————————————————————————————————————————————————————————————————
 # ————————————————————————————————————————————————————————————————————————————————————————————————————
 
+class OverlayCompositor:
+    """
+    Calques plein écran préalloués pour les fondus et les flashs.
+    
+    Un seul calque uni est créé par couleur, puis réutilisé : l'opacité est appliquée avec
+    l'alpha de surface (set_alpha) au lieu d'allouer une surface SRCALPHA à chaque image.
+    """
+    def __init__(self):
+        """Initialise le compositeur (les calques sont créés à leur première utilisation)."""
+        self.size = (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+        self.overlays = {}  # couleur -> calque plein écran
+    
+    def get_overlay(self, color):
+        """
+        Retourne le calque plein écran d'une couleur, en le créant si nécessaire.
+        
+        Args:
+            color (tuple): Couleur RGB du calque
+            
+        Returns:
+            Surface: Calque uni sans canal alpha par pixel
+        """
+        overlay = self.overlays.get(color)
+        if overlay is None:
+            overlay = pygame.Surface(self.size)
+            if pygame.display.get_surface() is not None:
+                overlay = overlay.convert()
+            overlay.fill(color)
+            self.overlays[color] = overlay
+        return overlay
+    
+    def draw(self, surface, color, alpha):
+        """
+        Recouvre toute la surface d'une couleur avec l'opacité donnée.
+        
+        Args:
+            surface (Surface): Surface sur laquelle dessiner
+            color (tuple): Couleur RGB du calque
+            alpha (int): Opacité du calque (0-255)
+        """
+        if alpha <= 0:
+            return
+        overlay = self.get_overlay(color)
+        overlay.set_alpha(min(alpha, 255))
+        surface.blit(overlay, (0, 0))
+
+
+# Compositeur partagé par le flash d'écran et les fondus du jeu
+overlay_compositor = OverlayCompositor()
+
+
 class ScreenFlash:
     """Gère l'effet d'animation de flash d'écran pour les transitions entre les scènes."""
     
@@ -11,8 +62,6 @@ class ScreenFlash:
         """Initialise le système d'animation de flash d'écran."""
         self.active = False
         self.alpha = 0  # 0 = complètement transparent, 255 = complètement opaque
-        self.flash_surface = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
-        self.flash_surface.fill(settings.WHITE)
         self.timer = 0
         self.callback = None
     
@@ -68,6 +117,5 @@ class ScreenFlash:
         Args:
             surface (Surface): Surface sur laquelle dessiner le flash
         """
-        if self.active and self.alpha > 0:
-            self.flash_surface.set_alpha(self.alpha)
-            surface.blit(self.flash_surface, (0, 0)) 
\ No newline at end of file
+        if self.active:
+            overlay_compositor.draw(surface, settings.WHITE, self.alpha) 
\ No newline at end of file
@@ -15,6 +15,16 @@ WHITE = (255, 255, 255)
 # Répertoire des ressources (fonctionne à la fois depuis le répertoire racine et le répertoire sources)
 import os
 ASSETS_DIR = "../assets" if os.path.basename(os.getcwd()) == "sources" else "assets"
+ASSET_CACHE_BYTES = 64 * 1024 * 1024  # Mémoire maximale des images gardées en cache par le gestionnaire de ressources (octets)
+ASSET_PACK_ENABLED = True  # Lit les images pré-redimensionnées depuis un paquet binaire (reconstruit si les paramètres changent)
+ASSET_PACK_FILE = "assets.pack"  # Nom du paquet d'images dans le dossier des ressources
+TEXTURE_ATLAS_ENABLED = True  # Regroupe les sprites, curseurs et icônes du jeu dans quelques grandes surfaces
+TEXTURE_ATLAS_SIZE = 1024  # Largeur et hauteur de chaque page de l'atlas de textures
+SOUND_PCM_CACHE_ENABLED = True  # Garde sur disque les effets sonores décodés (évite de redécoder les MP3 au démarrage)
+SOUND_PCM_CACHE_DIR = "pcm_cache"  # Dossier du cache audio dans le dossier des ressources
+ASSET_LOADER_THREADS = 4  # Nombre de fils d'exécution pour décoder les ressources au démarrage
+LOADING_BAR_WIDTH = 300  # Largeur de la barre de chargement au démarrage
+LOADING_BAR_HEIGHT = 6  # Hauteur de la barre de chargement au démarrage
 
 # Dossier pour sauvegarder les meilleurs scores
 HIGHSCORE_DIR = "../highscore" if os.path.basename(os.getcwd()) == "sources" else "highscore"
@@ -110,6 +120,7 @@ HOVER_DARKNESS = 50  # 0-255, plus élevé est plus sombre
 
 # Paramètres d'animation
 FPS = 60  # Images par seconde
+MENU_DIRTY_RECT_RENDERING = True  # True pour ne redessiner que les zones modifiées des menus (et rien quand ils sont immobiles)
 
 # Paramètres d'animation des pixels
 PIXEL_MIN_SIZE = 2
@@ -121,6 +132,7 @@ PIXEL_MAX_INTERVAL = 5.0  # Intervalle maximum en secondes entre les animations
 PIXEL_CLICK_COUNT = 10
 PIXEL_BUTTON_HOVER_COUNT = 5  # Nombre de particules à générer lors du survol des boutons
 PIXEL_GRAVITY = 2.0      # Force de gravité (0 = pas de gravité, valeurs plus élevées = gravité plus forte)
+PIXEL_ALPHA_BUCKETS = 16  # Nombre de paliers d'opacité des surfaces de particules mises en cache
 
 # Paramètres d'animation de transition
 TRANSITION_GRAVITY = 8.0       # Force de gravité pour l'animation de transition (augmentée pour une chute plus rapide)
@@ -130,6 +142,10 @@ TRANSITION_MIN_SPEED = 100     # Vitesse initiale minimale pour les éléments d
 TRANSITION_MAX_SPEED = 250     # Vitesse initiale maximale pour les éléments de transition (augmentée)
 TRANSITION_ROTATION_SPEED = 3.0  # Facteur de vitesse de rotation pour les éléments de transition (augmenté)
 TRANSITION_DURATION = 3.0      # Durée maximale de l'animation de transition en secondes (délai de sécurité)
+TRANSITION_ROTATION_STEP = 2   # Pas de quantification des angles de rotation en degrés (0 = angles exacts)
+TRANSITION_ROTATION_CACHE_BYTES = 48 * 1024 * 1024  # Mémoire maximale des rotations mises en cache (octets)
+TRANSITION_MAX_ELEMENTS = 40   # Au-delà, les plus petits éléments sont regroupés en calques qui tombent ensemble
+TRANSITION_GROUP_LAYERS = 4    # Nombre de calques de regroupement des petits éléments
 
 # Paramètres d'animation du flash d'écran
 FLASH_DURATION = 1          # Durée de l'animation du flash d'écran en secondes
@@ -141,6 +157,13 @@ GAME_PIXEL_MAX_SIZE = 45  # Taille maximale des pixels du jeu
 GAME_PIXEL_BASE_SPEED = 15  # Vitesse de base des pixels
 GAME_PIXEL_ACCELERATION = 3.0  # Facteur d'accélération exponentielle (augmenté pour un effet plus dramatique)
 GAME_PIXEL_PROXIMITY_THRESHOLD = 400  # Distance à laquelle les pixels commencent à accélérer
+GAME_PIXEL_ALPHA_STEPS = 32  # Nombre de niveaux d'opacité pré-calculés pour l'apparition des pixels
+GAME_PIXEL_IMPACT_MARGIN = 0.05  # Avance (en secondes) avec laquelle un impact planifié commence à être vérifié
+GAME_PIXEL_IMPACT_SLACK = 2  # Marge (en pixels) autour du cœur pour le calcul du temps d'impact
+GAME_PIXEL_GRID_CELL_SIZE = 64  # Taille des cellules de l'index spatial utilisé pour les clics (plus grande que les pixels)
+PIXEL_PERFECT_COLLISION = False  # True pour des collisions et des clics au pixel près (masques des sprites)
+GAME_PIXEL_VECTORIZED = False  # True pour déplacer tous les pixels en une étape vectorisée (nécessite NumPy)
+GAME_DIRTY_RECT_RENDERING = True  # True pour ne redessiner et n'envoyer à l'écran que les zones modifiées
 
 # Paramètres d'apparition
 GAME_PIXEL_SPAWN_INTERVAL = 3.0  # Intervalle initial en secondes entre les apparitions
@@ -165,6 +188,24 @@ COLLECT_VOLUME = 0.5    # Volume des sons de collecte
 DEATH_VOLUME = 0.6      # Volume des sons de mort
 GAME_OVER_VOLUME = 0.7  # Volume du son de fin de jeu (légèrement plus fort que le son de mort)
 
+# Paramètres du gestionnaire audio
+AUDIO_LATENCY_PROFILE = "low_latency"  # Profil du mixer : "low_latency" (petit tampon) ou "low_cpu" (grand tampon)
+AUDIO_PROFILES = {  # Paramètres de pygame.mixer.pre_init pour chaque profil
+    "low_latency": {"frequency": 44100, "size": -16, "channels": 2, "buffer": 256},
+    "low_cpu": {"frequency": 44100, "size": -16, "channels": 2, "buffer": 2048},
+}
+AUDIO_CHANNEL_CATEGORIES = {  # Catégorie -> (canaux réservés, voix simultanées maximales)
+    "ui": (2, 2),  # Clics des menus et des boutons
+    "explosion": (6, 4),  # Éclatements et collectes de pixels
+    "life_loss": (2, 1),  # Perte d'une vie
+    "stinger": (1, 1),  # Jingles musicaux (fin de partie)
+    "music": (2, 2),  # Musiques du menu et du jeu (un canal par morceau pour le fondu enchaîné)
+}
+MUSIC_CROSSFADE_MS = 800  # Durée du fondu enchaîné entre la musique du menu et celle du jeu
+AUDIO_COALESCE_MS = 16  # Un même son relancé dans cet intervalle (environ une image) n'est joué qu'une fois
+AUDIO_MEASURE_LATENCY = False  # Affiche la durée mesurée des appels de lecture et la latence estimée d'après le profil
+AUDIO_LATENCY_REPORT_INTERVAL = 50  # Nombre de lectures entre deux rapports de latence
+
 # Paramètres du menu options
 MUSIC_LABEL_X_POSITION = SCREEN_WIDTH // 2 - 40 # Centré horizontalement
 MUSIC_LABEL_Y_POSITION = SCREEN_HEIGHT // 2 - 50  # Au-dessus du centre
@@ -0,0 +1,148 @@
+import pygame
+import settings
+from asset_manager import get_asset_manager
+from audio_manager import audio_manager
+
+# Sound Bank ——————————————————————————————————————————————————————————————————————————————————————————
+# —————————————————————————————————————————————————————————————————————————————————————————————————————
+
+# Effets sonores du jeu : nom -> (fichier, volume de base, catégorie)
+SOUND_EFFECTS = {
+    "explode": ("explode.mp3", settings.EXPLOSION_VOLUME, "effects"),
+    "death": ("death.mp3", settings.DEATH_VOLUME, "effects"),
+    "collect": ("collect.mp3", settings.COLLECT_VOLUME, "effects"),
+    "game_over": ("game-over.mp3", settings.GAME_OVER_VOLUME, "effects"),
+}
+
+
+class SoundBank:
+    """
+    Banque d'effets sonores partagée par toutes les scènes.
+    
+    Chaque effet n'est décodé qu'une seule fois ; l'activation et le volume sont réglés
+    par catégorie, en modifiant le volume des objets Sound existants au lieu de les recharger.
+    """
+    def __init__(self, effects):
+        """
+        Initialise la banque (les sons sont décodés à leur première utilisation).
+        
+        Args:
+            effects (dict): Nom -> (fichier, volume de base, catégorie)
+        """
+        self.effects = effects
+        self.sounds = {}  # nom -> Sound, ou None si le fichier est introuvable
+        self.categories = {}  # catégorie -> {"enabled": bool, "volume": float}
+        for _, _, category in effects.values():
+            self.categories.setdefault(category, {"enabled": True, "volume": 1.0})
+    
+    def get_files(self):
+        """
+        Retourne les fichiers de tous les effets sonores (pour le préchargement).
+        
+        Returns:
+            list: Noms des fichiers
+        """
+        return [filename for filename, _, _ in self.effects.values()]
+    
+    def get(self, name):
+        """
+        Retourne l'objet Sound partagé d'un effet, en le décodant au premier appel.
+        
+        Args:
+            name (str): Nom de l'effet
+        
+        Returns:
+            Sound: Son partagé, ou None s'il est introuvable ou illisible
+        """
+        if name in self.sounds:
+            return self.sounds[name]
+        
+        filename = self.effects[name][0]
+        sound = None
+        try:
+            sound = get_asset_manager().get_sound(filename)
+            sound.set_volume(self.get_volume(name))
+        except (FileNotFoundError, pygame.error) as e:
+            print(f"Erreur lors du chargement de l'effet sonore {filename}: {e}")
+        self.sounds[name] = sound
+        return sound
+    
+    def play(self, name, channel_category="ui"):
+        """
+        Joue un effet si sa catégorie est activée.
+        
+        Args:
+            name (str): Nom de l'effet
+            channel_category (str): Catégorie de canaux du gestionnaire audio
+        
+        Returns:
+            Channel: Canal utilisé, ou None si rien n'a été joué
+        """
+        category = self.effects[name][2]
+        if not self.categories[category]["enabled"]:
+            return None
+        sound = self.get(name)
+        if sound is None:
+            return None
+        return audio_manager.play(sound, channel_category)
+    
+    def get_volume(self, name):
+        """
+        Calcule le volume effectif d'un effet à partir de son volume de base et de sa catégorie.
+        
+        Args:
+            name (str): Nom de l'effet
+        
+        Returns:
+            float: Volume (0.0 à 1.0)
+        """
+        _, base_volume, category = self.effects[name]
+        state = self.categories[category]
+        if not state["enabled"]:
+            return 0.0
+        return base_volume * state["volume"]
+    
+    def is_enabled(self, category):
+        """Indique si une catégorie d'effets est activée."""
+        return self.categories[category]["enabled"]
+    
+    def set_enabled(self, category, enabled):
+        """
+        Active ou désactive une catégorie d'effets (les sons en cours sont arrêtés à la désactivation).
+        
+        Args:
+            category (str): Nom de la catégorie
+            enabled (bool): Nouvel état
+        """
+        self.categories[category]["enabled"] = enabled
+        self._apply(category, stop=not enabled)
+    
+    def set_volume(self, category, volume):
+        """
+        Règle le volume d'une catégorie, appliqué en facteur au volume de base de chaque effet.
+        
+        Args:
+            category (str): Nom de la catégorie
+            volume (float): Facteur de volume (0.0 à 1.0)
+        """
+        self.categories[category]["volume"] = volume
+        self._apply(category)
+    
+    def _apply(self, category, stop=False):
+        """
+        Applique le volume effectif aux sons déjà décodés d'une catégorie.
+        
+        Args:
+            category (str): Nom de la catégorie
+            stop (bool): Arrête aussi les sons en cours de lecture
+        """
+        for name, sound in self.sounds.items():
+            if sound is None or self.effects[name][2] != category:
+                continue
+            sound.set_volume(self.get_volume(name))
+            if stop:
+                sound.stop()
+
+
+# Banque partagée par les menus et le jeu
+sound_bank = SoundBank(SOUND_EFFECTS)
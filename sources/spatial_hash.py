@@ -0,0 +1,125 @@
+# Spatial Hash ————————————————————————————————————————————————————————————————————————————————————————
+# —————————————————————————————————————————————————————————————————————————————————————————————————————
+
+class SpatialHash:
+    """
+    Index spatial en grille uniforme pour retrouver rapidement les objets sous un point.
+    
+    Chaque objet est enregistré dans toutes les cellules que couvre son rectangle.
+    Les mises à jour sont incrémentales : un objet qui se déplace sans changer de
+    cellules ne coûte qu'une comparaison.
+    """
+    def __init__(self, cell_size):
+        """
+        Initialise une grille vide.
+        
+        Args:
+            cell_size (int): Taille d'une cellule en pixels (idéalement plus grande que les objets indexés)
+        """
+        self.cell_size = cell_size
+        self.cells = {}  # (colonne, ligne) -> ensemble des objets présents dans la cellule
+        self.item_cells = {}  # objet -> (colonne min, ligne min, colonne max, ligne max)
+    
+    def _cell_range(self, rect):
+        """
+        Calcule la plage de cellules couverte par un rectangle.
+        
+        Args:
+            rect (Rect): Rectangle de l'objet
+            
+        Returns:
+            tuple: (colonne min, ligne min, colonne max, ligne max)
+        """
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size,
+            (rect.bottom - 1) // size
+        )
+    
+    def _add_to_cells(self, item, cell_range):
+        """Ajoute un objet à toutes les cellules d'une plage."""
+        left, top, right, bottom = cell_range
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                cell = self.cells.get((column, row))
+                if cell is None:
+                    cell = self.cells[(column, row)] = set()
+                cell.add(item)
+        self.item_cells[item] = cell_range
+    
+    def _remove_from_cells(self, item, cell_range):
+        """Retire un objet de toutes les cellules d'une plage."""
+        left, top, right, bottom = cell_range
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                cell = self.cells.get((column, row))
+                if cell is not None:
+                    cell.discard(item)
+                    if not cell:
+                        del self.cells[(column, row)]
+    
+    def insert(self, item, rect):
+        """
+        Ajoute un objet à l'index.
+        
+        Args:
+            item: Objet à indexer (doit être hachable)
+            rect (Rect): Rectangle actuel de l'objet
+        """
+        self._add_to_cells(item, self._cell_range(rect))
+    
+    def update(self, item, rect):
+        """
+        Met à jour la position d'un objet déjà indexé.
+        
+        Args:
+            item: Objet indexé
+            rect (Rect): Nouveau rectangle de l'objet
+        """
+        self.move(item, self._cell_range(rect))
+    
+    def move(self, item, cell_range):
+        """
+        Déplace un objet déjà indexé vers une plage de cellules calculée par l'appelant.
+        
+        Args:
+            item: Objet indexé
+            cell_range (tuple): (colonne min, ligne min, colonne max, ligne max)
+        """
+        old_range = self.item_cells.get(item)
+        if cell_range == old_range:
+            return
+        if old_range is not None:
+            self._remove_from_cells(item, old_range)
+        self._add_to_cells(item, cell_range)
+    
+    def remove(self, item):
+        """
+        Retire un objet de l'index.
+        
+        Args:
+            item: Objet indexé
+        """
+        cell_range = self.item_cells.pop(item, None)
+        if cell_range is not None:
+            self._remove_from_cells(item, cell_range)
+    
+    def query_point(self, pos):
+        """
+        Retourne les objets dont le rectangle peut contenir le point donné.
+        
+        Args:
+            pos (tuple): Position (x, y)
+            
+        Returns:
+            set: Objets candidats (à confirmer avec un test précis)
+        """
+        key = (int(pos[0]) // self.cell_size, int(pos[1]) // self.cell_size)
+        return self.cells.get(key, ())
+    
+    def clear(self):
+        """Vide l'index."""
+        self.cells.clear()
+        self.item_cells.clear()
@@ -0,0 +1,46 @@
+import pygame
+
+# Text Cache ——————————————————————————————————————————————————————————————————————————————————————————
+# —————————————————————————————————————————————————————————————————————————————————————————————————————
+
+class CachedText:
+    """
+    Texte d'interface rendu une seule fois et conservé tant que sa valeur ne change pas.
+    
+    Le rendu d'une police est coûteux : pour un score ou un meilleur score qui change
+    rarement, la surface est réutilisée à chaque image et n'est recalculée que lorsque
+    la valeur affichée change.
+    """
+    def __init__(self, font, color, template="{}", antialias=True):
+        """
+        Initialise le texte en cache.
+        
+        Args:
+            font (Font): Police utilisée pour le rendu
+            color (tuple): Couleur du texte
+            template (str): Modèle du texte, où {} est remplacé par la valeur
+            antialias (bool): Active le lissage des caractères
+        """
+        self.font = font
+        self.color = color
+        self.template = template
+        self.antialias = antialias
+        self.value = None
+        self.surface = None
+        self.renders = 0  # Nombre de rendus effectifs de la police
+    
+    def render(self, value):
+        """
+        Retourne la surface du texte pour la valeur donnée, en ne la recalculant que si la valeur a changé.
+        
+        Args:
+            value: Valeur à afficher dans le modèle
+            
+        Returns:
+            Surface: Surface du texte (partagée, ne pas modifier)
+        """
+        if self.surface is None or value != self.value:
+            self.surface = self.font.render(self.template.format(value), self.antialias, self.color)
+            self.value = value
+            self.renders += 1
+        return self.surface
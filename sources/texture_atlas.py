@@ -0,0 +1,150 @@
+import pygame
+import settings
+
+# Texture Atlas ———————————————————————————————————————————————————————————————————————————————————————
+# —————————————————————————————————————————————————————————————————————————————————————————————————————
+
+class TextureAtlas:
+    """
+    Regroupe les petites images (sprites, curseurs, icônes) dans quelques grandes surfaces.
+    
+    Les images sont rangées par étagères : chaque page est découpée en bandes horizontales
+    dans lesquelles les images sont placées de gauche à droite. Chaque image ajoutée est
+    rendue sous forme de sous-surface de sa page, si bien que tous les sprites partagent
+    quelques surfaces converties au lieu d'une allocation chacun.
+    """
+    def __init__(self, page_size, padding=1):
+        """
+        Initialise l'atlas (les pages sont créées à leur première utilisation).
+        
+        Args:
+            page_size (int): Largeur et hauteur de chaque page
+            padding (int): Marge transparente entre les images (évite les débordements au redimensionnement)
+        """
+        self.page_size = page_size
+        self.padding = padding
+        self.pages = []  # Surfaces contenant les images
+        self.shelves = []  # Par page : liste de [y, hauteur, x libre]
+        self.next_shelf_y = []  # Par page : hauteur déjà occupée par les étagères
+        self.regions = {}  # clé -> (numéro de page, rectangle)
+        self.images = {}  # clé -> sous-surface
+    
+    def add(self, key, image):
+        """
+        Copie une image dans l'atlas et retourne la sous-surface correspondante.
+        
+        Args:
+            key (hashable): Identifiant de l'image (une clé déjà présente retourne l'image existante)
+            image (Surface): Image à ranger
+        
+        Returns:
+            Surface: Sous-surface de l'atlas, ou l'image d'origine si elle est trop grande
+        """
+        existing = self.images.get(key)
+        if existing is not None:
+            return existing
+        
+        width, height = image.get_size()
+        if width + self.padding > self.page_size or height + self.padding > self.page_size:
+            return image
+        
+        page_index, position = self._allocate(width + self.padding, height + self.padding)
+        page = self.pages[page_index]
+        rect = pygame.Rect(position, (width, height))
+        page.blit(image, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        
+        subsurface = page.subsurface(rect)
+        self.regions[key] = (page_index, rect)
+        self.images[key] = subsurface
+        return subsurface
+    
+    def get(self, key):
+        """
+        Retourne la sous-surface d'une image déjà rangée.
+        
+        Args:
+            key (hashable): Identifiant de l'image
+        
+        Returns:
+            Surface: Sous-surface, ou None si l'image n'est pas dans l'atlas
+        """
+        return self.images.get(key)
+    
+    def get_region(self, key):
+        """
+        Retourne la page et le rectangle source d'une image, pour les blits avec zone source.
+        
+        Args:
+            key (hashable): Identifiant de l'image
+        
+        Returns:
+            tuple: (page, rectangle), ou None si l'image n'est pas dans l'atlas
+        """
+        region = self.regions.get(key)
+        if region is None:
+            return None
+        page_index, rect = region
+        return self.pages[page_index], rect
+    
+    def _allocate(self, width, height):
+        """
+        Trouve une place libre pour un rectangle, en ajoutant une étagère ou une page si nécessaire.
+        
+        Args:
+            width (int): Largeur à réserver (marge comprise)
+            height (int): Hauteur à réserver (marge comprise)
+        
+        Returns:
+            tuple: (numéro de page, position (x, y))
+        """
+        for page_index, shelves in enumerate(self.shelves):
+            # Première étagère assez haute (sans gaspiller plus de la moitié de sa hauteur) et assez large
+            for shelf in shelves:
+                y, shelf_height, x = shelf
+                if height <= shelf_height <= height * 2 and x + width <= self.page_size:
+                    shelf[2] += width
+                    return page_index, (x, y)
+            
+            # Nouvelle étagère sous les précédentes
+            y = self.next_shelf_y[page_index]
+            if y + height <= self.page_size:
+                shelves.append([y, height, width])
+                self.next_shelf_y[page_index] = y + height
+                return page_index, (0, y)
+        
+        # Nouvelle page
+        self.pages.append(self._create_page())
+        self.shelves.append([[0, height, width]])
+        self.next_shelf_y.append(height)
+        return len(self.pages) - 1, (0, 0)
+    
+    def _create_page(self):
+        """Crée une page transparente, au format de l'affichage s'il existe déjà."""
+        page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        page.fill((0, 0, 0, 0))
+        return page
+
+
+def share_pixels(image):
+    """
+    Retourne une nouvelle surface qui partage les pixels d'une image de l'atlas.
+    
+    Les réglages propres à la surface (comme set_alpha) restent indépendants de l'original,
+    sans copier les pixels. Les images hors atlas sont simplement copiées.
+    
+    Args:
+        image (Surface): Image d'origine
+    
+    Returns:
+        Surface: Nouvelle surface
+    """
+    parent = image.get_parent()
+    if parent is None:
+        return image.copy()
+    return parent.subsurface(pygame.Rect(image.get_offset(), image.get_size()))
+
+
+# Atlas partagé par les sprites de pixels, les curseurs et les icônes du jeu
+texture_atlas = TextureAtlas(settings.TEXTURE_ATLAS_SIZE)
@@ -1,24 +1,151 @@
 import pygame
 import random
 import math
+import weakref
+from collections import OrderedDict
 import settings
+from renderer import blit_batch
 
 # Transitions —————————————————————————————————————————————————————————————————————————————————————————
 # —————————————————————————————————————————————————————————————————————————————————————————————————————
 
+class RotationCache:
+    """
+    Cache des images pivotées, avec des angles quantifiés, pour chaque surface source.
+    
+    Les angles sont arrondis au pas TRANSITION_ROTATION_STEP : une même rotation est
+    calculée une seule fois puis réutilisée tant qu'elle reste dans le cache. Les images
+    les moins récemment utilisées sont évincées au-delà du budget mémoire. Les tailles
+    des images pivotées sont conservées à part, ce qui permet de positionner un élément
+    sans recalculer une rotation évincée.
+    """
+    def __init__(self, step, max_bytes):
+        """
+        Initialise le cache.
+        
+        Args:
+            step (float): Pas de quantification des angles en degrés (0 = angles exacts)
+            max_bytes (int): Mémoire maximale occupée par les images pivotées
+        """
+        self.step = step
+        self.max_bytes = max_bytes
+        self.rotations = OrderedDict()  # (id de la source, angle) -> image pivotée, de la plus ancienne à la plus récente
+        self.sizes = {}  # (largeur, hauteur, angle) -> taille de l'image pivotée
+        self.sources = set()  # Identifiants des sources suivies
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def quantize(self, angle):
+        """
+        Arrondit un angle au pas de quantification, dans l'intervalle [0, 360[.
+        
+        Args:
+            angle (float): Angle en degrés
+            
+        Returns:
+            float: Angle quantifié
+        """
+        if self.step > 0:
+            angle = round(angle / self.step) * self.step
+        return angle % 360
+    
+    def get(self, source, angle):
+        """
+        Retourne l'image source pivotée de l'angle (quantifié) donné.
+        
+        Args:
+            source (Surface): Image à faire pivoter (ne doit pas être modifiée ensuite)
+            angle (float): Angle en degrés
+            
+        Returns:
+            Surface: Image pivotée (partagée, ne pas modifier)
+        """
+        angle = self.quantize(angle)
+        if angle == 0:
+            return source
+        
+        key = (id(source), angle)
+        rotated = self.rotations.get(key)
+        if rotated is not None:
+            self.rotations.move_to_end(key)
+            self.hits += 1
+            return rotated
+        
+        self.misses += 1
+        rotated = pygame.transform.rotate(source, angle)
+        self.sizes[source.get_size() + (angle,)] = rotated.get_size()
+        self._track(source)
+        self.rotations[key] = rotated
+        self.bytes += self._byte_size(rotated)
+        
+        # Évince les rotations les moins récemment utilisées au-delà du budget
+        while self.bytes > self.max_bytes and len(self.rotations) > 1:
+            _, evicted = self.rotations.popitem(last=False)
+            self.bytes -= self._byte_size(evicted)
+        return rotated
+    
+    def get_rect(self, source, angle, center):
+        """
+        Retourne le rectangle qu'occuperait l'image pivotée, centré sur la position donnée.
+        
+        Args:
+            source (Surface): Image à faire pivoter
+            angle (float): Angle en degrés
+            center (tuple): Centre du rectangle
+            
+        Returns:
+            Rect: Rectangle de l'image pivotée
+        """
+        angle = self.quantize(angle)
+        size = source.get_size() if angle == 0 else self.sizes.get(source.get_size() + (angle,))
+        if size is None:
+            size = self.get(source, angle).get_size()
+        rect = pygame.Rect((0, 0), size)
+        rect.center = center
+        return rect
+    
+    def _track(self, source):
+        """Oublie les rotations d'une source lorsqu'elle est détruite (son identifiant peut être réutilisé)."""
+        source_id = id(source)
+        if source_id not in self.sources:
+            self.sources.add(source_id)
+            weakref.finalize(source, self._forget, source_id)
+    
+    def _forget(self, source_id):
+        """
+        Retire du cache toutes les rotations d'une source détruite.
+        
+        Args:
+            source_id (int): Identifiant de la source
+        """
+        self.sources.discard(source_id)
+        for key in [key for key in self.rotations if key[0] == source_id]:
+            self.bytes -= self._byte_size(self.rotations.pop(key))
+    
+    @staticmethod
+    def _byte_size(surface):
+        """Retourne la mémoire occupée par les pixels d'une surface."""
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+# Cache partagé des rotations des éléments de transition
+rotation_cache = RotationCache(settings.TRANSITION_ROTATION_STEP, settings.TRANSITION_ROTATION_CACHE_BYTES)
+
+
 class TransitionElement:
     """Représente un élément d'interface utilisateur avec physique pendant l'animation de transition."""
-    def __init__(self, image, rect, reverse=False):
+    def __init__(self, image, rect, reverse=False, rotate=True):
         """
         Initialise un élément de transition avec des propriétés physiques.
         
         Args:
-            image (Surface): L'image de l'élément d'interface
+            image (Surface): L'image de l'élément d'interface (référencée sans copie, ne pas la modifier)
             rect (Rect): Le rectangle définissant la position et la taille de l'élément
             reverse (bool): Si True, l'élément entrera dans l'écran au lieu d'en sortir
+            rotate (bool): Si False, l'élément tombe sans tourner
         """
-        self.image = image.copy()  # Crée une copie de l'image pour éviter de modifier l'original
-        self.original_image = image.copy()  # Conserve l'original pour la rotation
+        self.original_image = image  # Image source partagée, pivotée via le cache des rotations
         self.rect = rect.copy()
         self.reverse = reverse
         
@@ -59,11 +186,16 @@ class TransitionElement:
         
         # Rotation
         self.angle = 0  # Angle de rotation actuel
-        self.rotation_speed = random.uniform(-1, 1) * settings.TRANSITION_ROTATION_SPEED
+        self.rotation_speed = random.uniform(-1, 1) * settings.TRANSITION_ROTATION_SPEED if rotate else 0
         
         # Progression de l'animation
         self.elapsed_time = 0
     
+    @property
+    def image(self):
+        """Image pivotée de l'angle actuel, issue du cache des rotations."""
+        return rotation_cache.get(self.original_image, self.angle)
+    
     def update(self, dt):
         """
         Met à jour la position et la rotation de l'élément en fonction de la physique.
@@ -112,11 +244,9 @@ class TransitionElement:
         # Met à jour la rotation
         self.angle += self.rotation_speed * dt * 60
         
-        # Fait pivoter l'image
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
-        
-        # Met à jour la position du rectangle tout en gardant le centre
-        self.rect = self.image.get_rect(center=(self.x, self.y))
+        # Met à jour la position du rectangle de l'image pivotée tout en gardant le centre
+        # (l'image elle-même n'est récupérée que pour être dessinée)
+        self.rect = rotation_cache.get_rect(self.original_image, self.angle, (self.x, self.y))
         
         return True
     
@@ -156,18 +286,65 @@ class TransitionAnimation:
         self.reverse = reverse
         self.target_scene = target_scene
         
+        # Ignore les éléments None ou les rectangles vides
+        ui_elements = [(image, rect) for image, rect in ui_elements if image is not None and rect is not None]
+        individual_elements, group_layers = self._group_small_elements(ui_elements)
+        
         # Crée les éléments de transition
-        for image, rect in ui_elements:
-            # Ignore les éléments None ou les rectangles vides
-            if image is None or rect is None:
-                continue
+        for image, rect in individual_elements:
             self.elements.append(TransitionElement(image, rect, reverse))
         
+        # Les calques de regroupement tombent sans tourner (leur rotation coûterait trop cher)
+        for image, rect in group_layers:
+            self.elements.append(TransitionElement(image, rect, reverse, rotate=False))
+        
         self.is_active = True
         self.start_time = pygame.time.get_ticks() / 1000.0
         self.all_elements_exited = False
         self.initial_element_count = len(self.elements)
         
+    def _group_small_elements(self, ui_elements):
+        """
+        Regroupe les plus petits éléments en quelques calques lorsque leur nombre dépasse le budget.
+        
+        Les plus grands éléments restent individuels. Les autres sont triés de gauche à
+        droite puis composés par paquets sur TRANSITION_GROUP_LAYERS calques, ce qui borne
+        le nombre d'éléments animés quel que soit le nombre de sprites à l'écran.
+        
+        Args:
+            ui_elements (list): Liste de tuples (image, rect)
+            
+        Returns:
+            tuple: (éléments individuels, calques de regroupement), deux listes de tuples (image, rect)
+        """
+        budget = settings.TRANSITION_MAX_ELEMENTS
+        if len(ui_elements) <= budget:
+            return ui_elements, []
+        
+        layer_count = max(1, min(settings.TRANSITION_GROUP_LAYERS, budget))
+        by_area = sorted(
+            range(len(ui_elements)),
+            key=lambda index: ui_elements[index][1].width * ui_elements[index][1].height,
+            reverse=True
+        )
+        kept = set(by_area[:budget - layer_count])
+        individual_elements = [element for index, element in enumerate(ui_elements) if index in kept]
+        small_elements = sorted(
+            (element for index, element in enumerate(ui_elements) if index not in kept),
+            key=lambda element: element[1].centerx
+        )
+        
+        # Compose chaque paquet de petits éléments sur un calque transparent à la taille de leur ensemble
+        group_layers = []
+        group_size = math.ceil(len(small_elements) / layer_count)
+        for start in range(0, len(small_elements), group_size):
+            group = small_elements[start:start + group_size]
+            bounds = group[0][1].unionall([rect for _, rect in group[1:]])
+            layer = pygame.Surface(bounds.size, pygame.SRCALPHA)
+            blit_batch(layer, [(image, rect.move(-bounds.x, -bounds.y)) for image, rect in group])
+            group_layers.append((layer, bounds))
+        return individual_elements, group_layers
+    
     def update(self, dt):
         """
         Met à jour tous les éléments de transition.
@@ -209,8 +386,12 @@ class TransitionAnimation:
             surface (Surface): Surface Pygame sur laquelle dessiner
         """
         if self.is_active:
-            for element in self.elements:
-                element.draw(surface)
+            # Dessine tous les éléments visibles en un seul appel (les éléments hors de l'écran ne sont pas pivotés)
+            screen_rect = surface.get_rect()
+            blit_batch(surface, [
+                (element.image, element.rect) for element in self.elements
+                if element.rect.colliderect(screen_rect)
+            ])
                 
     def is_finished(self):
         """